@@ -1,6 +1,9 @@
 from robot.api.deco import keyword
 from ..runtime.context import context
-from ..utils.yaml_loader import load_yaml_with_fallback
+from ..runtime.model import AppModel
+from ..utils.yaml_loader import load_yaml_with_fallback, load_yaml_section
+from ..utils.loader import collect_class_names, warm_up_classes
+from ..utils.okw_helpers import get_robot_flag
 from ..utils.logging_mixin import LoggingMixin
 
 class AppKeywords(LoggingMixin):
@@ -8,17 +11,45 @@ class AppKeywords(LoggingMixin):
     @keyword("StartApp")
     def start_app(self, name: str):
         self.log_info(f"Starte App '{name}'...")
-        model = load_yaml_with_fallback(name)
         app_name = name.rsplit("/", 1)[-1]
+        lazy = get_robot_flag("${OKW_LAZY_LOAD}")
 
-        if app_name not in model:
-            self.log_error(f"App name '{app_name}' not found in YAML root.")
-            raise KeyError(f"App name '{app_name}' not found in YAML root")
+        if lazy:
+            try:
+                app_model = load_yaml_section(name, app_name)
+            except KeyError:
+                self.log_error(f"App name '{app_name}' not found in YAML root.")
+                raise KeyError(f"App name '{app_name}' not found in YAML root")
+        else:
+            model = load_yaml_with_fallback(name)
+            if app_name not in model:
+                self.log_error(f"App name '{app_name}' not found in YAML root.")
+                raise KeyError(f"App name '{app_name}' not found in YAML root")
+            app_model = model[app_name]
 
-        app_model = model[app_name]
-        context.set_app(app_name, app_model)
+        if get_robot_flag("${OKW_PRELOAD_CLASSES}"):
+            if lazy:
+                self.log_info("Preload bei Lazy-Load uebersprungen (Fenster werden erst bei SelectWindow geladen).")
+            else:
+                self._preload_classes(app_model)
+        context.set_app(app_name, AppModel.compile(app_name, app_model, lazy=lazy))
         self.log_info(f"App '{app_name}' gestartet.")
 
+    def _preload_classes(self, app_model):
+        """Importiert alle im App-Modell referenzierten Widget-Klassen vorab."""
+        timings, errors = warm_up_classes(collect_class_names(app_model))
+        for module_name, elapsed in sorted(timings.items(), key=lambda kv: -kv[1]):
+            self.log_info(f"Preload '{module_name}': {elapsed * 1000:.1f} ms")
+        for class_name, err in errors.items():
+            self.log_warn(f"Preload fehlgeschlagen fuer '{class_name}': {err}")
+
+    @keyword("SelectApp")
+    def select_app(self, name: str):
+        app_name = name.rsplit("/", 1)[-1]
+        self.log_info(f"Wähle App '{app_name}'...")
+        context.select_app(app_name)
+        self.log_info(f"App '{app_name}' aktiviert.")
+
     @keyword("SelectWindow")
     def select_window(self, name: str):
         self.log_info(f"Wähle Fenster/Widget '{name}'...")
@@ -4,10 +4,14 @@ from ..utils.okw_helpers import should_ignore, get_robot_timeout, resolve_widget
 from okw_contract_utils import MatchMode
 
 
+def _read_attr(w, attr_name: str) -> str:
+    val = w.okw_get_attribute(attr_name)
+    return "" if val is None else str(val)
+
+
 def _get_attr(w, attr_name: str) -> str:
     try:
-        val = w.okw_get_attribute(attr_name)
-        return "" if val is None else str(val)
+        return _read_attr(w, attr_name)
     except Exception:
         return ""
 
@@ -20,7 +24,7 @@ class AttributeKeywords:
             return
         w = resolve_widget(name)
         timeout = get_robot_timeout("${OKW_TIMEOUT_VERIFY_ATTRIBUTE}", 10.0)
-        verify_with_timeout(lambda: _get_attr(w, attribute), expected, MatchMode.EXACT, timeout, f"[VerifyAttribute] '{name}'")
+        verify_with_timeout(lambda: _read_attr(w, attribute), expected, MatchMode.EXACT, timeout, f"[VerifyAttribute] '{name}'", widget=w, condition="attribute", args=(attribute,))
 
     @keyword("VerifyAttributeWCM")
     def verify_attribute_wcm(self, name, attribute, expected):
@@ -29,7 +33,7 @@ class AttributeKeywords:
             return
         w = resolve_widget(name)
         timeout = get_robot_timeout("${OKW_TIMEOUT_VERIFY_ATTRIBUTE}", 10.0)
-        verify_with_timeout(lambda: _get_attr(w, attribute), expected, MatchMode.WCM, timeout, f"[VerifyAttributeWCM] '{name}'")
+        verify_with_timeout(lambda: _read_attr(w, attribute), expected, MatchMode.WCM, timeout, f"[VerifyAttributeWCM] '{name}'", widget=w, condition="attribute", args=(attribute,))
 
     @keyword("VerifyAttributeREGX")
     def verify_attribute_regx(self, name, attribute, expected):
@@ -38,7 +42,7 @@ class AttributeKeywords:
             return
         w = resolve_widget(name)
         timeout = get_robot_timeout("${OKW_TIMEOUT_VERIFY_ATTRIBUTE}", 10.0)
-        verify_with_timeout(lambda: _get_attr(w, attribute), expected, MatchMode.REGX, timeout, f"[VerifyAttributeREGX] '{name}'")
+        verify_with_timeout(lambda: _read_attr(w, attribute), expected, MatchMode.REGX, timeout, f"[VerifyAttributeREGX] '{name}'", widget=w, condition="attribute", args=(attribute,))
 
     @keyword("MemorizeAttribute")
     def memorize_attribute(self, name, attribute, variable):
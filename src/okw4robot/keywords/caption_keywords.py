@@ -19,7 +19,7 @@ class CaptionKeywords:
             return
         w = resolve_widget(name)
         timeout = get_robot_timeout("${OKW_TIMEOUT_VERIFY_CAPTION}", 10.0)
-        verify_with_timeout(lambda: _get_caption(w), expected, MatchMode.EXACT, timeout, f"[VerifyCaption] '{name}'")
+        verify_with_timeout(w.okw_get_text, expected, MatchMode.EXACT, timeout, f"[VerifyCaption] '{name}'", widget=w, condition="text")
 
     @keyword("VerifyCaptionWCM")
     def verify_caption_wcm(self, name, expected):
@@ -28,7 +28,7 @@ class CaptionKeywords:
             return
         w = resolve_widget(name)
         timeout = get_robot_timeout("${OKW_TIMEOUT_VERIFY_CAPTION}", 10.0)
-        verify_with_timeout(lambda: _get_caption(w), expected, MatchMode.WCM, timeout, f"[VerifyCaptionWCM] '{name}'")
+        verify_with_timeout(w.okw_get_text, expected, MatchMode.WCM, timeout, f"[VerifyCaptionWCM] '{name}'", widget=w, condition="text")
 
     @keyword("VerifyCaptionREGX")
     def verify_caption_regx(self, name, expected):
@@ -37,7 +37,7 @@ class CaptionKeywords:
             return
         w = resolve_widget(name)
         timeout = get_robot_timeout("${OKW_TIMEOUT_VERIFY_CAPTION}", 10.0)
-        verify_with_timeout(lambda: _get_caption(w), expected, MatchMode.REGX, timeout, f"[VerifyCaptionREGX] '{name}'")
+        verify_with_timeout(w.okw_get_text, expected, MatchMode.REGX, timeout, f"[VerifyCaptionREGX] '{name}'", widget=w, condition="text")
 
     @keyword("MemorizeCaption")
     def memorize_caption(self, name, variable):
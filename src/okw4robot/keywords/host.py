@@ -1,3 +1,5 @@
+import time
+
 from robot.api.deco import keyword
 from ..runtime.context import context
 from ..utils.yaml_loader import load_yaml_with_fallback
@@ -10,26 +12,32 @@ class HostKeywords(LoggingMixin):
     @keyword("StartHost")
     def start_host(self, name: str):
         self.log_info(f"Starte Host '{name}'...")
+        started = time.perf_counter()
         model = load_yaml_with_fallback(name)
         adapter_cls = load_class(model[name]["__self__"]["class"])
         adapter_args = {k: v for k, v in model[name]["__self__"].items() if k != "class"}
         adapter = adapter_cls(**adapter_args)
-        context.set_adapter(adapter)
-        self.log_info(f"Host '{name}' erfolgreich gestartet.")
+        elapsed = time.perf_counter() - started
+        context.set_adapter(adapter, name=name, startup_time=elapsed)
+        self.log_info(f"Host '{name}' erfolgreich gestartet ({elapsed * 1000:.0f} ms).")
 
     @keyword("SelectHost")
     def select_host(self, name: str):
-        current = context.get_adapter().__class__.__name__
-        self.log_info(f"Prüfe, ob Host '{name}' aktiv ist...")
-        if current.lower() != name.lower():
+        self.log_info(f"Wähle Host '{name}'...")
+        try:
+            key = context.select_adapter(name)
+        except KeyError:
+            current = type(context._adapter).__name__ if context._adapter else None
             self.log_error(f"Host-Kontextfehler: '{name}' ist nicht aktiv (aktuell: '{current}')")
             raise RuntimeError(f"Host '{name}' is not active (currently: '{current}')")
-        self.log_info(f"Host '{name}' ist aktiv.")
+        saved = context.adapter_startup_time(key)
+        if saved is not None:
+            self.log_info(f"Host '{key}' ist aktiv (Neustart gespart: {saved * 1000:.0f} ms).")
+        else:
+            self.log_info(f"Host '{key}' ist aktiv.")
 
     @keyword("StopHost")
     def stop_host(self):
         self.log_info("Stoppe aktuellen Host...")
         context.stop_adapter()
         self.log_info("Host wurde gestoppt.")
-
-    
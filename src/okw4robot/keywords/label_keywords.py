@@ -19,7 +19,7 @@ class LabelKeywords:
             return
         w = resolve_widget(name)
         timeout = get_robot_timeout("${OKW_TIMEOUT_VERIFY_LABEL}", 10.0)
-        verify_with_timeout(lambda: _get_label(w), expected, MatchMode.EXACT, timeout, f"[VerifyLabel] '{name}'")
+        verify_with_timeout(w.okw_get_label, expected, MatchMode.EXACT, timeout, f"[VerifyLabel] '{name}'", widget=w, condition="label")
 
     @keyword("VerifyLabelWCM")
     def verify_label_wcm(self, name, expected):
@@ -28,7 +28,7 @@ class LabelKeywords:
             return
         w = resolve_widget(name)
         timeout = get_robot_timeout("${OKW_TIMEOUT_VERIFY_LABEL}", 10.0)
-        verify_with_timeout(lambda: _get_label(w), expected, MatchMode.WCM, timeout, f"[VerifyLabelWCM] '{name}'")
+        verify_with_timeout(w.okw_get_label, expected, MatchMode.WCM, timeout, f"[VerifyLabelWCM] '{name}'", widget=w, condition="label")
 
     @keyword("VerifyLabelREGX")
     def verify_label_regx(self, name, expected):
@@ -37,7 +37,7 @@ class LabelKeywords:
             return
         w = resolve_widget(name)
         timeout = get_robot_timeout("${OKW_TIMEOUT_VERIFY_LABEL}", 10.0)
-        verify_with_timeout(lambda: _get_label(w), expected, MatchMode.REGX, timeout, f"[VerifyLabelREGX] '{name}'")
+        verify_with_timeout(w.okw_get_label, expected, MatchMode.REGX, timeout, f"[VerifyLabelREGX] '{name}'", widget=w, condition="label")
 
     @keyword("MemorizeLabel")
     def memorize_label(self, name, variable):
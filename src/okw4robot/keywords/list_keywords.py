@@ -1,7 +1,7 @@
-import time
 from robot.api.deco import keyword
 from ..runtime.context import context
-from ..utils.okw_helpers import get_robot_timeout, get_robot_poll, resolve_widget
+from ..utils.okw_helpers import get_robot_timeout, poll_until, resolve_widget, wait_natively
+from ..widgets.okw_widget import OkwPermanentError
 
 
 class ListKeywords:
@@ -14,7 +14,8 @@ class ListKeywords:
         - ``expected_count``: Integer expected number of items.
 
         Behavior:
-        - Resolves the widget and polls ``okw_get_list_count()`` until the count equals the expected.
+        - Resolves the widget and polls ``okw_get_list_count()`` until the count equals the expected
+          (or lets the widget wait natively via ``okw_wait_until('list_count', ...)``).
         - Timing via ``${OKW_TIMEOUT_VERIFY_LIST}`` (default 2s) and ``${OKW_POLL_VERIFY}`` (default 0.1s).
 
         Supported widgets (base implementation): ListBox, RadioList, native <select> ComboBox.
@@ -25,17 +26,20 @@ class ListKeywords:
             raise ValueError(f"[VerifyListCount] Expected must be integer, got '{expected_count}'")
         w = resolve_widget(name)
         timeout = get_robot_timeout("${OKW_TIMEOUT_VERIFY_LIST}", 2.0)
-        poll = get_robot_poll()
-        end = time.monotonic() + timeout
-        while time.monotonic() < end:
+        reached = wait_natively(w, "list_count", exp, timeout)
+        if reached:
+            return
+
+        def probe():
             try:
-                got = int(w.okw_get_list_count())
+                return int(w.okw_get_list_count())
             except NotImplementedError as e:
-                raise RuntimeError(f"[VerifyListCount] Not supported by widget '{name}': {e}")
-            if got == exp:
-                return
-            time.sleep(poll)
-        got = int(w.okw_get_list_count())
+                raise OkwPermanentError(f"[VerifyListCount] Not supported by widget '{name}': {e}") from e
+
+        result = poll_until(probe, lambda got: got == exp, timeout if reached is None else 0.0, widget=w)
+        if result.ok:
+            return
+        got = result.value
         raise AssertionError(f"[VerifyListCount] Expected {exp}, got {got}")
 
     @keyword("VerifySelectedCount")
@@ -47,7 +51,8 @@ class ListKeywords:
         - ``expected_count``: Integer expected selected count.
 
         Behavior:
-        - Resolves the widget and polls ``okw_get_selected_count()`` until the count equals the expected.
+        - Resolves the widget and polls ``okw_get_selected_count()`` until the count equals the expected
+          (or lets the widget wait natively via ``okw_wait_until('selected_count', ...)``).
         - Timing via ``${OKW_TIMEOUT_VERIFY_LIST}`` (default 2s) and ``${OKW_POLL_VERIFY}`` (default 0.1s).
 
         Supported widgets (base implementation): ListBox, RadioList, ComboBox (0/1).
@@ -58,15 +63,18 @@ class ListKeywords:
             raise ValueError(f"[VerifySelectedCount] Expected must be integer, got '{expected_count}'")
         w = resolve_widget(name)
         timeout = get_robot_timeout("${OKW_TIMEOUT_VERIFY_LIST}", 2.0)
-        poll = get_robot_poll()
-        end = time.monotonic() + timeout
-        while time.monotonic() < end:
+        reached = wait_natively(w, "selected_count", exp, timeout)
+        if reached:
+            return
+
+        def probe():
             try:
-                got = int(w.okw_get_selected_count())
+                return int(w.okw_get_selected_count())
             except NotImplementedError as e:
-                raise RuntimeError(f"[VerifySelectedCount] Not supported by widget '{name}': {e}")
-            if got == exp:
-                return
-            time.sleep(poll)
-        got = int(w.okw_get_selected_count())
+                raise OkwPermanentError(f"[VerifySelectedCount] Not supported by widget '{name}': {e}") from e
+
+        result = poll_until(probe, lambda got: got == exp, timeout if reached is None else 0.0, widget=w)
+        if result.ok:
+            return
+        got = result.value
         raise AssertionError(f"[VerifySelectedCount] Expected {exp}, got {got}")
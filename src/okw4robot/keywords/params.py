@@ -1,5 +1,7 @@
 from robot.api.deco import keyword
 
+from ..utils.robot_vars import invalidate
+
 
 class ParamsKeywords:
     @keyword("SetOKWParameter")
@@ -10,6 +12,7 @@ class ParamsKeywords:
         - TimeOutVerifyValue
         - TimeOutVerifyTooltip
         - TimeOutVerifyPlaceholder
+        - PollStrategy (e.g. 'BACKOFF:initial=0.05,max=1')
 
         Value may be seconds (number) or Robot time string (e.g. '10s').
         Scope: suite variable.
@@ -33,11 +36,21 @@ class ParamsKeywords:
             "TIMEOUTVERIFYTABLE": "${OKW_TIMEOUT_VERIFY_TABLE}",
             # Poll interval for verify loops
             "POLLVERIFY": "${OKW_POLL_VERIFY}",
+            # Poll strategy: FIXED, BACKOFF, JITTER, FASTFIRST (with optional k=v params)
+            "POLLSTRATEGY": "${OKW_POLL_STRATEGY}",
+            # Import all widget classes of the app model during StartApp
+            "PRELOADCLASSES": "${OKW_PRELOAD_CLASSES}",
+            # Load only the requested app and each window on first SelectWindow
+            "LAZYLOAD": "${OKW_LAZY_LOAD}",
         }
         key = str(name or "").strip().upper()
         if key not in mapping:
             raise ValueError(f"Unsupported OKW parameter: {name}")
         var_name = mapping[key]
+        if key == "POLLSTRATEGY":
+            from ..utils.polling import parse_strategy
+            parse_strategy(value)  # reject unknown strategies right away
         from robot.libraries.BuiltIn import BuiltIn
         # Keep raw value; readers will convert appropriately
         BuiltIn().set_suite_variable(var_name, value)
+        invalidate()
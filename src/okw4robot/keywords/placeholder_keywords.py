@@ -19,7 +19,7 @@ class PlaceholderKeywords:
             return
         w = resolve_widget(name)
         timeout = get_robot_timeout("${OKW_TIMEOUT_VERIFY_PLACEHOLDER}", 10.0)
-        verify_with_timeout(lambda: _get_placeholder(w), expected, MatchMode.EXACT, timeout, f"[VerifyPlaceholder] '{name}'")
+        verify_with_timeout(w.okw_get_placeholder, expected, MatchMode.EXACT, timeout, f"[VerifyPlaceholder] '{name}'", widget=w, condition="placeholder")
 
     @keyword("VerifyPlaceholderWCM")
     def verify_placeholder_wcm(self, name, expected):
@@ -28,7 +28,7 @@ class PlaceholderKeywords:
             return
         w = resolve_widget(name)
         timeout = get_robot_timeout("${OKW_TIMEOUT_VERIFY_PLACEHOLDER}", 10.0)
-        verify_with_timeout(lambda: _get_placeholder(w), expected, MatchMode.WCM, timeout, f"[VerifyPlaceholderWCM] '{name}'")
+        verify_with_timeout(w.okw_get_placeholder, expected, MatchMode.WCM, timeout, f"[VerifyPlaceholderWCM] '{name}'", widget=w, condition="placeholder")
 
     @keyword("VerifyPlaceholderREGX")
     def verify_placeholder_regx(self, name, expected):
@@ -37,7 +37,7 @@ class PlaceholderKeywords:
             return
         w = resolve_widget(name)
         timeout = get_robot_timeout("${OKW_TIMEOUT_VERIFY_PLACEHOLDER}", 10.0)
-        verify_with_timeout(lambda: _get_placeholder(w), expected, MatchMode.REGX, timeout, f"[VerifyPlaceholderREGX] '{name}'")
+        verify_with_timeout(w.okw_get_placeholder, expected, MatchMode.REGX, timeout, f"[VerifyPlaceholderREGX] '{name}'", widget=w, condition="placeholder")
 
     @keyword("MemorizePlaceholder")
     def memorize_placeholder(self, name, variable):
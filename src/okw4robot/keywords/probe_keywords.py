@@ -0,0 +1,106 @@
+from robot.api.deco import keyword
+from ..utils.okw_helpers import resolve_widget, poll_until, is_permanent_error
+
+
+def _to_seconds(timeout) -> float:
+    if isinstance(timeout, (int, float)):
+        return float(timeout)
+    from robot.utils import timestr_to_secs
+    return float(timestr_to_secs(str(timeout)))
+
+
+def _probe(name, read, accept, timeout, default):
+    """Read a widget state once (or until *accept* holds within *timeout*) without asserting.
+
+    Transient read errors yield *default*; permanent ones (see ``is_permanent_error``)
+    are raised, as they would never resolve.
+    """
+    w = resolve_widget(name)
+
+    def probe():
+        try:
+            return read(w)
+        except Exception as e:
+            if is_permanent_error(e, w):
+                raise
+            return default
+
+    return poll_until(probe, accept, _to_seconds(timeout), widget=w).value
+
+
+class ProbeKeywords:
+    """Zero-wait state queries for conditional logic.
+
+    Unlike the ``Verify*`` keywords these never fail on a mismatch and do not
+    wait for ``${OKW_TIMEOUT_VERIFY_*}``: they read the state once, or poll
+    for an explicitly given (short) ``timeout``, and return it.
+    """
+    @keyword("IsExisting")
+    def is_existing(self, name, timeout=0):
+        """Returns whether a widget exists, without failing.
+
+        Arguments:
+        - ``name``: Logical widget name from the current window (YAML model).
+        - ``timeout``: Optional time to wait for the widget to appear (seconds or
+          Robot time string, e.g. ``500ms``). Default ``0``: single read.
+
+        Behavior:
+        - Reads ``okw_exists()`` once; with ``timeout`` polls (``${OKW_POLL_VERIFY}``)
+          until it is true or the timeout elapses.
+        - Returns ``True``/``False``. Read errors count as ``False``; only permanent
+          errors (e.g. not supported by the driver) are raised.
+
+        Examples:
+        | ${cookie}= | IsExisting | CookieBanner |
+        | IF | ${cookie} |
+        |    | ClickOn | CookieBanner_Accept |
+        | END |
+        | ${dialog}= | IsExisting | ErrorDialog | timeout=500ms |
+        """
+        return bool(_probe(name, lambda w: w.okw_exists(), bool, timeout, False))
+
+    @keyword("IsVisible")
+    def is_visible(self, name, timeout=0):
+        """Returns whether a widget is visible, without failing.
+
+        Same arguments and behavior as ``IsExisting``, based on ``okw_is_visible()``.
+
+        Examples:
+        | ${shown}= | IsVisible | Spinner |
+        """
+        return bool(_probe(name, lambda w: w.okw_is_visible(), bool, timeout, False))
+
+    @keyword("IsEnabled")
+    def is_enabled(self, name, timeout=0):
+        """Returns whether a widget is enabled, without failing.
+
+        Same arguments and behavior as ``IsExisting``, based on ``okw_is_enabled()``.
+
+        Examples:
+        | ${can_save}= | IsEnabled | Save | timeout=1s |
+        """
+        return bool(_probe(name, lambda w: w.okw_is_enabled(), bool, timeout, False))
+
+    @keyword("GetValue")
+    def get_value(self, name, timeout=0):
+        """Returns the current value of a widget, without failing.
+
+        Arguments:
+        - ``name``: Logical widget name from the current window (YAML model).
+        - ``timeout``: Optional time to wait for a non-empty value (seconds or
+          Robot time string). Default ``0``: single read.
+
+        Behavior:
+        - Reads ``okw_get_value()`` once; with ``timeout`` polls until the value is
+          non-empty or the timeout elapses.
+        - Returns the value as string, ``""`` if it could not be read. Only permanent
+          errors are raised.
+
+        Examples:
+        | ${status}= | GetValue | StatusText |
+        | IF | $status == 'Saved' |
+        |    | ClickOn | Close |
+        | END |
+        """
+        value = _probe(name, lambda w: w.okw_get_value(), bool, timeout, "")
+        return "" if value is None else str(value)
@@ -1,64 +1,363 @@
 from robot.api.deco import keyword
 from ..runtime.context import context
-from ..utils.loader import load_class
+from ..utils import robot_vars
+from ..utils.okw_helpers import get_robot_timeout, poll_until, resolve_widget
+from ..utils.matchers import compile_wcm_cell_matcher
+from ..widgets.okw_widget import OkwWidget
 from ..utils.table_tokens import (
     parse_row_pattern,
     parse_column_pattern,
-    compile_wcm_to_regex,
     is_empty_cell_token,
 )
 
-def _get_time(var_name: str, default_seconds: float) -> float:
-    try:
-        from robot.libraries.BuiltIn import BuiltIn
-        to = BuiltIn().get_variable_value(var_name, default=default_seconds)
-        return float(to) if isinstance(to, (int, float)) else BuiltIn().convert_time(str(to))
-    except Exception:
-        return float(default_seconds)
 
-def _get_poll() -> float:
+def _table_timeout() -> float:
+    return get_robot_timeout("${OKW_TIMEOUT_VERIFY_TABLE}", 2.0)
+
+
+def _match_wcm(actual: str, expected: str) -> bool:
+    if expected is None:
+        return actual == ""
+    # Wildcard pattern compiled once (LRU) with literal/prefix/suffix fast paths
+    return compile_wcm_cell_matcher(expected)(actual)
+
+
+def _match_all_wcm(actual_cells, expected_cells) -> bool:
+    """True if both lists have the same length and every cell matches its pattern."""
+    if len(actual_cells) != len(expected_cells):
+        return False
+    return all(compile_wcm_cell_matcher(e)(a) for a, e in zip(actual_cells, expected_cells))
+
+
+def _match_all_regx(actual_cells, rx_list) -> bool:
+    """True if both lists have the same length and every cell matches its regex.
+
+    ``None`` entries require an empty cell.
+    """
+    if len(actual_cells) != len(rx_list):
+        return False
+    for a, rx in zip(actual_cells, rx_list):
+        if rx is None:
+            if a != "":
+                return False
+        elif not rx.search(a or ""):
+            return False
+    return True
+
+
+def _table_snapshot(tbl):
+    """``(headers, rows)`` from ``get_table_snapshot()`` in one call, or None if unsupported."""
+    snapshot = getattr(tbl, "get_table_snapshot", None)
+    if snapshot is None:
+        return None
     try:
-        from robot.libraries.BuiltIn import BuiltIn
-        po = BuiltIn().get_variable_value("${OKW_POLL_VERIFY}", default=0.1)
-        return float(po) if isinstance(po, (int, float)) else BuiltIn().convert_time(str(po))
-    except Exception:
-        return 0.1
+        headers, rows = snapshot()
+    except NotImplementedError:
+        return None
+    return list(headers), [list(r) for r in rows]
 
-def _get_time(var_name: str, default_seconds: float) -> float:
+
+def _page_size() -> int:
+    """Rows per page for ``iter_rows()`` from ``${OKW_TABLE_PAGE_SIZE}`` (default 100)."""
     try:
-        from robot.libraries.BuiltIn import BuiltIn
-        to = BuiltIn().get_variable_value(var_name, default=default_seconds)
-        return float(to) if isinstance(to, (int, float)) else BuiltIn().convert_time(str(to))
-    except Exception:
-        return float(default_seconds)
+        return max(1, int(robot_vars.get_variable("${OKW_TABLE_PAGE_SIZE}", 100)))
+    except (TypeError, ValueError):
+        return 100
+
 
-def _get_poll() -> float:
+def _overrides(tbl, method: str) -> bool:
+    """True if the class of *tbl* implements *method* itself (not the ``OkwWidget`` default)."""
+    impl = getattr(type(tbl), method, None)
+    return impl is not None and impl is not getattr(OkwWidget, method, None)
+
+
+def _iter_rows(tbl, start: int = 1):
+    """Data rows from *start* on as a lazy iterator (``iter_rows()`` or one call per row)."""
+    fn = getattr(tbl, "iter_rows", None)
+    if fn is not None:
+        return fn(start, _page_size())
+    return (tbl.get_row_texts(r) for r in range(start, int(tbl.get_row_count()) + 1))
+
+
+def _optional(tbl, method: str):
+    """Result of the optional widget method *method*, or None if unsupported."""
+    fn = getattr(tbl, method, None)
+    if fn is None:
+        return None
     try:
-        from robot.libraries.BuiltIn import BuiltIn
-        po = BuiltIn().get_variable_value("${OKW_POLL_VERIFY}", default=0.1)
-        return float(po) if isinstance(po, (int, float)) else BuiltIn().convert_time(str(po))
-    except Exception:
-        return 0.1
+        return fn()
+    except NotImplementedError:
+        return None
 
 
-def _resolve_table(name):
-    model = context.get_current_window_model()
-    if name not in model:
-        raise KeyError(f"Table '{name}' not found in current window.")
-    entry = model[name]
-    widget_class = load_class(entry["class"])
-    adapter = context.get_adapter()
-    extras = {k: v for k, v in entry.items() if k not in ("class", "locator")}
-    return widget_class(adapter, entry.get("locator"), **extras)
+_UNSET = object()
 
 
-def _match_wcm(actual: str, expected: str) -> bool:
-    import re
-    if expected is None:
-        return actual == ""
-    # Support wildcard matching by compiling expected to regex
-    rx = re.compile(compile_wcm_to_regex(expected), re.DOTALL)
-    return bool(rx.match(actual or ""))
+class _TableReader:
+    """Reads the data rows once per poll, re-fetching only what changed.
+
+    Per poll the rows come from, in this order:
+    - ``get_table_version()``: if the token equals the one of the last poll,
+      nothing is read and ``check()`` returns the previous result.
+    - ``get_row_fingerprints()``: rows whose fingerprint is unchanged are taken
+      from the previous poll; only the others are read with ``get_row_texts()``.
+    - ``get_table_snapshot()``, unless the widget implements ``iter_rows()``
+      itself (paged drivers win over one huge snapshot).
+    - ``iter_rows()``: a lazy iterator; the comparison stops reading at its
+      first decision, so at most one page is held in memory.
+    Unsupported optional methods are probed only once per keyword.
+    """
+
+    __slots__ = ("tbl", "token", "prints", "rows", "last", "streamed",
+                 "has_version", "has_prints", "has_snapshot")
+
+    def __init__(self, tbl):
+        self.tbl = tbl
+        self.token = None
+        self.prints = None
+        self.rows = None
+        self.last = _UNSET
+        self.streamed = False
+        self.has_version = True
+        self.has_prints = True
+        self.has_snapshot = not _overrides(tbl, "iter_rows")
+
+    def _all_rows(self):
+        if self.has_snapshot:
+            snap = _table_snapshot(self.tbl)
+            self.has_snapshot = snap is not None
+            if snap is not None:
+                return snap[1]
+        return _iter_rows(self.tbl)
+
+    def read(self):
+        """``(token, rows)`` of the current poll; ``rows`` is a list or a lazy
+        iterator, or None if the table is unchanged.
+
+        The token is not stored here: a lazy iterator is only read by
+        ``check()``, and a failure there must not mark this version as seen.
+        """
+        token = _optional(self.tbl, "get_table_version") if self.has_version else None
+        self.has_version = token is not None
+        if token is not None and token == self.token and self.last is not _UNSET:
+            return token, None
+        prints = _optional(self.tbl, "get_row_fingerprints") if self.has_prints else None
+        self.has_prints = prints is not None
+        if prints is not None:
+            prints = list(prints)
+            if self.prints is not None:
+                old_rows, old_prints = self.rows, self.prints
+                rows = [
+                    old_rows[i] if i < len(old_prints) and old_prints[i] == fp else self.tbl.get_row_texts(i + 1)
+                    for i, fp in enumerate(prints)
+                ]
+            else:
+                rows = list(self._all_rows())
+            self.prints, self.rows = prints, rows
+        else:
+            rows = self._all_rows()
+        self.streamed = not isinstance(rows, list)
+        return token, rows
+
+    def check(self, compare):
+        """``compare(rows)`` for the current poll; an unchanged table repeats the last result.
+
+        The token is remembered only after ``compare`` finished, so a read
+        error inside a stream makes the next poll read the table again.
+        """
+        token, rows = self.read()
+        if rows is not None:
+            self.last = compare(rows)
+            self.token = token
+        return self.last
+
+
+def _content_mismatch(rows, exp_rows):
+    """First difference between *rows* and the expected pattern matrix, or None.
+
+    *rows* may be a list or a lazy iterator; reading stops at the first
+    difference. Returns ``("count", n)`` (``n`` None: more rows than
+    expected), ``("length", row, expected, got)`` or ``("cell", row, col, expected, got)``.
+    """
+    if isinstance(rows, list) and len(rows) != len(exp_rows):
+        return ("count", len(rows))
+    n = 0
+    for n, act in enumerate(rows, start=1):
+        if n > len(exp_rows):
+            return ("count", None)
+        exp = exp_rows[n - 1]
+        if len(act) != len(exp):
+            return ("length", n, len(exp), len(act))
+        for j, (a, e) in enumerate(zip(act, exp), start=1):
+            if not _match_wcm(a, e):
+                return ("cell", n, j, e, a)
+    if n != len(exp_rows):
+        return ("count", n)
+    return None
+
+
+def _cell(cells, col: int) -> str:
+    """Cell *col* (1-based) of a row list; "" if the row is shorter."""
+    return cells[col - 1] if 1 <= col <= len(cells) else ""
+
+
+def _find_keyed_row_in(data, key_col: int, pattern: str):
+    """``(rows, cells)`` for *pattern* in *key_col* of the row lists *data* (a snapshot)."""
+    rows = [r for r, cells in enumerate(data, start=1) if _match_wcm(_cell(cells, key_col), pattern)]
+    return rows, (data[rows[0] - 1] if len(rows) == 1 else None)
+
+
+def _find_keyed_row(tbl, key_col: int, pattern: str):
+    """Rows matching *pattern* in *key_col* plus the cells of the unique match.
+
+    Returns ``(rows, cells)``; ``cells`` is the full row if exactly one row
+    matched, else None. A widget with native ``get_columns()`` uses the
+    row-key index of the table (key column plus one row); otherwise the table
+    snapshot is used if the widget offers one, and the index as fallback.
+    """
+    if not _overrides(tbl, "get_columns"):
+        snap = _table_snapshot(tbl)
+        if snap is not None:
+            return _find_keyed_row_in(snap[1], key_col, pattern)
+    return _table_index(tbl).find_row(tbl, key_col, pattern)
+
+
+def _find_keyed_cell(tbl, key_col: int, pattern: str, col: int):
+    """Like ``_find_keyed_row`` but returns only the cell in *col*.
+
+    A widget with native ``get_cells()`` or ``get_columns()`` reads only the
+    key and target cells (or columns) through the index, even if it also
+    offers a snapshot; the snapshot is the fallback for widgets without
+    projection.
+    """
+    if not (_overrides(tbl, "get_cells") or _overrides(tbl, "get_columns")):
+        snap = _table_snapshot(tbl)
+        if snap is not None:
+            rows, cells = _find_keyed_row_in(snap[1], key_col, pattern)
+            return rows, (_cell(cells, col) if cells is not None else None)
+    rows, cells = _table_index(tbl).find_row(tbl, key_col, pattern, cols=(col,))
+    return rows, (cells[0] if cells is not None else None)
+
+
+def _is_literal(pattern: str) -> bool:
+    return "*" not in pattern and "?" not in pattern
+
+
+class _TableIndex:
+    """Header and row-key lookup for one table widget.
+
+    Kept in the ``Context`` per widget instance. Write keywords (``ClickOn``,
+    ``SetValue``, ...) and context changes drop it. Headers and row keys are
+    only trusted while ``get_table_version()`` and ``get_row_count()`` are
+    unchanged; a change drops both together. Widgets without a version token
+    get no reuse: headers are re-read per keyword and the key column (one
+    ``get_columns()`` call) per poll, so in-place edits are always seen.
+    """
+
+    __slots__ = ("headers", "columns", "row_count", "version", "has_version", "keys")
+
+    def __init__(self):
+        self.headers = None
+        self.columns = None
+        self.row_count = None
+        self.version = None
+        self.has_version = True
+        # key column -> (cell texts, cell text -> [rows])
+        self.keys = {}
+
+    def _sync(self, tbl):
+        """Drop headers and row keys unless the version token and row count are unchanged."""
+        version = _optional(tbl, "get_table_version") if self.has_version else None
+        self.has_version = version is not None
+        rc = int(tbl.get_row_count()) if version is not None else None
+        if version is None or version != self.version or rc != self.row_count:
+            self.headers = self.columns = None
+            self.keys.clear()
+        self.version, self.row_count = version, rc
+
+    def column(self, tbl, header: str):
+        """1-based index of the first column named *header*, or None.
+
+        Unknown names re-read the headers once (columns may have been added).
+        """
+        self._sync(tbl)
+        fresh = self.columns is None
+        if fresh:
+            self._build_columns(tbl)
+        idx = self.columns.get(str(header))
+        if idx is None and not fresh:
+            self._build_columns(tbl)
+            idx = self.columns.get(str(header))
+        return idx
+
+    def _build_columns(self, tbl):
+        self.headers = _get_header_names(tbl)
+        self.columns = {}
+        for i, h in enumerate(self.headers, start=1):
+            self.columns.setdefault(h, i)
+
+    def _build_keys(self, tbl, key_col: int, cols=()) -> dict:
+        """Read the key column (plus *cols*) in one ``get_columns()`` call.
+
+        Returns the extra columns as ``{col: texts}``.
+        """
+        fetched = tbl.get_columns([key_col, *cols])
+        texts = list(fetched[0])
+        by_text = {}
+        for r, text in enumerate(texts, start=1):
+            by_text.setdefault(text, []).append(r)
+        self.keys[key_col] = (texts, by_text)
+        return {c: list(f) for c, f in zip(cols, fetched[1:])}
+
+    def _lookup(self, key_col: int, pattern: str) -> list:
+        texts, by_text = self.keys[key_col]
+        pattern = "" if pattern is None else str(pattern)
+        if _is_literal(pattern):
+            # Same semantics as the literal cell matcher: one trailing newline is accepted
+            return sorted(by_text.get(pattern, []) + by_text.get(pattern + "\n", []))
+        matches = compile_wcm_cell_matcher(pattern)
+        return [r for r, text in enumerate(texts, start=1) if matches(text)]
+
+    def _read(self, tbl, row: int, key_col: int, cols, extra):
+        """``(key cell, cells)`` of *row*: whole row, or only *cols* (``None`` = whole row)."""
+        if cols is None:
+            cells = tbl.get_row_texts(row)
+            return _cell(cells, key_col), cells
+        if extra:
+            return _cell(self.keys[key_col][0], row), [_cell(extra[c], row) for c in cols]
+        key, *cells = tbl.get_cells([(row, key_col)] + [(row, c) for c in cols])
+        return key, cells
+
+    def find_row(self, tbl, key_col: int, pattern: str, cols=None):
+        """``(rows, cells)`` for *pattern* in *key_col*; see ``_find_keyed_row``.
+
+        *cols* (1-based) restricts ``cells`` to these columns: the key cell and
+        the requested cells are then read with one ``get_cells()`` call, and an
+        index rebuild fetches them together with the key column.
+        With a version token a cached index costs ``get_table_version()``,
+        ``get_row_count()`` and one read for a unique match; it is rebuilt if
+        the cached keys gave no unique row or a row whose key no longer
+        matches. Without a token the key column is read on every call.
+        """
+        self._sync(tbl)
+        extra = None
+        if key_col not in self.keys:
+            extra = self._build_keys(tbl, key_col, cols or ())
+        while True:
+            rows = self._lookup(key_col, pattern)
+            if len(rows) != 1:
+                cells = None
+            else:
+                key, cells = self._read(tbl, rows[0], key_col, cols, extra)
+            fresh = extra is not None
+            if fresh or (cells is not None and _match_wcm(key, pattern)):
+                return rows, cells
+            extra = self._build_keys(tbl, key_col, cols or ())
+
+
+def _table_index(tbl) -> _TableIndex:
+    """Header/row-key index of *tbl* from the context (built on first use)."""
+    return context.get_table_index(tbl, _TableIndex)
 
 
 def _get_header_names(tbl):
@@ -117,21 +416,17 @@ class TableKeywords:
         | VerifyTableRowContent | Items | 2 | Name$TABPrice$TAB$EMPTY |
         | VerifyTableRowContent | Items | 3 | Foo*$TAB?9.99$TABOK |
         """
-        import time
-        tbl = _resolve_table(name)
+        tbl = resolve_widget(name)
         exp_cells = parse_row_pattern(expected_row_pattern)
-        timeout = _get_time("${OKW_TIMEOUT_VERIFY_TABLE}", 2.0)
-        poll = _get_poll()
-        end = time.time() + timeout
-        last = None
-        while time.time() < end:
-            act_cells = tbl.get_row_texts(int(row))
-            if len(act_cells) == len(exp_cells) and all(_match_wcm(a, e) for a, e in zip(act_cells, exp_cells)):
-                return
-            last = act_cells
-            time.sleep(poll)
-        if last is None:
-            last = tbl.get_row_texts(int(row))
+        result = poll_until(
+            lambda: tbl.get_row_texts(int(row)),
+            lambda act: _match_all_wcm(act, exp_cells),
+            _table_timeout(),
+            widget=tbl,
+        )
+        if result.ok:
+            return
+        last = result.value
         if len(last) != len(exp_cells):
             raise AssertionError(f"[VerifyTableRowContent] Row length mismatch: expected {len(exp_cells)}, got {len(last)}")
         for i, (a, e) in enumerate(zip(last, exp_cells), start=1):
@@ -162,21 +457,17 @@ class TableKeywords:
         | VerifyTableColumnContent | Items | 2 | Price$LF9.99$LF$EMPTY |
         | VerifyTableColumnContent | Items | 3 | $EMPTYCOL |
         """
-        import time
-        tbl = _resolve_table(name)
+        tbl = resolve_widget(name)
         exp_rows = parse_column_pattern(expected_column_pattern)
-        timeout = _get_time("${OKW_TIMEOUT_VERIFY_TABLE}", 2.0)
-        poll = _get_poll()
-        end = time.time() + timeout
-        last = None
-        while time.time() < end:
-            act_rows = tbl.get_column_texts(int(col))
-            if len(exp_rows) == len(act_rows) and all(_match_wcm(a, e) for a, e in zip(act_rows, exp_rows)):
-                return
-            last = act_rows
-            time.sleep(poll)
-        if last is None:
-            last = tbl.get_column_texts(int(col))
+        result = poll_until(
+            lambda: tbl.get_column_texts(int(col)),
+            lambda act: _match_all_wcm(act, exp_rows),
+            _table_timeout(),
+            widget=tbl,
+        )
+        if result.ok:
+            return
+        last = result.value
         if len(exp_rows) != len(last):
             raise AssertionError(f"[VerifyTableColumnContent] Column length mismatch: expected {len(exp_rows)}, got {len(last)}")
         for i, (a, e) in enumerate(zip(last, exp_rows), start=1):
@@ -205,23 +496,18 @@ class TableKeywords:
         | VerifyTableCellValue | Items | 2 | 3 | $EMPTY |
         | VerifyTableCellValue | Items | 1 | 2 | *9.9? |
         """
-        import time
-        tbl = _resolve_table(name)
+        tbl = resolve_widget(name)
         if is_empty_cell_token(expected):
             expected = ""
-        timeout = _get_time("${OKW_TIMEOUT_VERIFY_TABLE}", 2.0)
-        poll = _get_poll()
-        end = time.time() + timeout
-        last = None
-        while time.time() < end:
-            a = tbl.get_cell_text(int(row), int(col))
-            if _match_wcm(a, expected):
-                return
-            last = a
-            time.sleep(poll)
-        if last is None:
-            last = tbl.get_cell_text(int(row), int(col))
-        raise AssertionError(f"[VerifyTableCellValue] Expected '{expected}', got '{last}' at r{row}c{col}")
+        result = poll_until(
+            lambda: tbl.get_cell_text(int(row), int(col)),
+            lambda a: _match_wcm(a, expected),
+            _table_timeout(),
+            widget=tbl,
+        )
+        if result.ok:
+            return
+        raise AssertionError(f"[VerifyTableCellValue] Expected '{expected}', got '{result.value}' at r{row}c{col}")
 
     @keyword("VerifyTableRowCount")
     def verify_table_row_count(self, name: str, expected_count):
@@ -237,22 +523,15 @@ class TableKeywords:
         Examples:
         | VerifyTableRowCount | Items | 5 |
         """
-        import time
-        tbl = _resolve_table(name)
+        tbl = resolve_widget(name)
         try:
             exp = int(str(expected_count).strip())
         except Exception:
             raise ValueError(f"[VerifyTableRowCount] Expected must be integer, got '{expected_count}'")
-        timeout = _get_time("${OKW_TIMEOUT_VERIFY_TABLE}", 2.0)
-        poll = _get_poll()
-        end = time.time() + timeout
-        while time.time() < end:
-            got = int(tbl.get_row_count())
-            if got == exp:
-                return
-            time.sleep(poll)
-        got = int(tbl.get_row_count())
-        raise AssertionError(f"[VerifyTableRowCount] Expected {exp} rows, got {got}")
+        result = poll_until(lambda: int(tbl.get_row_count()), lambda got: got == exp, _table_timeout(), widget=tbl)
+        if result.ok:
+            return
+        raise AssertionError(f"[VerifyTableRowCount] Expected {exp} rows, got {result.value}")
 
     @keyword("VerifyTableColumnCount")
     def verify_table_column_count(self, name: str, expected_count):
@@ -268,22 +547,15 @@ class TableKeywords:
         Examples:
         | VerifyTableColumnCount | Items | 3 |
         """
-        import time
-        tbl = _resolve_table(name)
+        tbl = resolve_widget(name)
         try:
             exp = int(str(expected_count).strip())
         except Exception:
             raise ValueError(f"[VerifyTableColumnCount] Expected must be integer, got '{expected_count}'")
-        timeout = _get_time("${OKW_TIMEOUT_VERIFY_TABLE}", 2.0)
-        poll = _get_poll()
-        end = time.time() + timeout
-        while time.time() < end:
-            got = int(tbl.get_column_count())
-            if got == exp:
-                return
-            time.sleep(poll)
-        got = int(tbl.get_column_count())
-        raise AssertionError(f"[VerifyTableColumnCount] Expected {exp} columns, got {got}")
+        result = poll_until(lambda: int(tbl.get_column_count()), lambda got: got == exp, _table_timeout(), widget=tbl)
+        if result.ok:
+            return
+        raise AssertionError(f"[VerifyTableColumnCount] Expected {exp} columns, got {result.value}")
 
     @keyword("VerifyTableHasRow")
     def verify_table_has_row(self, name: str, expected_row_pattern: str):
@@ -299,27 +571,25 @@ class TableKeywords:
         - Wildcards: ``*`` any sequence, ``?`` single character
 
         Behavior:
-        - Iterates all rows until a matching row is found; polls until timeout
-          ``${OKW_TIMEOUT_VERIFY_TABLE}`` (default 2s) using ``${OKW_POLL_VERIFY}``.
+        - Reads the rows lazily via ``iter_rows()`` (pages of ``${OKW_TABLE_PAGE_SIZE}``,
+          default 100) and stops at the first match; uses one ``get_table_snapshot()``
+          call instead if the widget offers it and has no own ``iter_rows()``.
+        - Polls until timeout ``${OKW_TIMEOUT_VERIFY_TABLE}`` (default 2s) using ``${OKW_POLL_VERIFY}``.
+        - Between polls only changed rows are re-read if the widget provides
+          ``get_row_fingerprints()``; an unchanged ``get_table_version()`` skips the poll.
 
         Examples:
         | VerifyTableHasRow | Items | Foo*$TAB9.99$TABOK |
         """
-        import time
-        tbl = _resolve_table(name)
+        tbl = resolve_widget(name)
         exp_cells = parse_row_pattern(expected_row_pattern)
-        timeout = _get_time("${OKW_TIMEOUT_VERIFY_TABLE}", 2.0)
-        poll = _get_poll()
-        end = time.time() + timeout
-        while time.time() < end:
-            rc = tbl.get_row_count()
-            for r in range(1, rc + 1):
-                act = tbl.get_row_texts(r)
-                if len(act) != len(exp_cells):
-                    continue
-                if all(_match_wcm(a, e) for a, e in zip(act, exp_cells)):
-                    return
-            time.sleep(poll)
+        reader = _TableReader(tbl)
+
+        def has_row(rows):
+            return any(_match_all_wcm(cells, exp_cells) for cells in rows)
+
+        if poll_until(lambda: reader.check(has_row), bool, _table_timeout(), widget=tbl):
+            return
         raise AssertionError("[VerifyTableHasRow] No row matched the expected pattern")
 
     @keyword("VerifyTableContent")
@@ -341,45 +611,43 @@ class TableKeywords:
         Behavior:
         - Polls until ``${OKW_TIMEOUT_VERIFY_TABLE}`` (default 2s) using ``${OKW_POLL_VERIFY}``.
         - Expects exact row and column counts to match, and per‑cell wildcard match (full‑string, DOTALL).
+        - Each poll reads the table with one ``get_table_snapshot()`` call if the widget
+          supports it and has no own ``iter_rows()``; otherwise the rows are streamed
+          via ``iter_rows()`` (pages of ``${OKW_TABLE_PAGE_SIZE}``, default 100) and
+          reading stops at the first mismatch.
+        - Later polls re-read only rows whose ``get_row_fingerprints()`` entry changed,
+          and skip matching while ``get_table_version()`` returns the same token.
 
         Examples:
         | VerifyTableContent | Items | Name$TABPrice$LFFoo*$TAB9.9?$LF$EMPTY$TABOK |
         | VerifyTableContent | Items | $EMPTYTABLE |
         """
-        import time
         from ..utils.table_tokens import parse_table_pattern
-        tbl = _resolve_table(name)
+        tbl = resolve_widget(name)
         exp_rows = parse_table_pattern(expected_table_pattern)
-        timeout = _get_time("${OKW_TIMEOUT_VERIFY_TABLE}", 2.0)
-        poll = _get_poll()
-        end = time.time() + timeout
-        last_rows = None
-        while time.time() < end:
-            rc = tbl.get_row_count()
-            act_rows = [tbl.get_row_texts(r) for r in range(1, rc + 1)]
-            ok = True
-            if len(act_rows) != len(exp_rows):
-                ok = False
-            else:
-                for act, exp in zip(act_rows, exp_rows):
-                    if len(act) != len(exp) or any(not _match_wcm(a, e) for a, e in zip(act, exp)):
-                        ok = False
-                        break
-            if ok:
-                return
-            last_rows = act_rows
-            time.sleep(poll)
-        if last_rows is None:
-            rc = tbl.get_row_count()
-            last_rows = [tbl.get_row_texts(r) for r in range(1, rc + 1)]
-        if len(last_rows) != len(exp_rows):
-            raise AssertionError(f"[VerifyTableContent] Row count mismatch: expected {len(exp_rows)}, got {len(last_rows)}")
-        for i, (act, exp) in enumerate(zip(last_rows, exp_rows), start=1):
-            if len(act) != len(exp):
-                raise AssertionError(f"[VerifyTableContent] Row {i} length mismatch: expected {len(exp)}, got {len(act)}")
-            for j, (a, e) in enumerate(zip(act, exp), start=1):
-                if not _match_wcm(a, e):
-                    raise AssertionError(f"[VerifyTableContent] Mismatch at r{i}c{j}: expected '{e}', got '{a}'")
+        reader = _TableReader(tbl)
+        result = poll_until(
+            lambda: reader.check(lambda rows: _content_mismatch(rows, exp_rows)),
+            lambda mismatch: mismatch is None,
+            _table_timeout(),
+            widget=tbl,
+        )
+        if result.ok:
+            return
+        kind, *info = result.value
+        if kind != "count" and reader.streamed:
+            # The stream stopped at the first difference; a wrong row count is reported first
+            rc = int(tbl.get_row_count())
+            if rc != len(exp_rows):
+                kind, info = "count", [rc]
+        if kind == "count":
+            got = info[0] if info[0] is not None else int(tbl.get_row_count())
+            raise AssertionError(f"[VerifyTableContent] Row count mismatch: expected {len(exp_rows)}, got {got}")
+        if kind == "length":
+            i, exp_len, got_len = info
+            raise AssertionError(f"[VerifyTableContent] Row {i} length mismatch: expected {exp_len}, got {got_len}")
+        i, j, e, a = info
+        raise AssertionError(f"[VerifyTableContent] Mismatch at r{i}c{j}: expected '{e}', got '{a}'")
 
     @keyword("VerifyTableCellValueByHeaders")
     def verify_table_cell_value_by_headers(self, name: str, row: str, col: str, expected: str):
@@ -395,50 +663,39 @@ class TableKeywords:
         - Uses the row key column (``get_row_key_column_index()`` if provided by the widget; otherwise column 1)
           to find exactly one matching row via wildcard pattern.
         - Resolves the column index by exact header name (via ``get_header_names()``).
+        - If the widget provides ``get_table_version()``, header names and row keys are
+          indexed once and reused across polls and keywords until a write keyword
+          (``ClickOn``, ``SetValue``, ...), a new version or a changed row count; each
+          poll then costs the version, the row count and one ``get_cells()`` call for
+          the key cell and the target cell. Otherwise each poll reads the key column and
+          the target column with one ``get_columns()`` call.
         - Polls until ``${OKW_TIMEOUT_VERIFY_TABLE}`` (default 2s) using ``${OKW_POLL_VERIFY}``.
 
         Examples:
         | VerifyTableCellValueByHeaders | Items | ID*123 | Price  | 9.99   |
         | VerifyTableCellValueByHeaders | Items | Kunde* | Status | $EMPTY |
         """
-        import time
-        tbl = _resolve_table(name)
-        headers = _get_header_names(tbl)
-        try:
-            col_idx = headers.index(str(col)) + 1
-        except ValueError:
+        tbl = resolve_widget(name)
+        col_idx = _table_index(tbl).column(tbl, col)
+        if col_idx is None:
             raise ValueError(f"[VerifyTableCellValueByHeaders] Column header not found: '{col}'")
         rk_idx = _get_row_key_column_index(tbl)
         if is_empty_cell_token(expected):
             expected = ""
-        timeout = _get_time("${OKW_TIMEOUT_VERIFY_TABLE}", 2.0)
-        poll = _get_poll()
-        end = time.time() + timeout
-        last_val = None
-        last_rows = None
-        while time.time() < end:
-            rc = int(tbl.get_row_count())
-            matches = []
-            for r in range(1, rc + 1):
-                key_val = tbl.get_cell_text(r, rk_idx)
-                if _match_wcm(key_val, row):
-                    matches.append(r)
-            if len(matches) == 1:
-                val = tbl.get_cell_text(matches[0], col_idx)
-                if _match_wcm(val, expected):
-                    return
-                last_val = val
-            last_rows = matches
-            time.sleep(poll)
-        if last_rows is None:
-            rc = int(tbl.get_row_count())
-            last_rows = [r for r in range(1, rc + 1) if _match_wcm(tbl.get_cell_text(r, rk_idx), row)]
+
+        def probe():
+            return _find_keyed_cell(tbl, rk_idx, row, col_idx)
+
+        result = poll_until(
+            probe, lambda rv: len(rv[0]) == 1 and _match_wcm(rv[1], expected), _table_timeout(), widget=tbl
+        )
+        if result.ok:
+            return
+        last_rows, last_val = result.value
         if len(last_rows) == 0:
             raise AssertionError(f"[VerifyTableCellValueByHeaders] No row matched key pattern '{row}'")
         if len(last_rows) > 1:
             raise AssertionError(f"[VerifyTableCellValueByHeaders] Row not unique for key pattern '{row}': matched {len(last_rows)} rows")
-        if last_val is None:
-            last_val = tbl.get_cell_text(last_rows[0], col_idx)
         raise AssertionError(f"[VerifyTableCellValueByHeaders] Expected '{expected}', got '{last_val}' at row key '{row}', col '{col}'")
 
     @keyword("VerifyTableRowContentByHeader")
@@ -453,47 +710,31 @@ class TableKeywords:
 
         Behavior:
         - Resolves the key column by exact header name; finds exactly one matching row via WCM on that column.
+        - Header names and row keys come from the table index (see ``VerifyTableCellValueByHeaders``).
         - Verifies the entire row with wildcard matching per cell; polls with table timeouts.
 
         Examples:
         | VerifyTableRowContentByHeader | Items | ID   | 12345 | 12345$TABFoo*$TAB9.9? |
         """
-        import time
-        tbl = _resolve_table(name)
-        headers = _get_header_names(tbl)
-        try:
-            key_col = headers.index(str(row_header)) + 1
-        except ValueError:
+        tbl = resolve_widget(name)
+        key_col = _table_index(tbl).column(tbl, row_header)
+        if key_col is None:
             raise ValueError(f"[VerifyTableRowContentByHeader] Column header not found: '{row_header}'")
         exp_cells = parse_row_pattern(expected_row_pattern)
-        timeout = _get_time("${OKW_TIMEOUT_VERIFY_TABLE}", 2.0)
-        poll = _get_poll()
-        end = time.time() + timeout
-        last_row_vals = None
-        last_matches = None
-        while time.time() < end:
-            rc = int(tbl.get_row_count())
-            matches = []
-            for r in range(1, rc + 1):
-                key_val = tbl.get_cell_text(r, key_col)
-                if _match_wcm(key_val, row_value):
-                    matches.append(r)
-            if len(matches) == 1:
-                act_cells = tbl.get_row_texts(matches[0])
-                if len(act_cells) == len(exp_cells) and all(_match_wcm(a, e) for a, e in zip(act_cells, exp_cells)):
-                    return
-                last_row_vals = act_cells
-            last_matches = matches
-            time.sleep(poll)
-        if last_matches is None:
-            rc = int(tbl.get_row_count())
-            last_matches = [r for r in range(1, rc + 1) if _match_wcm(tbl.get_cell_text(r, key_col), row_value)]
+
+        def probe():
+            return _find_keyed_row(tbl, key_col, row_value)
+
+        result = poll_until(
+            probe, lambda rc: len(rc[0]) == 1 and _match_all_wcm(rc[1], exp_cells), _table_timeout(), widget=tbl
+        )
+        if result.ok:
+            return
+        last_matches, last_row_vals = result.value
         if len(last_matches) == 0:
             raise AssertionError(f"[VerifyTableRowContentByHeader] No row matched pattern '{row_value}' in column '{row_header}'")
         if len(last_matches) > 1:
             raise AssertionError(f"[VerifyTableRowContentByHeader] Row not unique for pattern '{row_value}' in column '{row_header}': matched {len(last_matches)} rows")
-        if last_row_vals is None:
-            last_row_vals = tbl.get_row_texts(last_matches[0])
         if len(last_row_vals) != len(exp_cells):
             raise AssertionError(f"[VerifyTableRowContentByHeader] Row length mismatch: expected {len(exp_cells)}, got {len(last_row_vals)}")
         for i, (a, e) in enumerate(zip(last_row_vals, exp_cells), start=1):
@@ -516,26 +757,20 @@ class TableKeywords:
         | VerifyTableColumnContentByHeader | Items | Price  | Price$LF9.99$LF$EMPTY |
         | VerifyTableColumnContentByHeader | Items | Status | Status$LFOK$LFPending |
         """
-        import time
-        tbl = _resolve_table(name)
-        headers = _get_header_names(tbl)
-        try:
-            col_idx = headers.index(str(col_header)) + 1
-        except ValueError:
+        tbl = resolve_widget(name)
+        col_idx = _table_index(tbl).column(tbl, col_header)
+        if col_idx is None:
             raise ValueError(f"[VerifyTableColumnContentByHeader] Column header not found: '{col_header}'")
         exp_rows = parse_column_pattern(expected_column_pattern)
-        timeout = _get_time("${OKW_TIMEOUT_VERIFY_TABLE}", 2.0)
-        poll = _get_poll()
-        end = time.time() + timeout
-        last_vals = None
-        while time.time() < end:
-            act_rows = tbl.get_column_texts(int(col_idx))
-            if len(exp_rows) == len(act_rows) and all(_match_wcm(a, e) for a, e in zip(act_rows, exp_rows)):
-                return
-            last_vals = act_rows
-            time.sleep(poll)
-        if last_vals is None:
-            last_vals = tbl.get_column_texts(int(col_idx))
+        result = poll_until(
+            lambda: tbl.get_column_texts(int(col_idx)),
+            lambda act: _match_all_wcm(act, exp_rows),
+            _table_timeout(),
+            widget=tbl,
+        )
+        if result.ok:
+            return
+        last_vals = result.value
         if len(exp_rows) != len(last_vals):
             raise AssertionError(f"[VerifyTableColumnContentByHeader] Column length mismatch: expected {len(exp_rows)}, got {len(last_vals)}")
         for i, (a, e) in enumerate(zip(last_vals, exp_rows), start=1):
@@ -557,51 +792,35 @@ class TableKeywords:
         - Column resolved by exact header name; value is verified via regex search.
         - Polls until ``${OKW_TIMEOUT_VERIFY_TABLE}`` (default 2s) using ``${OKW_POLL_VERIFY}``.
         """
-        import time, re
-        tbl = _resolve_table(name)
-        headers = _get_header_names(tbl)
-        try:
-            col_idx = headers.index(str(col)) + 1
-        except ValueError:
+        import re
+        tbl = resolve_widget(name)
+        col_idx = _table_index(tbl).column(tbl, col)
+        if col_idx is None:
             raise ValueError(f"[VerifyTableCellValueByHeadersREGX] Column header not found: '{col}'")
         rk_idx = _get_row_key_column_index(tbl)
         want_empty = is_empty_cell_token(expected)
-        timeout = _get_time("${OKW_TIMEOUT_VERIFY_TABLE}", 2.0)
-        poll = _get_poll()
-        end = time.time() + timeout
-        last_val = None
-        last_rows = None
         rx = None
         if not want_empty:
-            try:
-                rx = re.compile(str(expected))
-            except Exception:
-                # surface invalid regex immediately
-                raise
-        while time.time() < end:
-            rc = int(tbl.get_row_count())
-            matches = []
-            for r in range(1, rc + 1):
-                key_val = tbl.get_cell_text(r, rk_idx)
-                if _match_wcm(key_val, row):
-                    matches.append(r)
-            if len(matches) == 1:
-                val = tbl.get_cell_text(matches[0], col_idx)
-                ok = (val == "") if want_empty else bool(rx.search(val or ""))
-                if ok:
-                    return
-                last_val = val
-            last_rows = matches
-            time.sleep(poll)
-        if last_rows is None:
-            rc = int(tbl.get_row_count())
-            last_rows = [r for r in range(1, rc + 1) if _match_wcm(tbl.get_cell_text(r, rk_idx), row)]
+            # surface invalid regex immediately
+            rx = re.compile(str(expected))
+
+        def probe():
+            return _find_keyed_cell(tbl, rk_idx, row, col_idx)
+
+        def accept(rv):
+            rows, val = rv
+            if len(rows) != 1:
+                return False
+            return (val == "") if want_empty else bool(rx.search(val or ""))
+
+        result = poll_until(probe, accept, _table_timeout(), widget=tbl)
+        if result.ok:
+            return
+        last_rows, last_val = result.value
         if len(last_rows) == 0:
             raise AssertionError(f"[VerifyTableCellValueByHeadersREGX] No row matched key pattern '{row}'")
         if len(last_rows) > 1:
             raise AssertionError(f"[VerifyTableCellValueByHeadersREGX] Row not unique for key pattern '{row}': matched {len(last_rows)} rows")
-        if last_val is None:
-            last_val = tbl.get_cell_text(last_rows[0], col_idx)
         raise AssertionError(f"[VerifyTableCellValueByHeadersREGX] Regex '{expected}' did not match value '{last_val}' at row key '{row}', col '{col}'")
 
     @keyword("VerifyTableRowContentByHeaderREGX")
@@ -619,12 +838,10 @@ class TableKeywords:
         - Verifies each cell against its regex (not anchored, DOTALL via ``re.search``). Empty token requires empty cell.
         - Polls until ``${OKW_TIMEOUT_VERIFY_TABLE}`` (default 2s) using ``${OKW_POLL_VERIFY}``.
         """
-        import time, re
-        tbl = _resolve_table(name)
-        headers = _get_header_names(tbl)
-        try:
-            key_col = headers.index(str(row_header)) + 1
-        except ValueError:
+        import re
+        tbl = resolve_widget(name)
+        key_col = _table_index(tbl).column(tbl, row_header)
+        if key_col is None:
             raise ValueError(f"[VerifyTableRowContentByHeaderREGX] Column header not found: '{row_header}'")
         exps = parse_row_pattern(expected_row_pattern)
         # Precompile regex for non-empty patterns
@@ -637,43 +854,20 @@ class TableKeywords:
                     rx_list.append(__import__('re').compile(str(pat), __import__('re').DOTALL))
                 except Exception:
                     raise
-        timeout = _get_time("${OKW_TIMEOUT_VERIFY_TABLE}", 2.0)
-        poll = _get_poll()
-        end = time.time() + timeout
-        last_vals = None
-        last_matches = None
-        while time.time() < end:
-            rc = int(tbl.get_row_count())
-            matches = []
-            for r in range(1, rc + 1):
-                key_val = tbl.get_cell_text(r, key_col)
-                if _match_wcm(key_val, row_value):
-                    matches.append(r)
-            if len(matches) == 1:
-                act = tbl.get_row_texts(matches[0])
-                if len(act) == len(rx_list):
-                    ok = True
-                    for a, rx in zip(act, rx_list):
-                        if rx is None:
-                            if a != "":
-                                ok = False; break
-                        else:
-                            if not rx.search(a or ""):
-                                ok = False; break
-                    if ok:
-                        return
-                last_vals = act
-            last_matches = matches
-            time.sleep(poll)
-        if last_matches is None:
-            rc = int(tbl.get_row_count())
-            last_matches = [r for r in range(1, rc + 1) if _match_wcm(tbl.get_cell_text(r, key_col), row_value)]
+
+        def probe():
+            return _find_keyed_row(tbl, key_col, row_value)
+
+        result = poll_until(
+            probe, lambda rc: len(rc[0]) == 1 and _match_all_regx(rc[1], rx_list), _table_timeout(), widget=tbl
+        )
+        if result.ok:
+            return
+        last_matches, last_vals = result.value
         if len(last_matches) == 0:
             raise AssertionError(f"[VerifyTableRowContentByHeaderREGX] No row matched pattern '{row_value}' in column '{row_header}'")
         if len(last_matches) > 1:
             raise AssertionError(f"[VerifyTableRowContentByHeaderREGX] Row not unique for pattern '{row_value}' in column '{row_header}': matched {len(last_matches)} rows")
-        if last_vals is None:
-            last_vals = tbl.get_row_texts(last_matches[0])
         if len(last_vals) != len(rx_list):
             raise AssertionError(f"[VerifyTableRowContentByHeaderREGX] Row length mismatch: expected {len(rx_list)}, got {len(last_vals)}")
         for i, (a, rx) in enumerate(zip(last_vals, rx_list), start=1):
@@ -697,12 +891,10 @@ class TableKeywords:
         - Resolves the column by exact header name; each cell is verified via regex search (per row).
         - Polls until ``${OKW_TIMEOUT_VERIFY_TABLE}`` (default 2s) using ``${OKW_POLL_VERIFY}``.
         """
-        import time, re
-        tbl = _resolve_table(name)
-        headers = _get_header_names(tbl)
-        try:
-            col_idx = headers.index(str(col_header)) + 1
-        except ValueError:
+        import re
+        tbl = resolve_widget(name)
+        col_idx = _table_index(tbl).column(tbl, col_header)
+        if col_idx is None:
             raise ValueError(f"[VerifyTableColumnContentByHeaderREGX] Column header not found: '{col_header}'")
         exps = parse_column_pattern(expected_column_pattern)
         rx_list = []
@@ -714,27 +906,15 @@ class TableKeywords:
                     rx_list.append(re.compile(str(pat), re.DOTALL))
                 except Exception:
                     raise
-        timeout = _get_time("${OKW_TIMEOUT_VERIFY_TABLE}", 2.0)
-        poll = _get_poll()
-        end = time.time() + timeout
-        last_vals = None
-        while time.time() < end:
-            act = tbl.get_column_texts(int(col_idx))
-            if len(act) == len(rx_list):
-                ok = True
-                for a, rx in zip(act, rx_list):
-                    if rx is None:
-                        if a != "":
-                            ok = False; break
-                    else:
-                        if not rx.search(a or ""):
-                            ok = False; break
-                if ok:
-                    return
-            last_vals = act
-            time.sleep(poll)
-        if last_vals is None:
-            last_vals = tbl.get_column_texts(int(col_idx))
+        result = poll_until(
+            lambda: tbl.get_column_texts(int(col_idx)),
+            lambda act: _match_all_regx(act, rx_list),
+            _table_timeout(),
+            widget=tbl,
+        )
+        if result.ok:
+            return
+        last_vals = result.value
         if len(last_vals) != len(rx_list):
             raise AssertionError(f"[VerifyTableColumnContentByHeaderREGX] Column length mismatch: expected {len(rx_list)}, got {len(last_vals)}")
         for i, (a, rx) in enumerate(zip(last_vals, rx_list), start=1):
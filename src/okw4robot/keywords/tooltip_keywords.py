@@ -37,7 +37,7 @@ class TooltipKeywords:
             return
         w = resolve_widget(name)
         timeout = get_robot_timeout("${OKW_TIMEOUT_VERIFY_TOOLTIP}", 10.0)
-        verify_with_timeout(lambda: _get_tooltip(w), expected, MatchMode.EXACT, timeout, f"[VerifyTooltip] '{name}'")
+        verify_with_timeout(w.okw_get_tooltip, expected, MatchMode.EXACT, timeout, f"[VerifyTooltip] '{name}'", widget=w, condition="tooltip")
 
     @keyword("VerifyTooltipWCM")
     def verify_tooltip_wcm(self, name, expected):
@@ -60,7 +60,7 @@ class TooltipKeywords:
             return
         w = resolve_widget(name)
         timeout = get_robot_timeout("${OKW_TIMEOUT_VERIFY_TOOLTIP}", 10.0)
-        verify_with_timeout(lambda: _get_tooltip(w), expected, MatchMode.WCM, timeout, f"[VerifyTooltipWCM] '{name}'")
+        verify_with_timeout(w.okw_get_tooltip, expected, MatchMode.WCM, timeout, f"[VerifyTooltipWCM] '{name}'", widget=w, condition="tooltip")
 
     @keyword("VerifyTooltipREGX")
     def verify_tooltip_regx(self, name, expected):
@@ -83,7 +83,7 @@ class TooltipKeywords:
             return
         w = resolve_widget(name)
         timeout = get_robot_timeout("${OKW_TIMEOUT_VERIFY_TOOLTIP}", 10.0)
-        verify_with_timeout(lambda: _get_tooltip(w), expected, MatchMode.REGX, timeout, f"[VerifyTooltipREGX] '{name}'")
+        verify_with_timeout(w.okw_get_tooltip, expected, MatchMode.REGX, timeout, f"[VerifyTooltipREGX] '{name}'", widget=w, condition="tooltip")
 
     @keyword("MemorizeTooltip")
     def memorize_tooltip(self, name, variable):
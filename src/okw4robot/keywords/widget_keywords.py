@@ -6,9 +6,61 @@ from ..utils.okw_helpers import (
     get_robot_timeout, get_robot_poll,
     normalize_var_name, resolve_widget,
     verify_with_timeout, verify_yes_no_poll,
+    parse_name_value_pairs, verify_values_with_timeout,
+    wait_for_first,
 )
+from ..widgets.okw_widget import OkwWidget
 from okw_contract_utils import MatchMode
 
+
+def _batch_owner(widget):
+    """Class that implements ``okw_set_values_batch`` for *widget* (None = not offered)."""
+    for cls in type(widget).__mro__:
+        if "okw_set_values_batch" in vars(cls):
+            return None if cls is OkwWidget else cls
+    return None
+
+
+# state -> (widget method, timeout variable) for VerifyAny / WaitForFirst
+_STATE_CONDITIONS = {
+    "exists": ("okw_exists", "${OKW_TIMEOUT_VERIFY_EXIST}"),
+    "visible": ("okw_is_visible", "${OKW_TIMEOUT_VERIFY_VISIBLE}"),
+    "enabled": ("okw_is_enabled", "${OKW_TIMEOUT_VERIFY_ENABLED}"),
+    "editable": ("okw_is_editable", "${OKW_TIMEOUT_VERIFY_EDITABLE}"),
+    "focus": ("okw_has_focus", "${OKW_TIMEOUT_VERIFY_FOCUS}"),
+    "focusable": ("okw_is_focusable", "${OKW_TIMEOUT_VERIFY_FOCUSABLE}"),
+    "clickable": ("okw_is_clickable", "${OKW_TIMEOUT_VERIFY_CLICKABLE}"),
+}
+
+
+def _parse_condition(condition: str, kw_name: str):
+    """Split ``Name`` / ``Name:state`` into ``(name, state)``; state defaults to ``exists``.
+
+    Only a known state after the last colon is split off, so widget names that
+    contain a colon themselves (``Dialog:Title``) are taken as a whole.
+    """
+    condition = str(condition)
+    name, sep, state = condition.rpartition(":")
+    if not sep or state.strip().lower() not in _STATE_CONDITIONS:
+        name, state = condition, "exists"
+    name, state = name.strip(), state.strip().lower()
+    if not name:
+        raise ValueError(f"[{kw_name}] Missing widget name in condition '{condition}'")
+    return name, state
+
+
+def _batch_runs(widgets):
+    """Group consecutive ``(widget, value)`` pairs that share a batch implementation."""
+    runs = []
+    for w, value in widgets:
+        owner = _batch_owner(w)
+        if runs and runs[-1][0] is owner:
+            runs[-1][1].append((w, value))
+        else:
+            runs.append((owner, [(w, value)]))
+    return runs
+
+
 class WidgetKeywords:
     """Widget interactions and verifications.
 
@@ -34,6 +86,7 @@ class WidgetKeywords:
         | SetValue     | Passwort    | geheim |
         | *ClickOn*    | *OK*        |
         """
+        context.clear_table_indexes()
         resolve_widget(name).okw_click()
 
     @keyword("DoubleClickOn")
@@ -54,6 +107,7 @@ class WidgetKeywords:
         | SetValue      | Passwort    | geheim |
         | *DoubleClickOn* | *OK*      |
         """
+        context.clear_table_indexes()
         resolve_widget(name).okw_double_click()
 
     @keyword("SetValue")
@@ -94,6 +148,7 @@ class WidgetKeywords:
         | SetSuiteVariable | ${OKW_IGNORE_EMPTY} | YES |
         | SetValue        | Comment | $EMPTY |
         """
+        context.clear_table_indexes()
         # $EMPTY explizit unterstützen und NICHT ignorieren
         if isinstance(value, str) and value.strip().upper() in ("$EMPTY", "${EMPTY}"):
             resolve_widget(name).okw_set_value("")
@@ -103,6 +158,51 @@ class WidgetKeywords:
             return
         resolve_widget(name).okw_set_value(value)
 
+    @keyword("SetValues")
+    def set_values(self, values):
+        """Sets several widget values in one call (data-driven form filling).
+
+        Arguments:
+        - ``values``: Name/value pairs as dictionary (``&{fields}``), list
+          (``@{pairs}``: name, value, name, value, ...) or token string
+          ``Name$TABvalue$LFName2$TABvalue2`` (table tokens).
+
+        Special tokens / control parameters (same as ``SetValue``, per field):
+        - ``$IGNORE`` or ``${IGNORE}``: Skip this field.
+        - Empty value (``""``) is skipped if ``${OKW_IGNORE_EMPTY}=YES`` is set.
+        - ``$EMPTY`` or ``${EMPTY}``: Explicitly set an empty string (never ignored).
+
+        Behavior:
+        - Filters the tokens first, then resolves all widgets once (an unknown
+          name fails before anything is written).
+        - Consecutive widgets whose class provides ``okw_set_values_batch`` are
+          handed to the driver in one call (e.g. one script for a whole form);
+          otherwise ``okw_set_value`` is called per widget, in the given order.
+
+        Examples:
+        | SetValues | Username$TABadmin$LFPassword$TABgeheim$LFComment$TAB$IGNORE |
+        | SetValues | ${form_data} |
+        """
+        items = []
+        for name, value in parse_name_value_pairs(values):
+            if is_empty(value):
+                value = ""
+            elif should_ignore(value):
+                print(f"[SetValues] '{name}' ignored (blank or $IGNORE)")
+                continue
+            items.append((name, value))
+        widgets = [(resolve_widget(name), value) for name, value in items]
+        context.clear_table_indexes()
+        for batch_owner, batch in _batch_runs(widgets):
+            if batch_owner is not None:
+                try:
+                    batch_owner.okw_set_values_batch(batch)
+                    continue
+                except NotImplementedError:
+                    pass
+            for w, value in batch:
+                w.okw_set_value(value)
+
     @keyword("Select")
     def select(self, name, value):
         """Selects a value on a widget.
@@ -135,6 +235,7 @@ class WidgetKeywords:
         if should_ignore(value):
             print(f"[Select] '{name}' ignored (blank or $IGNORE)")
             return
+        context.clear_table_indexes()
         resolve_widget(name).okw_select(value)
 
     @keyword("TypeKey")
@@ -167,6 +268,7 @@ class WidgetKeywords:
         | # Skip a field if needed
         | TypeKey      | ExtraInfo   | $IGNORE |
         """
+        context.clear_table_indexes()
         # Handle special delete token -- delegiert an Widget
         if is_delete(key):
             resolve_widget(name).okw_delete()
@@ -205,7 +307,7 @@ class WidgetKeywords:
             return
         w = resolve_widget(name)
         timeout = get_robot_timeout("${OKW_TIMEOUT_VERIFY_VALUE}", 10.0)
-        verify_with_timeout(w.okw_get_value, expected, MatchMode.EXACT, timeout, f"[VerifyValue] '{name}'")
+        verify_with_timeout(w.okw_get_value, expected, MatchMode.EXACT, timeout, f"[VerifyValue] '{name}'", widget=w, condition="value")
 
     @keyword("VerifyValueWCM")
     def verify_value_wcm(self, name, expected):
@@ -234,7 +336,7 @@ class WidgetKeywords:
             return
         w = resolve_widget(name)
         timeout = get_robot_timeout("${OKW_TIMEOUT_VERIFY_VALUE}", 10.0)
-        verify_with_timeout(w.okw_get_value, expected, MatchMode.WCM, timeout, f"[VerifyValueWCM] '{name}'")
+        verify_with_timeout(w.okw_get_value, expected, MatchMode.WCM, timeout, f"[VerifyValueWCM] '{name}'", widget=w, condition="value")
 
     @keyword("VerifyValueREGX")
     def verify_value_regx(self, name, expected):
@@ -263,7 +365,68 @@ class WidgetKeywords:
             return
         w = resolve_widget(name)
         timeout = get_robot_timeout("${OKW_TIMEOUT_VERIFY_VALUE}", 10.0)
-        verify_with_timeout(w.okw_get_value, expected, MatchMode.REGX, timeout, f"[VerifyValueREGX] '{name}'")
+        verify_with_timeout(w.okw_get_value, expected, MatchMode.REGX, timeout, f"[VerifyValueREGX] '{name}'", widget=w, condition="value")
+
+    @keyword("VerifyValues")
+    def verify_values(self, values):
+        """Verifies several widget values at once against one shared timeout.
+
+        Arguments:
+        - ``values``: Name/expected pairs as dictionary (``&{fields}``), list
+          (``@{pairs}``: name, value, name, value, ...) or token string
+          ``Name$TABvalue$LFName2$TABvalue2`` (table tokens).
+
+        Special tokens / control parameters:
+        - ``$IGNORE`` or ``${IGNORE}`` (case‑insensitive): Skip this field.
+        - ``$EMPTY`` or ``${EMPTY}``: Expect an empty value (never ignored).
+        - Empty value (``""``) is ignored if ``${OKW_IGNORE_EMPTY}=YES`` is set.
+
+        Behavior:
+        - Resolves all widgets once, then polls all pending fields in the same loop
+          until they match (exact) or ``${OKW_TIMEOUT_VERIFY_VALUE}`` elapses (default 10s).
+          Matched fields are not read again.
+        - Worst‑case duration is the slowest field, not the sum of all fields.
+        - On timeout, every remaining mismatch is reported in one error.
+
+        Examples:
+        | VerifyValues | Username$TABadmin$LFRole$TABUser |
+        | VerifyValues | ${expected_fields} |
+        """
+        self._verify_values(values, MatchMode.EXACT, "VerifyValues")
+
+    @keyword("VerifyValuesWCM")
+    def verify_values_wcm(self, values):
+        """Like ``VerifyValues``, but each expected value is a wildcard pattern (``*``, ``?``).
+
+        Examples:
+        | VerifyValuesWCM | Username$TABadm*$LFCreated$TAB20??-* |
+        """
+        self._verify_values(values, MatchMode.WCM, "VerifyValuesWCM")
+
+    @keyword("VerifyValuesREGX")
+    def verify_values_regx(self, values):
+        """Like ``VerifyValues``, but each expected value is a regular expression (``re.search``).
+
+        Invalid patterns fail immediately, before any widget is read.
+
+        Examples:
+        | VerifyValuesREGX | Username$TAB^adm$LFZip$TAB^[0-9]{5}$ |
+        """
+        self._verify_values(values, MatchMode.REGX, "VerifyValuesREGX")
+
+    def _verify_values(self, values, mode, kw_name):
+        fields = []
+        for name, expected in parse_name_value_pairs(values):
+            if is_empty(expected):
+                expected = ""
+            elif should_ignore(expected):
+                print(f"[{kw_name}] '{name}' ignored (blank or $IGNORE)")
+                continue
+            fields.append((name, resolve_widget(name), str(expected)))
+        if not fields:
+            return
+        timeout = get_robot_timeout("${OKW_TIMEOUT_VERIFY_VALUE}", 10.0)
+        verify_values_with_timeout(fields, mode, timeout, f"[{kw_name}]")
 
     @keyword("VerifyExist")
     def verify_exist(self, name, expected):
@@ -291,8 +454,73 @@ class WidgetKeywords:
             expected,
             "${OKW_TIMEOUT_VERIFY_EXIST}", 2.0,
             f"[VerifyExist] '{name}'",
+            widget=widget,
+            condition="exists",
         )
 
+    @keyword("VerifyAny")
+    def verify_any(self, *conditions, timeout=None):
+        """Waits until the first of several widget conditions holds and returns it.
+
+        Arguments:
+        - ``conditions``: One or more conditions ``Name`` or ``Name:state``. ``state`` is one of
+          ``exists`` (default), ``visible``, ``enabled``, ``editable``, ``focus``, ``focusable``,
+          ``clickable`` (case‑insensitive). Anything else after the last colon is part of the name.
+        - ``timeout``: Optional shared timeout (seconds or Robot time string, e.g. ``5s``).
+          Default: the largest ``${OKW_TIMEOUT_VERIFY_<STATE>}`` of the given states (each default 2s).
+
+        Behavior:
+        - Resolves all widgets first, then evaluates all conditions in the same polling loop
+          under one deadline (``${OKW_POLL_VERIFY}``). Worst‑case duration is one timeout,
+          not one timeout per alternative.
+        - If several conditions hold in the same round, the first one in argument order wins.
+        - Returns the matching condition exactly as given; raises AssertionError if none
+          became true before the deadline.
+
+        Examples:
+        | ${hit}= | VerifyAny | SuccessBanner | ErrorDialog:visible | timeout=10s |
+        | IF | $hit == 'ErrorDialog:visible' |
+        |    | ClickOn | ErrorDialog_OK |
+        | END |
+        """
+        hit = self._wait_for_first(conditions, timeout, "VerifyAny")
+        if hit is None:
+            raise AssertionError(f"[VerifyAny] None of the conditions became true: {', '.join(map(str, conditions))}")
+        return hit
+
+    @keyword("WaitForFirst")
+    def wait_for_first(self, *conditions, timeout=None):
+        """Like ``VerifyAny``, but returns an empty string instead of failing on timeout.
+
+        Intended for branching: the test decides what to do when nothing appeared.
+
+        Examples:
+        | ${hit}= | WaitForFirst | SuccessBanner | ErrorDialog | timeout=5s |
+        | IF | not $hit |
+        |    | Fail | Neither banner nor dialog appeared |
+        | END |
+        """
+        hit = self._wait_for_first(conditions, timeout, "WaitForFirst")
+        return "" if hit is None else hit
+
+    def _wait_for_first(self, conditions, timeout, kw_name):
+        if not conditions:
+            raise ValueError(f"[{kw_name}] At least one condition is required")
+        checks = []
+        timeout_vars = []
+        for condition in conditions:
+            name, state = _parse_condition(condition, kw_name)
+            method, timeout_var = _STATE_CONDITIONS[state]
+            widget = resolve_widget(name)
+            checks.append((condition, widget, getattr(widget, method)))
+            timeout_vars.append(timeout_var)
+        if timeout is None:
+            timeout_s = max(get_robot_timeout(var, 2.0) for var in dict.fromkeys(timeout_vars))
+        else:
+            from robot.utils import timestr_to_secs
+            timeout_s = timestr_to_secs(timeout)
+        return wait_for_first(checks, timeout_s)
+
     @keyword("LogValue")
     def log_value(self, name):
         """Logs the current value/content of a widget to the console.
@@ -356,6 +584,7 @@ class WidgetKeywords:
         | SetFocus     | Username    |
         | TypeKey      | Username    | admin |
         """
+        context.clear_table_indexes()
         resolve_widget(name).okw_set_focus()
 
     @keyword("VerifyHasFocus")
@@ -384,6 +613,8 @@ class WidgetKeywords:
             expected,
             "${OKW_TIMEOUT_VERIFY_FOCUS}", 2.0,
             f"[VerifyHasFocus] '{name}'",
+            widget=widget,
+            condition="focus",
         )
 
     @keyword("VerifyIsVisible")
@@ -411,6 +642,8 @@ class WidgetKeywords:
             expected,
             "${OKW_TIMEOUT_VERIFY_VISIBLE}", 2.0,
             f"[VerifyIsVisible] '{name}'",
+            widget=widget,
+            condition="visible",
         )
 
     @keyword("VerifyIsEnabled")
@@ -437,6 +670,8 @@ class WidgetKeywords:
             expected,
             "${OKW_TIMEOUT_VERIFY_ENABLED}", 2.0,
             f"[VerifyIsEnabled] '{name}'",
+            widget=widget,
+            condition="enabled",
         )
 
     @keyword("VerifyIsEditable")
@@ -460,6 +695,8 @@ class WidgetKeywords:
             expected,
             "${OKW_TIMEOUT_VERIFY_EDITABLE}", 2.0,
             f"[VerifyIsEditable] '{name}'",
+            widget=widget,
+            condition="editable",
         )
 
     @keyword("VerifyIsFocusable")
@@ -483,6 +720,8 @@ class WidgetKeywords:
             expected,
             "${OKW_TIMEOUT_VERIFY_FOCUSABLE}", 2.0,
             f"[VerifyIsFocusable] '{name}'",
+            widget=widget,
+            condition="focusable",
         )
 
     @keyword("VerifyIsClickable")
@@ -506,5 +745,7 @@ class WidgetKeywords:
             expected,
             "${OKW_TIMEOUT_VERIFY_CLICKABLE}", 2.0,
             f"[VerifyIsClickable] '{name}'",
+            widget=widget,
+            condition="clickable",
         )
 
@@ -17,6 +17,8 @@ from .keywords.placeholder_keywords import PlaceholderKeywords
 from .keywords.tooltip_keywords import TooltipKeywords
 from .keywords.table_keywords import TableKeywords
 from .keywords.params import ParamsKeywords
+from .keywords.probe_keywords import ProbeKeywords
+from .utils.robot_vars import VariableSnapshotListener
 
 
 @library(scope="GLOBAL")
@@ -32,6 +34,7 @@ class OKW4RobotLibrary(
     TooltipKeywords,
     TableKeywords,
     ParamsKeywords,
+    ProbeKeywords,
 ):
     """Driver-agnostic Robot Framework library for GUI test automation.
 
@@ -113,7 +116,7 @@ class OKW4RobotLibrary(
     Alle Verify-Keywords nutzen konfigurierbares Timeout-Polling:
 
     | *Variable*                      | *Standard* | *Verwendet von*                          |
-    | ``${OKW_TIMEOUT_VERIFY_VALUE}`` | 10s        | VerifyValue, VerifyValueWCM, VerifyValueREGX |
+    | ``${OKW_TIMEOUT_VERIFY_VALUE}`` | 10s        | VerifyValue(s), VerifyValue(s)WCM/REGX |
     | ``${OKW_TIMEOUT_VERIFY_EXIST}`` | 2s         | VerifyExist                              |
     | ``${OKW_TIMEOUT_VERIFY_VISIBLE}`` | 2s       | VerifyIsVisible                          |
     | ``${OKW_TIMEOUT_VERIFY_ENABLED}`` | 2s       | VerifyIsEnabled                          |
@@ -126,6 +129,10 @@ class OKW4RobotLibrary(
     | ``${OKW_TIMEOUT_VERIFY_LIST}``  | 2s         | VerifyListCount, VerifySelectedCount     |
     | ``${OKW_POLL_VERIFY}``          | 0.1s       | Alle Verify-Keywords (Poll-Intervall)    |
 
+    Die Variablen werden pro Test einmal gelesen und zwischengespeichert.
+    ``SetOKWParameter``, ``Set Test/Suite/Global Variable`` und Zuweisungen an
+    ``${OKW_*}`` wirken trotzdem sofort.
+
     = Import =
 
     | Library    okw4robot.library.OKW4RobotLibrary
@@ -157,3 +164,5 @@ class OKW4RobotLibrary(
         """
         # All keyword mixins are stateless; state lives in the global Context singleton.
         super().__init__()
+        # Keeps the variable snapshot (utils.robot_vars) in sync with Robot scopes
+        self.ROBOT_LIBRARY_LISTENER = VariableSnapshotListener()
@@ -1,4 +1,46 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from okw4robot.utils.logging_mixin import LoggingMixin
+from okw4robot.runtime.model import AppModel
+
+
+class _ContextState:
+    """Veraenderlicher Zustand eines Kontextes (Host, App, Fenster, Register, Cache)."""
+
+    __slots__ = (
+        "adapter", "adapter_name", "app_model", "app_name", "window",
+        "adapters", "adapter_startup", "apps",
+        "widget_cache", "cache_hits", "cache_misses", "table_indexes", "lock",
+    )
+
+    def __init__(self):
+        self.adapter = None
+        self.adapter_name = None
+        self.app_model = None
+        self.app_name = None
+        self.window = None
+        # Register der gestarteten Hosts und Apps (Wechsel ohne Neustart)
+        self.adapters = {}
+        self.adapter_startup = {}
+        # (Host, App) -> AppModel; dieselbe App kann auf mehreren Hosts laufen
+        self.apps = {}
+        # Widget-Instanz-Cache: (adapter, app, window, name) -> Widget
+        self.widget_cache = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Tabellen-Index (Kopfzeile, Zeilenschluessel): id(Widget) -> (Widget, Index)
+        self.table_indexes = {}
+        self.lock = threading.RLock()
+
+
+def _state_attr(name):
+    """Property, die auf das gleichnamige Feld des aktuellen Zustands zeigt."""
+    return property(
+        lambda self: getattr(self._state, name),
+        lambda self, value: setattr(self._state, name, value),
+    )
 
 
 class Context(LoggingMixin):
@@ -7,45 +49,132 @@ class Context(LoggingMixin):
     Haelt den aktiven Host/Adapter, den aktuellen App-Kontext (Name und Modell)
     sowie das aktuell ausgewaehlte Fenster/Widget. Keywords greifen auf diesen
     Kontext zu, um Operationen gegen die Anwendung gezielt auszufuehren.
+
+    Der Zustand liegt in einer ``ContextVar``: Ohne ``isolated()`` teilen sich
+    alle Threads und Tasks den Wurzelzustand (bisheriges Verhalten). Innerhalb
+    von ``with context.isolated():`` arbeitet ein Thread bzw. asyncio-Task mit
+    eigenem Host, eigener App und eigenem Fenster.
     """
+
+    _adapter = _state_attr("adapter")
+    _adapter_name = _state_attr("adapter_name")
+    _app_model = _state_attr("app_model")
+    _app_name = _state_attr("app_name")
+    _window = _state_attr("window")
+    _adapters = _state_attr("adapters")
+    _adapter_startup = _state_attr("adapter_startup")
+    _apps = _state_attr("apps")
+    _widget_cache = _state_attr("widget_cache")
+    _cache_hits = _state_attr("cache_hits")
+    _cache_misses = _state_attr("cache_misses")
+    _table_indexes = _state_attr("table_indexes")
+    _lock = _state_attr("lock")
+
     def __init__(self):
         """Initialisiert leeren Kontext (kein Adapter, keine App, kein Fenster)."""
-        self._adapter = None
-        self._app_model = None
-        self._app_name = None
-        self._window = None
+        self._root = _ContextState()
+        self._scoped = ContextVar(f"okw4robot_context_{id(self)}", default=None)
+
+    @property
+    def _state(self):
+        return self._scoped.get() or self._root
+
+    # === SCOPE ===
+    @contextmanager
+    def isolated(self):
+        """
+        Eigener, leerer Kontextzustand fuer den aktuellen Thread bzw. asyncio-Task.
+
+        Alle Kontextmethoden wirken innerhalb des ``with``-Blocks nur auf diesen
+        Zustand; danach gilt wieder der vorherige. Ein hier gestarteter Host
+        wird beim Verlassen nicht automatisch gestoppt.
+
+        Beispiel::
+
+            def worker(host):
+                with context.isolated():
+                    HostKeywords().start_host(host)
+                    ...
+        """
+        state = _ContextState()
+        token = self._scoped.set(state)
+        try:
+            yield state
+        finally:
+            self._scoped.reset(token)
+
+    def is_isolated(self) -> bool:
+        """True, wenn der Aufrufer in einem ``isolated()``-Block laeuft."""
+        return self._scoped.get() is not None
 
     # === HOST / ADAPTER ===
-    def set_adapter(self, adapter):
+    def set_adapter(self, adapter, name: str = None, startup_time: float = None):
         """
-        Setzt den aktiven Adapter (z. B. Selenium).
-        Beendet alle bestehenden App- und Fensterkontexte.
+        Setzt den aktiven Adapter (z. B. Selenium) und registriert ihn unter
+        ``name`` (Standard: Klassenname).
+        Beendet den aktuellen App- und Fensterkontext; bereits geladene Apps
+        anderer Hosts bleiben registriert. Ist ``name`` schon registriert, wird
+        der alte Adapter wie bei ``stop_adapter()`` entfernt und seine Apps
+        werden verworfen.
+
+        ``startup_time`` (Sekunden) wird fuer ``adapter_startup_time()`` gemerkt.
         """
-        self._adapter = adapter
-        self._app_model = None
-        self._app_name = None
-        self._window = None
+        with self._lock:
+            name = name or adapter.__class__.__name__
+            if name in self._adapters:
+                self._drop_adapter(name)
+                print(f"[Context] Host '{name}' war bereits gestartet und wurde ersetzt.")
+            self._adapters[name] = adapter
+            if startup_time is not None:
+                self._adapter_startup[name] = startup_time
+            self._activate_adapter(name)
+
+            self.log_info(f"[Context] Adapter '{adapter.__class__.__name__}' wurde gesetzt.")
+            print(f"[Context] Adapter '{adapter.__class__.__name__}' wurde gesetzt.")
+
+    def select_adapter(self, name: str):
+        """
+        Aktiviert einen bereits gestarteten Adapter, ohne ihn neu zu starten.
 
-        self.log_info(f"[Context] Adapter '{adapter.__class__.__name__}' wurde gesetzt.")
-        print(f"[Context] Adapter '{adapter.__class__.__name__}' wurde gesetzt.")
+        ``name`` ist der Registrierungsname (``StartHost``) oder, zur
+        Kompatibilitaet, der Klassenname des Adapters (ohne Gross-/Kleinschreibung).
 
+        Raises:
+        - KeyError: Wenn kein passender Adapter registriert ist.
+        """
+        with self._lock:
+            key = self._find_adapter(name)
+            if key is None:
+                raise KeyError(
+                    f"[Context] Host '{name}' ist nicht gestartet "
+                    f"(gestartet: {', '.join(self._adapters) or '-'})."
+                )
+            if key != self._adapter_name:
+                self._activate_adapter(key)
+            print(f"[Context] Host '{key}' wurde ausgewählt.")
+            return key
 
     def stop_adapter(self):
         """
-        Entfernt den aktiven Adapter (z. B. beim Test-TearDown).
-        Setzt auch App- und Fensterkontext zurück.
+        Entfernt den aktiven Adapter (z. B. beim Test-TearDown).
+        Setzt auch App- und Fensterkontext zurück und verwirft die Apps,
+        die auf diesem Adapter gestartet wurden.
         """
-        if self._adapter is None:
-            raise RuntimeError("[Context] Kein aktiver Adapter zum Stoppen.")
+        with self._lock:
+            if self._adapter is None:
+                raise RuntimeError("[Context] Kein aktiver Adapter zum Stoppen.")
 
-        adapter_name = self._adapter.__class__.__name__
+            adapter_name = self._adapter.__class__.__name__
+            self._drop_adapter(self._adapter_name)
 
-        self._adapter = None
-        self._app_model = None
-        self._app_name = None
-        self._window = None
+            self._adapter = None
+            self._adapter_name = None
+            self._app_model = None
+            self._app_name = None
+            self._window = None
+            self.clear_widget_cache()
 
-        print(f"[Context] Adapter '{adapter_name}' wurde gestoppt.")
+            print(f"[Context] Adapter '{adapter_name}' wurde gestoppt.")
 
     def get_adapter(self):
         """Gibt den aktiven Adapter zurueck.
@@ -60,57 +189,127 @@ class Context(LoggingMixin):
             raise RuntimeError("No host/adapter is active.")
         return self._adapter
 
+    def adapter_startup_time(self, name: str):
+        """Gemessene Startzeit (Sekunden) des Hosts *name* oder ``None``."""
+        key = self._find_adapter(name)
+        return self._adapter_startup.get(key) if key is not None else None
+
+    def adapters(self):
+        """Namen der gestarteten Hosts (Registrierungsreihenfolge)."""
+        return list(self._adapters)
+
+    def _find_adapter(self, name: str):
+        if name in self._adapters:
+            return name
+        lowered = name.lower()
+        for key, adapter in self._adapters.items():
+            if key.lower() == lowered or adapter.__class__.__name__.lower() == lowered:
+                return key
+        return None
+
+    def _drop_adapter(self, key: str):
+        """Entfernt den Host *key* aus der Registry samt seiner Apps."""
+        self._adapters.pop(key, None)
+        self._adapter_startup.pop(key, None)
+        for app_key in [k for k in self._apps if k[0] == key]:
+            del self._apps[app_key]
+
+    def _activate_adapter(self, name: str):
+        self._adapter = self._adapters[name]
+        self._adapter_name = name
+        self._app_model = None
+        self._app_name = None
+        self._window = None
+        self.clear_widget_cache()
+
     # === APP ===
-    def set_app(self, name: str, model: dict):
+    def set_app(self, name: str, model):
         """
-        Setzt den aktuellen App-Kontext.
+        Setzt den aktuellen App-Kontext und registriert die App beim aktiven Host.
         Voraussetzung: Ein Host/Adapter muss bereits aktiv sein.
+
+        ``model`` ist ein ``AppModel`` oder das rohe YAML-Dict der App;
+        ein Dict wird hier einmalig kompiliert.
         """
-        if self._adapter is None:
-            raise RuntimeError(
-                f"[Context] Kein Host aktiv – "
-                f"du musst vorher 'Start Host' ausführen, bevor du 'Start App {name}' aufrufst."
-            )
+        with self._lock:
+            if self._adapter is None:
+                raise RuntimeError(
+                    f"[Context] Kein Host aktiv – "
+                    f"du musst vorher 'Start Host' ausführen, bevor du 'Start App {name}' aufrufst."
+                )
 
-        self._app_name = name
-        self._app_model = model
-        self._window = None
+            if not isinstance(model, AppModel):
+                model = AppModel.compile(name, model)
 
-        print(f"[Context] Anwendung '{name}' wurde gestartet.")
+            self._apps[(self._adapter_name, name)] = model
+            self._app_name = name
+            self._app_model = model
+            self._window = None
+            self.clear_widget_cache()
+
+            print(f"[Context] Anwendung '{name}' wurde gestartet.")
 
     def select_app(self, name: str):
         """
-        Aktiviert eine Anwendung aus dem geladenen App-Kontext.
+        Aktiviert eine bereits gestartete Anwendung, ohne das Modell neu zu laden.
         Erwartet, dass zuvor 'Start App' mit dieser Anwendung aufgerufen wurde.
-        """
-        if self._app_model is None:
-            raise RuntimeError(
-                f"[Context] Keine App aktiv – du musst vorher 'Start App {name}' ausführen."
-            )
-
-        if name != self._app_name:
-            raise ValueError(
-                f"[Context] App-Kontextfehler: Gewünschte App ist '{name}', "
-                f"aber aktuell ist '{self._app_name}' aktiv."
-            )
-
-        self._window = None
-        print(f"[Context] Anwendung '{name}' wurde ausgewählt.")
 
+        Die App-Instanz des aktiven Hosts hat Vorrang. Sonst wird der Host,
+        auf dem die App gestartet wurde, mit aktiviert – aber nur, wenn sie
+        auf genau einem Host laeuft.
+        """
+        with self._lock:
+            if not self._apps:
+                raise RuntimeError(
+                    f"[Context] Keine App aktiv – du musst vorher 'Start App {name}' ausführen."
+                )
+
+            if (self._adapter_name, name) in self._apps:
+                host = self._adapter_name
+            else:
+                hosts = [h for h, app in self._apps if app == name]
+                if not hosts:
+                    raise ValueError(
+                        f"[Context] App-Kontextfehler: Gewünschte App ist '{name}', "
+                        f"gestartet sind: {', '.join(app for _, app in self._apps)}."
+                    )
+                if len(hosts) > 1:
+                    raise ValueError(
+                        f"[Context] App '{name}' laeuft auf mehreren Hosts "
+                        f"({', '.join(hosts)}) – zuerst 'Select Host' ausführen."
+                    )
+                host = hosts[0]
+
+            model = self._apps[(host, name)]
+            if host != self._adapter_name:
+                self._adapter = self._adapters[host]
+                self._adapter_name = host
+            self._app_name = name
+            self._app_model = model
+            self._window = None
+            self.clear_widget_cache()
+            print(f"[Context] Anwendung '{name}' wurde ausgewählt.")
 
     def stop_app(self):
         """
-        Beendet die aktuell aktive App (setzt Modell, Name und Fensterkontext zurück).
+        Beendet die aktuell aktive App (setzt Modell, Name und Fensterkontext zurück)
+        und entfernt sie aus dem App-Register.
         """
-        if self._app_model is None:
-            raise RuntimeError("[Context] Keine App aktiv – kann nichts beenden.")
+        with self._lock:
+            if self._app_model is None:
+                raise RuntimeError("[Context] Keine App aktiv – kann nichts beenden.")
 
-        print(f"[Context] Anwendung '{self._app_name}' wurde beendet.")
+            print(f"[Context] Anwendung '{self._app_name}' wurde beendet.")
 
-        self._app_model = None
-        self._app_name = None
-        self._window = None
+            self._apps.pop((self._adapter_name, self._app_name), None)
+            self._app_model = None
+            self._app_name = None
+            self._window = None
+            self.clear_widget_cache()
 
+    def apps(self):
+        """Gestartete Apps als ``(Host, App)``-Paare (Registrierungsreihenfolge)."""
+        return list(self._apps)
 
     # === WINDOW ===
     def set_window(self, window_name: str):
@@ -121,48 +320,144 @@ class Context(LoggingMixin):
         - Fenster aus App-YAMLs (z.B. LoginDialog)
         - Virtuelle Widgets aus Host-YAMLs (z.B. URL, Maximize Window)
         """
-        if not self._app_model:
-            raise RuntimeError(
-                f"[Context] Kein App- oder Host-Modell geladen – "
-                f"du musst vorher 'Start App' ausführen."
-            )
-
-        if window_name not in self._app_model:
+        with self._lock:
+            if not self._app_model:
+                raise RuntimeError(
+                    f"[Context] Kein App- oder Host-Modell geladen – "
+                    f"du musst vorher 'Start App' ausführen."
+                )
+
+            if window_name not in self._app_model:
+                modell_name = self._app_name or "<Host-Modell>"
+                raise KeyError(
+                    f"[Context] Fenster oder Host-Element '{window_name}' wurde im Modell "
+                    f"'{modell_name}' nicht gefunden."
+                )
+
+            # Im Lazy-Modus wird das Fenster hier beim ersten Auswaehlen geladen
+            self._app_model.window(window_name)
+            self._window = window_name
+            self.clear_widget_cache()
             modell_name = self._app_name or "<Host-Modell>"
-            raise KeyError(
-                f"[Context] Fenster oder Host-Element '{window_name}' wurde im Modell "
-                f"'{modell_name}' nicht gefunden."
-            )
-
-        self._window = window_name
-        modell_name = self._app_name or "<Host-Modell>"
-        print(f"[Context] Fenster/Widget '{window_name}' im Modell '{modell_name}' ausgewählt.")
-
+            print(f"[Context] Fenster/Widget '{window_name}' im Modell '{modell_name}' ausgewählt.")
 
     def get_current_window_model(self):
         """Gibt das Modell des aktuell ausgewaehlten Fensters/Widgets zurueck.
 
         Returns:
-        - Modellobjekt (z.B. dict) des selektierten Fensters/Widgets.
+        - Schreibgeschuetzte Map Widgetname -> ``WidgetSpec`` des selektierten Fensters.
 
         Raises:
         - RuntimeError: Wenn Adapter, App oder Fenster nicht gesetzt sind.
         """
-        if self._adapter is None:
+        state = self._state
+        if state.adapter is None:
+            raise RuntimeError("No adapter available.")
+        if state.app_model is None:
+            raise RuntimeError("No app active.")
+        if state.window is None:
+            raise RuntimeError("No window selected.")
+        return state.app_model.window(state.window)
+
+    def get_widget_spec(self, name: str):
+        """Liefert die ``WidgetSpec`` fuer *name* oder ``None``.
+
+        Suchreihenfolge:
+        1. *name* im aktuell ausgewaehlten Fenster
+        2. Qualifizierter Name ``"Fenster.Widget"`` aus dem Index der App
+           (funktioniert auch ohne ``SelectWindow``)
+
+        Raises:
+        - RuntimeError: Wenn Adapter oder App fehlen, oder kein Fenster
+          ausgewaehlt ist und *name* nicht qualifiziert aufloesbar ist.
+        """
+        state = self._state
+        if state.adapter is None:
             raise RuntimeError("No adapter available.")
-        if self._app_model is None:
+        if state.app_model is None:
             raise RuntimeError("No app active.")
-        if self._window is None:
+        if state.window is not None:
+            spec = state.app_model.lookup(state.window, name)
+            if spec is not None:
+                return spec
+        spec = state.app_model.qualified(name)
+        if spec is None and state.window is None:
             raise RuntimeError("No window selected.")
-        return self._app_model[self._window]
+        return spec
+
+    # === WIDGET CACHE ===
+    def get_cached_widget(self, name: str, factory):
+        """Liefert die Widget-Instanz fuer *name* aus dem Cache.
+
+        Der Cache-Schluessel ist (Adapter, App, Fenster, Name). Bei einem
+        Fehltreffer wird ``factory()`` aufgerufen und das Ergebnis gespeichert.
+        Jeder Wechsel von Adapter, App oder Fenster leert den Cache.
+        ``factory()`` laeuft ausserhalb der Sperre; bei gleichzeitigem Aufbau
+        gewinnt die zuerst gespeicherte Instanz.
+        """
+        state = self._state
+        key = (id(state.adapter), state.app_name, state.window, name)
+        with state.lock:
+            widget = state.widget_cache.get(key)
+            if widget is not None:
+                state.cache_hits += 1
+                return widget
+            state.cache_misses += 1
+        widget = factory()
+        with state.lock:
+            return state.widget_cache.setdefault(key, widget)
+
+    def clear_widget_cache(self):
+        """Verwirft alle gecachten Widget-Instanzen (Zaehler bleiben erhalten).
+
+        Die Tabellen-Indizes haengen an diesen Instanzen und werden mit verworfen.
+        """
+        self._widget_cache.clear()
+        self.clear_table_indexes()
+
+    def widget_cache_stats(self):
+        """Trefferstatistik des Widget-Caches.
+
+        Returns:
+        - dict mit ``hits``, ``misses`` und ``size`` (aktuelle Eintraege).
+        """
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._widget_cache),
+        }
+
+    # === TABELLEN-INDEX ===
+    def get_table_index(self, widget, factory):
+        """Liefert den Tabellen-Index fuer *widget* (Kopfzeile, Zeilenschluessel).
+
+        Bei einem Fehltreffer wird ``factory()`` aufgerufen und das Ergebnis
+        gespeichert. Der Index gilt ueber Polls und Keywords hinweg, bis
+        ``clear_table_indexes()`` (schreibende Keywords) oder ein Kontextwechsel
+        ihn verwirft.
+        """
+        state = self._state
+        with state.lock:
+            entry = state.table_indexes.get(id(widget))
+            if entry is None or entry[0] is not widget:
+                entry = state.table_indexes[id(widget)] = (widget, factory())
+            return entry[1]
+
+    def clear_table_indexes(self):
+        """Verwirft alle Tabellen-Indizes (nach Klick, Eingabe, Auswahl ...)."""
+        self._table_indexes.clear()
 
     # === DIAGNOSTICS ===
     def describe(self):
         """Kurzuebersicht des aktuellen Kontextes fuer Diagnose und Logging."""
         return {
             "adapter": type(self._adapter).__name__ if self._adapter else None,
+            "host": self._adapter_name,
             "app": self._app_name,
-            "window": self._window
+            "hosts": self.adapters(),
+            "apps": self.apps(),
+            "window": self._window,
+            "widget_cache": self.widget_cache_stats(),
         }
 
 context = Context()
@@ -0,0 +1,352 @@
+"""Kompiliertes Objektmodell einer App.
+
+``StartApp`` laedt die YAML-Datei einmal und uebersetzt das App-Modell in eine
+indizierte Struktur, die nach aussen nur lesend zugaenglich ist:
+
+- ``AppModel``: Fenstername -> Fenster (schreibgeschuetzte Map)
+- Fenster: Widgetname -> ``WidgetSpec``
+- ``WidgetSpec``: Klasse, Locator und eingefrorene Optionen eines Widgets
+- Qualifizierter Index: ``"Fenster.Widget"`` -> ``WidgetSpec`` ueber alle Fenster
+- ``WidgetTemplate``: parametrisierte Eintraege wie ``DeleteButton[{row}]``,
+  deren Locator beim Aufloesen von ``DeleteButton[17]`` befuellt wird
+
+Damit kostet das Aufloesen eines Widgets zur Laufzeit genau einen
+Dictionary-Zugriff; ``class``/``locator``/Extras werden nicht bei jedem
+Keyword erneut aus dem YAML-Dict abgeleitet.
+
+Unveraenderlich sind ``WidgetSpec`` und die Widget-Map eines Fensters.
+``AppModel`` selbst fuellt intern nach: im Lazy-Modus die Fenster, dazu den
+qualifizierten Index und die Templates; ``WidgetTemplate`` merkt sich
+erzeugte Specs. Diese Caches sind privat und werden nicht herausgegeben.
+"""
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from string import Formatter
+from types import MappingProxyType
+
+_EMPTY = MappingProxyType({})
+_RESERVED = ("class", "locator")
+_FORMATTER = Formatter()
+# Anzahl gemerkter Specs pro Template (z. B. Zeilen eines Grids)
+_TEMPLATE_CACHE_SIZE = 1024
+
+
+class WidgetSpec(Mapping):
+    """Unveraenderliche Beschreibung eines Widgets aus dem Objektmodell.
+
+    Verhaelt sich lesend wie der urspruengliche YAML-Eintrag (``in``,
+    ``dict(spec)``, ``items()``): Schluessel sind ``class`` und ``locator``
+    (sofern gesetzt) sowie die Optionen.
+    """
+
+    __slots__ = ("name", "class_name", "locator", "options", "_widget_class")
+
+    def __init__(self, name: str, class_name: str | None, locator, options=None):
+        self.name = name
+        self.class_name = class_name
+        self.locator = locator
+        self.options = MappingProxyType(dict(options)) if options else _EMPTY
+        self._widget_class = None
+
+    @classmethod
+    def from_entry(cls, name: str, entry: dict) -> "WidgetSpec":
+        """Erzeugt eine Spec aus einem YAML-Eintrag (``class``, ``locator``, Extras)."""
+        options = {k: v for k, v in entry.items() if k not in _RESERVED}
+        return cls(name, entry.get("class"), entry.get("locator"), options)
+
+    @property
+    def widget_class(self):
+        """Die Widget-Klasse; wird beim ersten Zugriff geladen und gemerkt."""
+        if self._widget_class is None:
+            if not self.class_name:
+                raise KeyError(f"Widget '{self.name}' has no 'class' entry.")
+            from ..utils.loader import load_class
+            self._widget_class = load_class(self.class_name)
+        return self._widget_class
+
+    def create(self, adapter):
+        """Instanziiert das Widget fuer den angegebenen Adapter."""
+        return self.widget_class(adapter, self.locator, **self.options)
+
+    # Lesender Dict-Zugriff wie auf den urspruenglichen YAML-Eintrag
+    def __getitem__(self, key):
+        if key == "class":
+            if self.class_name is None:
+                raise KeyError(key)
+            return self.class_name
+        if key == "locator":
+            if self.locator is None:
+                raise KeyError(key)
+            return self.locator
+        return self.options[key]
+
+    def __iter__(self):
+        if self.class_name is not None:
+            yield "class"
+        if self.locator is not None:
+            yield "locator"
+        yield from self.options
+
+    def __len__(self):
+        return (self.class_name is not None) + (self.locator is not None) + len(self.options)
+
+    def __repr__(self):
+        return f"WidgetSpec({self.name!r}, {self.class_name!r}, {self.locator!r})"
+
+
+class WidgetTemplate:
+    """Parametrisierter Widget-Eintrag, z. B. ``DeleteButton[{row}]``.
+
+    Name und Locator werden beim Kompilieren einmal zerlegt: der Name in einen
+    regulaeren Ausdruck mit benannten Gruppen, der Locator (String, Map oder
+    Liste) in einen Formatter. ``match("DeleteButton[17]")`` liefert eine
+    ``WidgetSpec`` mit befuelltem Locator (``css=#row-17 .delete``).
+    """
+
+    __slots__ = ("name", "base", "class_name", "options", "fields", "_pattern", "_render", "_specs")
+
+    def __init__(self, name: str, class_name: str | None, locator, options=None):
+        self.name = name
+        self.base = template_base(name)
+        self.class_name = class_name
+        self.options = MappingProxyType(dict(options)) if options else _EMPTY
+        pattern, fields = _compile_name(name)
+        self.fields = fields
+        self._pattern = re.compile(pattern, re.DOTALL)
+        self._render = _compile_value(locator)
+        self._specs = {}
+
+    @classmethod
+    def from_entry(cls, name: str, entry: dict) -> "WidgetTemplate":
+        """Erzeugt ein Template aus einem YAML-Eintrag (``class``, ``locator``, Extras)."""
+        options = {k: v for k, v in entry.items() if k not in _RESERVED}
+        return cls(name, entry.get("class"), entry.get("locator"), options)
+
+    def match(self, name: str):
+        """``WidgetSpec`` fuer den konkreten Namen *name* oder ``None``."""
+        spec = self._specs.get(name)
+        if spec is not None:
+            return spec
+        m = self._pattern.fullmatch(name)
+        if m is None:
+            return None
+        spec = WidgetSpec(name, self.class_name, self._render(m.groupdict()), self.options)
+        if len(self._specs) >= _TEMPLATE_CACHE_SIZE:
+            self._specs.clear()
+        self._specs[name] = spec
+        return spec
+
+    def __repr__(self):
+        return f"WidgetTemplate({self.name!r}, {self.class_name!r})"
+
+
+def is_template_name(name) -> bool:
+    """True fuer Namen der Form ``Basis[...{feld}...]``."""
+    return (
+        isinstance(name, str)
+        and name.endswith("]")
+        and "[" in name
+        and "{" in name[name.index("["):]
+    )
+
+
+def template_base(name: str) -> str:
+    """Basisname vor der ersten ``[`` (``DeleteButton[17]`` -> ``DeleteButton``)."""
+    return name.partition("[")[0]
+
+
+def _compile_name(name: str):
+    parts = []
+    fields = []
+    for literal, field, _spec, _conv in _FORMATTER.parse(name):
+        parts.append(re.escape(literal))
+        if field is None:
+            continue
+        if not field.isidentifier():
+            raise ValueError(f"Invalid template field '{{{field}}}' in widget name '{name}'.")
+        if field in fields:
+            parts.append(f"(?P={field})")
+        else:
+            fields.append(field)
+            parts.append(f"(?P<{field}>.+?)")
+    return "".join(parts), tuple(fields)
+
+
+def _compile_value(value):
+    """Uebersetzt einen Locator-Wert in eine Funktion ``params -> Wert``."""
+    if isinstance(value, str):
+        parts = list(_FORMATTER.parse(value))
+        if all(field is None for _, field, _, _ in parts):
+            return lambda params, _v=value: _v
+        return lambda params: "".join(
+            literal if field is None else literal + _format_field(params[field], spec, conv)
+            for literal, field, spec, conv in parts
+        )
+    if isinstance(value, dict):
+        items = [(k, _compile_value(v)) for k, v in value.items()]
+        return lambda params: {k: render(params) for k, render in items}
+    if isinstance(value, list):
+        renders = [_compile_value(v) for v in value]
+        return lambda params: [render(params) for render in renders]
+    return lambda params, _v=value: _v
+
+
+def _format_field(value: str, spec: str, conv):
+    if conv:
+        value = _FORMATTER.convert_field(value, conv)
+    if spec:
+        # Numerische Formate (z. B. {row:03d}) brauchen eine Zahl
+        try:
+            return format(int(value), spec)
+        except ValueError:
+            return format(value, spec)
+    return str(value)
+
+
+class AppModel:
+    """Kompiliertes App-Modell: Fenster sind vorab indiziert (O(1)-Zugriff).
+
+    Im Lazy-Modus (``compile(..., lazy=True)``) wird ein Fenster erst beim
+    ersten Zugriff aus der Quelle (z. B. ``LazyYamlSection``) kompiliert und
+    danach gemerkt. ``_windows``, ``_qualified`` und ``_templates`` sind
+    daher veraenderliche, interne Caches; nach aussen gehen nur die
+    schreibgeschuetzten Fenster-Maps und ``WidgetSpec``-Objekte.
+    """
+
+    __slots__ = ("name", "_windows", "_source", "_qualified", "_templates")
+
+    def __init__(self, name: str, windows: dict, source=None, templates=None):
+        self.name = name
+        self._windows = windows
+        self._source = source
+        # Fenstername -> {Basisname -> [WidgetTemplate, ...]}
+        self._templates = templates if templates is not None else {}
+        self._qualified = {
+            f"{window_name}.{widget_name}": spec
+            for window_name, window in windows.items()
+            for widget_name, spec in window.items()
+        }
+
+    @classmethod
+    def compile(cls, name: str, raw_model, lazy: bool = False) -> "AppModel":
+        """Uebersetzt das rohe YAML-Dict einer App in ein ``AppModel``."""
+        if lazy:
+            return cls(name, {}, raw_model if raw_model is not None else {})
+        windows = {}
+        templates = {}
+        for window_name, window in (raw_model or {}).items():
+            windows[window_name] = compile_window(window)
+            window_templates = compile_templates(window)
+            if window_templates:
+                templates[window_name] = window_templates
+        return cls(name, windows, templates=templates)
+
+    def window(self, window_name: str):
+        """Liefert die Widget-Map eines Fensters (``KeyError`` falls unbekannt)."""
+        window = self._windows.get(window_name)
+        if window is None:
+            if self._source is None:
+                raise KeyError(window_name)
+            raw = self._source[window_name]
+            window = compile_window(raw)
+            window_templates = compile_templates(raw)
+            if window_templates:
+                self._templates[window_name] = window_templates
+            self._windows[window_name] = window
+        return window
+
+    def lookup(self, window_name: str, widget_name: str):
+        """``WidgetSpec`` eines Widgets im Fenster oder ``None``.
+
+        Findet sowohl feste Eintraege als auch Instanzen von Templates
+        (``DeleteButton[17]`` ueber ``DeleteButton[{row}]``).
+        """
+        spec = self.window(window_name).get(widget_name)
+        if spec is not None or not widget_name.endswith("]"):
+            return spec
+        candidates = self._templates.get(window_name, {}).get(template_base(widget_name), ())
+        for template in candidates:
+            spec = template.match(widget_name)
+            if spec is not None:
+                return spec
+        return None
+
+    def templates(self, window_name: str) -> list:
+        """Templates eines (geladenen) Fensters."""
+        self.window(window_name)
+        return [t for group in self._templates.get(window_name, {}).values() for t in group]
+
+    def qualified(self, name: str):
+        """Liefert die ``WidgetSpec`` zu ``"Fenster.Widget"`` oder ``None``.
+
+        Im Lazy-Modus wird das Fenster bei Bedarf geladen; enthaelt der
+        Fenstername selbst Punkte, werden alle Trennstellen geprueft.
+        """
+        spec = self._qualified.get(name)
+        if spec is not None or (self._source is None and not self._templates):
+            return spec
+        pos = name.find(".")
+        while pos > 0:
+            window_name = name[:pos]
+            if window_name in self:
+                widget_name = name[pos + 1:]
+                spec = self.window(window_name).get(widget_name)
+                if spec is not None:
+                    self._qualified[name] = spec
+                    return spec
+                spec = self.lookup(window_name, widget_name)
+                if spec is not None:
+                    return spec
+            pos = name.find(".", pos + 1)
+        return None
+
+    def loaded_windows(self) -> list:
+        """Namen der bereits kompilierten Fenster (Diagnose fuer Lazy-Modus)."""
+        return list(self._windows)
+
+    def __contains__(self, window_name):
+        if window_name in self._windows:
+            return True
+        return self._source is not None and window_name in self._source
+
+    def __getitem__(self, window_name):
+        return self.window(window_name)
+
+    def __iter__(self):
+        return iter(self._source if self._source is not None else self._windows)
+
+    def __len__(self):
+        return len(self._source if self._source is not None else self._windows)
+
+    def keys(self):
+        return list(self)
+
+
+def compile_window(window) -> MappingProxyType:
+    """Uebersetzt ein Fenster (Name -> YAML-Eintrag) in Name -> ``WidgetSpec``.
+
+    Eintraege, die keine Map sind, werden uebersprungen; ein Fenster, das
+    selbst keine Map ist, ergibt ein leeres Fenster. Template-Eintraege
+    (``Name[{feld}]``) landen nicht hier, sondern in ``compile_templates``.
+    """
+    if not isinstance(window, dict):
+        return _EMPTY
+    return MappingProxyType({
+        widget_name: WidgetSpec.from_entry(widget_name, entry)
+        for widget_name, entry in window.items()
+        if isinstance(entry, dict) and not is_template_name(widget_name)
+    })
+
+
+def compile_templates(window) -> dict:
+    """Uebersetzt die Template-Eintraege eines Fensters: Basisname -> [``WidgetTemplate``]."""
+    if not isinstance(window, dict):
+        return {}
+    templates = {}
+    for widget_name, entry in window.items():
+        if isinstance(entry, dict) and is_template_name(widget_name):
+            template = WidgetTemplate.from_entry(widget_name, entry)
+            templates.setdefault(template.base, []).append(template)
+    return templates
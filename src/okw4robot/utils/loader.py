@@ -1,6 +1,85 @@
 import importlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Klassen-Registry: "paket.modul.Klasse" -> Klasse
+_CLASS_CACHE: dict = {}
+_CACHE_LOCK = threading.Lock()
+
 
 def load_class(qualified_name: str):
+    """Laedt eine Klasse ueber ihren voll qualifizierten Namen (memoisiert).
+
+    Nach dem ersten Import wird die Klasse aus der Registry geliefert,
+    ohne ``importlib.import_module`` erneut aufzurufen.
+    """
+    cls = _CLASS_CACHE.get(qualified_name)
+    if cls is not None:
+        return cls
     module_name, class_name = qualified_name.rsplit(".", 1)
     module = importlib.import_module(module_name)
-    return getattr(module, class_name)
\ No newline at end of file
+    cls = getattr(module, class_name)
+    with _CACHE_LOCK:
+        _CLASS_CACHE[qualified_name] = cls
+    return cls
+
+
+def clear_class_cache():
+    """Leert die Klassen-Registry (z. B. fuer Tests oder nach Reload)."""
+    with _CACHE_LOCK:
+        _CLASS_CACHE.clear()
+
+
+def collect_class_names(model) -> set:
+    """Sammelt alle ``class:``-Eintraege aus einem (App-)Modell rekursiv."""
+    found = set()
+    stack = [model]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            cls = node.get("class")
+            if isinstance(cls, str) and "." in cls:
+                found.add(cls)
+            stack.extend(v for v in node.values() if isinstance(v, (dict, list)))
+        elif isinstance(node, list):
+            stack.extend(v for v in node if isinstance(v, (dict, list)))
+    return found
+
+
+def warm_up_classes(qualified_names, max_workers: int = 4):
+    """Importiert alle angegebenen Klassen vorab, modulweise parallel.
+
+    Returns:
+    - ``(timings, errors)``: ``timings`` bildet Modulname -> Importdauer in
+      Sekunden ab, ``errors`` Klassenname -> Exception fuer fehlgeschlagene
+      Importe. Fehler werden nicht geworfen; der betroffene Widget-Aufruf
+      scheitert spaeter wie bisher beim ersten Zugriff.
+    """
+    by_module: dict = {}
+    for qn in qualified_names:
+        if qn in _CLASS_CACHE:
+            continue
+        by_module.setdefault(qn.rsplit(".", 1)[0], []).append(qn)
+
+    timings: dict = {}
+    errors: dict = {}
+
+    def _import(module_name):
+        start = time.perf_counter()
+        failed = {}
+        for qn in by_module[module_name]:
+            try:
+                load_class(qn)
+            except Exception as e:
+                failed[qn] = e
+        return module_name, time.perf_counter() - start, failed
+
+    if not by_module:
+        return timings, errors
+    workers = max(1, min(max_workers, len(by_module)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="okw-warmup") as pool:
+        for module_name, elapsed, failed in pool.map(_import, sorted(by_module)):
+            timings[module_name] = elapsed
+            errors.update(failed)
+    return timings, errors
@@ -0,0 +1,146 @@
+"""Precompiled matchers for Verify loops.
+
+``compile_matcher(expected, mode)`` turns an expected value into a callable
+``matcher(actual) -> bool`` with exactly the semantics of
+``okw_contract_utils.is_match`` (EXACT / WCM via ``fnmatch`` / REGX via
+``re.search`` + MULTILINE). ``compile_wcm_cell_matcher(pattern)`` does the
+same for table cells (``*``/``?`` wildcards, full match, DOTALL).
+
+Both are backed by a bounded LRU cache, so a pattern is compiled once and
+reused across poll iterations and table cells. Patterns without wildcards
+or regex metacharacters take a fast path (``==``, ``startswith``,
+``endswith``, ``in``) instead of the regex engine.
+"""
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+from functools import lru_cache
+
+from okw_contract_utils import MatchMode
+from okw_contract_utils.text import normalize_newlines
+
+_CACHE_SIZE = 512
+_FNMATCH_SPECIAL = frozenset("*?[")
+
+
+def _normalize(text) -> str:
+    if not text:
+        return ""
+    if "\r" in text:
+        return normalize_newlines(text)
+    return text
+
+
+def _literal_split(pattern: str, special: frozenset, star: str = "*"):
+    """Classify *pattern* as literal / prefix / suffix / contains.
+
+    Returns ``(kind, literal)`` or ``None`` if the pattern needs the regex engine.
+    """
+    core = pattern
+    lead = core.startswith(star)
+    trail = core.endswith(star) and len(core) > 1
+    if lead:
+        core = core[1:]
+    if trail:
+        core = core[:-1]
+    if any(ch in special for ch in core):
+        return None
+    if lead and trail:
+        return "contains", core
+    if lead:
+        return "suffix", core
+    if trail:
+        return "prefix", core
+    return "literal", core
+
+
+class Matcher:
+    """Compiled ``expected``/``mode`` pair; call it with the actual value."""
+
+    __slots__ = ("expected", "mode", "kind", "error", "_test")
+
+    def __init__(self, expected: str, mode: MatchMode, kind: str, test, error: str | None = None):
+        self.expected = expected
+        self.mode = mode
+        self.kind = kind
+        self.error = error
+        self._test = test
+
+    def __call__(self, actual) -> bool:
+        return self._test(actual)
+
+    def __repr__(self):
+        return f"Matcher({self.expected!r}, {self.mode}, kind={self.kind!r})"
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def compile_matcher(expected: str, mode: MatchMode) -> Matcher:
+    """Compile *expected* for *mode* (cached); same result as ``is_match(...).ok``."""
+    e = _normalize(expected)
+
+    if mode == MatchMode.EXACT:
+        return Matcher(expected, mode, "literal", lambda a: _normalize(a) == e)
+
+    if mode == MatchMode.WCM:
+        normcase = os.path.normcase
+        pat = normcase(e)
+        plain = _literal_split(pat, _FNMATCH_SPECIAL)
+        if plain is not None:
+            kind, lit = plain
+            if kind == "literal":
+                test = lambda a: normcase(_normalize(a)) == lit
+            elif kind == "prefix":
+                test = lambda a: normcase(_normalize(a)).startswith(lit)
+            elif kind == "suffix":
+                test = lambda a: normcase(_normalize(a)).endswith(lit)
+            else:
+                test = lambda a: lit in normcase(_normalize(a))
+            return Matcher(expected, mode, kind, test)
+        rx = re.compile(fnmatch.translate(pat))
+        return Matcher(expected, mode, "regex", lambda a: rx.match(normcase(_normalize(a))) is not None)
+
+    if mode == MatchMode.REGX:
+        if re.escape(e) == e:
+            return Matcher(expected, mode, "contains", lambda a: e in _normalize(a))
+        try:
+            rx = re.compile(e, re.MULTILINE)
+        except re.error as ex:
+            return Matcher(expected, mode, "invalid", lambda a: False,
+                           f"Invalid REGX pattern: {e!r}. Regex error: {ex}")
+        return Matcher(expected, mode, "regex", lambda a: rx.search(_normalize(a)) is not None)
+
+    return Matcher(expected, mode, "invalid", lambda a: False, f"Unsupported match mode: {mode}")
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def compile_wcm_cell_matcher(pattern):
+    """Compile a table-cell wildcard pattern (cached).
+
+    Same result as ``re.match(compile_wcm_to_regex(pattern), actual or "", re.DOTALL)``:
+    full match, ``*`` any sequence, ``?`` one character; like ``$`` the match
+    also accepts a single trailing newline. ``None`` matches only "".
+    """
+    if pattern is None:
+        return lambda a: a == ""
+    pattern = str(pattern)
+    plain = _literal_split(pattern, frozenset("*?"))
+    if plain is not None:
+        kind, lit = plain
+        if kind == "literal":
+            return lambda a: (a or "") == lit or (a or "") == lit + "\n"
+        if kind == "prefix":
+            return lambda a: (a or "").startswith(lit)
+        if kind == "suffix":
+            return lambda a: (a or "").endswith(lit) or (a or "").endswith(lit + "\n")
+        return lambda a: lit in (a or "")
+    from .table_tokens import compile_wcm_to_regex
+    rx = re.compile(compile_wcm_to_regex(pattern), re.DOTALL)
+    return lambda a: rx.match(a or "") is not None
+
+
+def clear_matcher_cache():
+    """Drop all cached compiled patterns."""
+    compile_matcher.cache_clear()
+    compile_wcm_cell_matcher.cache_clear()
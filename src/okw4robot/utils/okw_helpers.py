@@ -5,18 +5,33 @@ Wraps okw-contract-utils tokens, matchers and timeout/polling helpers.
 """
 from __future__ import annotations
 
+import re
+import time
+from contextvars import ContextVar
+
 from okw_contract_utils.tokens import is_ignore, is_empty_token, is_delete_token
 from okw_contract_utils import MatchMode, assert_match
 
+from . import robot_vars
 
-def blank_ignore_enabled() -> bool:
-    """Return True if ${OKW_IGNORE_EMPTY}=YES is set in the Robot context."""
+
+def get_robot_flag(var_name: str, default: bool = False) -> bool:
+    """Read a YES/NO switch from the Robot context (YES/TRUE/1 → True)."""
+    return robot_vars.cached(("flag", var_name, default), lambda: _read_flag(var_name, default))
+
+
+def _read_flag(var_name: str, default: bool) -> bool:
     try:
         from robot.libraries.BuiltIn import BuiltIn
-        val = BuiltIn().get_variable_value("${OKW_IGNORE_EMPTY}", default="NO")
+        val = BuiltIn().get_variable_value(var_name, default="YES" if default else "NO")
         return str(val).strip().upper() in ("YES", "TRUE", "1")
     except Exception:
-        return False
+        return default
+
+
+def blank_ignore_enabled() -> bool:
+    """Return True if ${OKW_IGNORE_EMPTY}=YES is set in the Robot context."""
+    return get_robot_flag("${OKW_IGNORE_EMPTY}")
 
 
 def should_ignore(value: object) -> bool:
@@ -62,10 +77,19 @@ def is_delete(value: object) -> bool:
 
 def get_robot_timeout(var_name: str, default_seconds: float) -> float:
     """Read a timeout variable from the Robot context, returning seconds as float."""
+    return robot_vars.cached(
+        ("timeout", var_name, default_seconds), lambda: _read_timeout(var_name, default_seconds)
+    )
+
+
+def _read_timeout(var_name: str, default_seconds: float) -> float:
     try:
         from robot.libraries.BuiltIn import BuiltIn
         to = BuiltIn().get_variable_value(var_name, default=default_seconds)
-        return float(to) if isinstance(to, (int, float)) else BuiltIn().convert_time(str(to))
+        if isinstance(to, (int, float)):
+            return float(to)
+        from robot.utils import timestr_to_secs
+        return float(timestr_to_secs(str(to)))
     except Exception:
         return float(default_seconds)
 
@@ -89,23 +113,197 @@ def resolve_widget(name: str):
     """Resolve a logical widget name to a widget instance using the current context.
 
     Looks up *name* in the current window model, loads the widget class and
-    returns an instantiated widget bound to the active adapter.
+    returns an instantiated widget bound to the active adapter. A qualified
+    name ``"Window.Widget"`` addresses a widget of any window of the active
+    app without ``SelectWindow``; the current window still wins. Instances are
+    cached per (adapter, app, window, name) in the ``Context``; the cache is
+    invalidated whenever adapter, app or window change.
 
     Raises:
     - ``RuntimeError``: if no adapter/app/window is active.
-    - ``KeyError``: if *name* is not found in the current window model.
+    - ``KeyError``: if *name* is neither found in the current window model
+      nor as a qualified ``"Window.Widget"`` name.
     """
     from ..runtime.context import context
-    from ..utils.loader import load_class
 
-    model = context.get_current_window_model()
-    if name not in model:
+    return context.get_cached_widget(name, lambda: _build_widget(name))
+
+
+def _build_widget(name: str):
+    """Instantiate the widget for *name* from the current window model (uncached)."""
+    from ..runtime.context import context
+
+    spec = context.get_widget_spec(name)
+    if spec is None:
         raise KeyError(f"Widget '{name}' not found in current window.")
-    entry = model[name]
-    widget_class = load_class(entry["class"])
-    adapter = context.get_adapter()
-    extras = {k: v for k, v in entry.items() if k not in ("class", "locator")}
-    return widget_class(adapter, entry.get("locator"), **extras)
+    return spec.create(context.get_adapter())
+
+
+def wait_natively(widget, condition: str, expected, timeout: float, mode=None, args=()):
+    """Let *widget* wait for *condition* itself if it advertises it.
+
+    Returns:
+    - ``True``/``False`` from ``widget.okw_wait_until()`` (reached / timed out).
+    - ``None`` if the widget cannot wait natively for *condition* (caller polls).
+    """
+    if widget is None or condition not in getattr(widget, "okw_wait_conditions", ()):
+        return None
+    try:
+        return bool(widget.okw_wait_until(condition, expected, timeout, mode=mode, args=args))
+    except NotImplementedError:
+        return None
+
+
+# Errors that no amount of polling can fix: abort verify loops immediately.
+# TypeError/AttributeError/NameError are bugs in driver or test code.
+_PERMANENT_ERRORS = (NotImplementedError, re.error, ConnectionError, TypeError, AttributeError, NameError)
+
+
+def is_permanent_error(error: BaseException, widget=None) -> bool:
+    """Return True if *error* will not go away by polling again.
+
+    Permanent: ``NotImplementedError`` (unsupported method), ``re.error``
+    (pattern compile error), ``ConnectionError`` (adapter disconnected),
+    ``TypeError``/``AttributeError``/``NameError`` (programming errors),
+    ``OkwPermanentError``, and anything the widget/adapter hook
+    ``okw_is_permanent_error(error)`` classifies as permanent. Everything
+    else (element not yet present, stale reference, ...) is transient.
+    """
+    from ..widgets.okw_widget import OkwPermanentError
+
+    if isinstance(error, _PERMANENT_ERRORS + (OkwPermanentError,)):
+        return True
+    hook = getattr(widget, "okw_is_permanent_error", None)
+    if hook is None:
+        hook = getattr(getattr(widget, "adapter", None), "okw_is_permanent_error", None)
+    if not callable(hook):
+        return False
+    try:
+        return bool(hook(error))
+    except Exception:
+        return False
+
+
+class PollResult:
+    """Outcome and statistics of one ``poll_until()`` call.
+
+    Attributes:
+        ok: True if the condition was met before the deadline.
+        value: Last value returned by the probe.
+        iterations: Number of probe calls.
+        errors: Number of probe calls that raised a transient error.
+        adapter_time: Seconds spent inside the probe (adapter calls).
+        sleep_time: Seconds spent sleeping between probes.
+        elapsed: Total seconds of the call.
+    """
+
+    __slots__ = ("ok", "value", "iterations", "errors", "adapter_time", "sleep_time", "elapsed")
+
+    def __init__(self, ok, value, iterations, adapter_time, sleep_time, elapsed, errors=0):
+        self.ok = ok
+        self.value = value
+        self.iterations = iterations
+        self.errors = errors
+        self.adapter_time = adapter_time
+        self.sleep_time = sleep_time
+        self.elapsed = elapsed
+
+    def __bool__(self):
+        return bool(self.ok)
+
+    def __repr__(self):
+        return (
+            f"PollResult(ok={self.ok}, iterations={self.iterations}, errors={self.errors}, "
+            f"adapter_time={self.adapter_time:.3f}, sleep_time={self.sleep_time:.3f}, "
+            f"elapsed={self.elapsed:.3f})"
+        )
+
+
+# None = time.monotonic / time.sleep, looked up per call
+_clock = None
+_sleep = None
+_last_poll: ContextVar = ContextVar("okw_last_poll", default=None)
+
+
+def set_poll_clock(clock=None, sleep=None) -> None:
+    """Replace the clock/sleeper used by ``poll_until()`` (``None`` restores the default).
+
+    Defaults are ``time.monotonic`` and ``time.sleep``; benchmarks and tests
+    can inject a simulated clock.
+    """
+    global _clock, _sleep
+    _clock = clock
+    _sleep = sleep
+
+
+def last_poll_result() -> PollResult | None:
+    """Return the ``PollResult`` of the most recent ``poll_until()`` call in this context."""
+    return _last_poll.get()
+
+
+def poll_until(probe, accept, timeout: float, widget=None, clock=None, sleep=None) -> PollResult:
+    """Call ``probe()`` until ``accept(value)`` is true or *timeout* seconds have passed.
+
+    The probe runs at least once, so a zero timeout means exactly one check.
+    Delays between probes come from the poll strategy of *widget* (see
+    ``polling.poll_delays``) and never extend past the deadline. All timing
+    uses a monotonic clock.
+
+    Exceptions raised by the probe are classified with ``is_permanent_error``:
+    permanent ones propagate immediately, transient ones count as "not yet"
+    and polling continues. If the last probe before the deadline failed, its
+    exception is raised.
+
+    Args:
+        probe: Zero-argument callable reading the current state.
+        accept: Callable deciding whether a probed value satisfies the check.
+        timeout: Maximum seconds to poll.
+        widget: Optional widget whose ``poll:`` option selects the poll strategy.
+        clock, sleep: Override the clock/sleeper for this call (see ``set_poll_clock``).
+
+    Returns:
+        ``PollResult`` (truthy if accepted) with the last value and statistics;
+        also available via ``last_poll_result()``.
+    """
+    from .polling import poll_delays
+
+    clock = clock or _clock or time.monotonic
+    sleep = sleep or _sleep or time.sleep
+    delays = poll_delays(widget)
+    start = clock()
+    end = start + max(0.0, float(timeout))
+    iterations = 0
+    errors = 0
+    adapter_time = 0.0
+    sleep_time = 0.0
+    value = None
+    while True:
+        t0 = clock()
+        try:
+            value = probe()
+            error = None
+        except Exception as exc:
+            if is_permanent_error(exc, widget):
+                raise
+            error = exc
+            errors += 1
+        t1 = clock()
+        iterations += 1
+        adapter_time += t1 - t0
+        ok = error is None and bool(accept(value))
+        if ok:
+            break
+        remaining = end - clock()
+        if remaining <= 0:
+            break
+        t0 = clock()
+        sleep(min(next(delays), remaining))
+        sleep_time += clock() - t0
+    result = PollResult(ok, value, iterations, adapter_time, sleep_time, clock() - start, errors)
+    _last_poll.set(result)
+    if error is not None:
+        raise error
+    return result
 
 
 def verify_yes_no_poll(
@@ -114,6 +312,8 @@ def verify_yes_no_poll(
     timeout_var: str,
     default_timeout: float,
     context_label: str,
+    widget=None,
+    condition: str | None = None,
 ) -> None:
     """Poll a boolean predicate until it matches a YES/NO expectation or timeout.
 
@@ -123,23 +323,25 @@ def verify_yes_no_poll(
         timeout_var: Robot variable name for the timeout (e.g. ``"${OKW_TIMEOUT_VERIFY_EXIST}"``).
         default_timeout: Default timeout in seconds.
         context_label: Prepended to assertion error messages.
+        widget: Optional widget whose ``poll:`` option selects the poll strategy.
+        condition: Optional condition name for ``widget.okw_wait_until()``
+            (e.g. ``"exists"``); used instead of polling if the widget supports it.
     """
-    import time
-    from okw_contract_utils.tokens import parse_yes_no, assert_exists
+    from okw_contract_utils.tokens import parse_yes_no, assert_exists, OkwYesNo
 
     yn = parse_yes_no(expected)
     timeout = get_robot_timeout(timeout_var, default_timeout)
-    poll = get_robot_poll()
-    end = time.monotonic() + timeout
-    last = False
-    while True:
-        last = bool(get_actual_bool())
-        from okw_contract_utils.tokens import OkwYesNo
-        if (yn == OkwYesNo.YES and last) or (yn == OkwYesNo.NO and not last):
+    if condition is not None:
+        reached = wait_natively(widget, condition, yn == OkwYesNo.YES, timeout)
+        if reached:
             return
-        if time.monotonic() >= end:
-            break
-        time.sleep(poll)
+        if reached is not None:
+            timeout = 0.0  # one final read for the assertion message
+    want = yn == OkwYesNo.YES
+    result = poll_until(lambda: bool(get_actual_bool()), lambda v: v == want, timeout, widget=widget)
+    if result.ok:
+        return
+    last = result.value
     assert_exists(last, yn, context=context_label)
 
 
@@ -149,6 +351,9 @@ def verify_with_timeout(
     mode: MatchMode,
     timeout_s: float,
     context_label: str,
+    widget=None,
+    condition: str | None = None,
+    args: tuple = (),
 ) -> None:
     """Poll *get_actual()* until it matches *expected* using *mode*, or timeout.
 
@@ -158,20 +363,173 @@ def verify_with_timeout(
         mode: ``MatchMode.EXACT``, ``MatchMode.WCM`` or ``MatchMode.REGX``.
         timeout_s: Maximum seconds to poll.
         context_label: Prepended to assertion error messages (e.g. ``"[VerifyValue] 'Username'"``)
+        widget: Optional widget whose ``poll:`` option selects the poll strategy.
+            Defaults to the owner of *get_actual* if it is a bound method.
+        condition: Optional condition name for ``widget.okw_wait_until()``
+            (e.g. ``"value"``); used instead of polling if the widget supports it.
+        args: Extra arguments of the condition (e.g. the attribute name).
     """
-    import time
-    from okw_contract_utils import is_match
+    from .matchers import compile_matcher
 
-    poll = get_robot_poll()
-    end = time.monotonic() + timeout_s
-    last_actual: str = ""
-    while True:
-        last_actual = get_actual() or ""
-        result = is_match(last_actual, expected, mode)
-        if result.ok:
+    if widget is None:
+        widget = getattr(get_actual, "__self__", None)
+    if condition is not None:
+        reached = wait_natively(widget, condition, expected, timeout_s, mode=mode, args=args)
+        if reached:
             return
-        if time.monotonic() >= end:
-            break
-        time.sleep(poll)
+        if reached is not None:
+            timeout_s = 0.0  # one final read for the assertion message
+    matches = compile_matcher(expected, mode)
+    if matches.error:
+        # Invalid pattern: polling cannot help, fail with the real cause now
+        assert_match(get_actual() or "", expected, mode, context=context_label)
+    result = poll_until(lambda: get_actual() or "", matches, timeout_s, widget=widget)
+    if result.ok:
+        return
+    last_actual: str = result.value
     # Raise the final mismatch as an assertion error
     assert_match(last_actual, expected, mode, context=context_label)
+
+
+def parse_name_value_pairs(values) -> list:
+    """Normalise bulk keyword input to a list of ``(name, value)`` pairs.
+
+    Accepted forms:
+    - dict / Robot ``&{dict}``: ``{"Username": "admin", "Role": "User"}``
+    - list of pairs: ``[("Username", "admin"), ("Role", "User")]``
+    - flat list / Robot ``@{list}``: ``["Username", "admin", "Role", "User"]``
+    - token string like the table patterns: ``Username$TABadmin$LFRole$TABUser``
+      (separators ``${OKW_TABLE_CELL_SEP_TOKEN}`` / ``${OKW_TABLE_ROW_SEP_TOKEN}``,
+      backslash escapes a token)
+
+    Values are returned unchanged; tokens such as ``$EMPTY`` and ``$IGNORE``
+    are left to the calling keyword.
+
+    Raises:
+    - ``ValueError``: if the input cannot be split into pairs.
+    """
+    if hasattr(values, "items"):
+        return [(str(k), v) for k, v in values.items()]
+    if isinstance(values, str):
+        from .table_tokens import parse_pairs_pattern
+
+        rows = parse_pairs_pattern(values)
+        bad = [row for row in rows if len(row) != 2]
+        if bad:
+            raise ValueError(f"Expected 'name<cell separator>value' per row, got {bad[0]!r}")
+        return [(str(n), v) for n, v in rows]
+    items = list(values or ())
+    if all(isinstance(i, (tuple, list)) and len(i) == 2 for i in items):
+        return [(str(n), v) for n, v in items]
+    if len(items) % 2:
+        raise ValueError(f"Expected name/value pairs, got an odd number of items ({len(items)})")
+    return [(str(items[i]), items[i + 1]) for i in range(0, len(items), 2)]
+
+
+def verify_values_with_timeout(fields, mode: MatchMode, timeout_s: float, context_label: str) -> None:
+    """Poll several widget values together against one shared deadline.
+
+    Every round reads only the fields that have not matched yet; matched
+    fields are dropped. The worst-case time is therefore the slowest field,
+    not the sum of all fields. On timeout all remaining mismatches are
+    reported in one ``AssertionError``.
+
+    Like ``VerifyValue``, fields whose widget can wait natively for ``value``
+    (``okw_wait_until``) do so first, each with what is left of the shared
+    deadline. The remaining fields are polled with the widgets' ``poll:``
+    strategy if they all use the same one, otherwise with the global
+    strategy (``${OKW_POLL_STRATEGY}``).
+
+    Args:
+        fields: ``(name, widget, expected)`` triples; ``widget.okw_get_value()``
+            is read.
+        mode: ``MatchMode.EXACT``, ``MatchMode.WCM`` or ``MatchMode.REGX``.
+        timeout_s: Shared timeout in seconds.
+        context_label: Prepended to the assertion error message.
+    """
+    from okw_contract_utils import OkwAssertionError, is_match
+    from .matchers import compile_matcher
+    from .polling import get_poll_strategy
+
+    pending = {}
+    invalid = []
+    for idx, (name, widget, expected) in enumerate(fields):
+        matcher = compile_matcher(expected, mode)
+        if matcher.error:
+            invalid.append(f"'{name}': {matcher.error}")
+        pending[idx] = (name, widget, expected, matcher)
+    if invalid:
+        raise OkwAssertionError(f"{context_label}\n" + "\n".join(invalid))
+
+    last = {}
+    failed = {}
+
+    def probe():
+        for idx in list(pending):
+            name, widget, _, matcher = pending[idx]
+            try:
+                actual = widget.okw_get_value() or ""
+            except Exception as e:
+                if is_permanent_error(e, widget):
+                    raise
+                failed[idx] = e
+                continue
+            failed.pop(idx, None)
+            last[idx] = actual
+            if matcher(actual):
+                del pending[idx]
+        return len(pending)
+
+    clock = _clock or time.monotonic
+    end = clock() + max(0.0, float(timeout_s))
+    for idx in list(pending):
+        name, widget, expected, _ = pending[idx]
+        if wait_natively(widget, "value", expected, max(0.0, end - clock()), mode=mode):
+            del pending[idx]
+    if not pending:
+        return
+
+    widgets = [widget for _, widget, _, _ in pending.values()]
+    strategy = get_poll_strategy(widgets[0])
+    poll_widget = widgets[0] if all(get_poll_strategy(w) == strategy for w in widgets[1:]) else None
+    if poll_until(probe, lambda left: left == 0, max(0.0, end - clock()), widget=poll_widget).ok:
+        return
+    lines = []
+    for idx, (name, _, expected, _) in pending.items():
+        if idx in failed:
+            e = failed[idx]
+            lines.append(f"'{name}': {type(e).__name__}: {e}")
+        else:
+            lines.append(f"'{name}': {is_match(last[idx], expected, mode).message}")
+    raise OkwAssertionError(
+        f"{context_label} {len(pending)} of {len(fields)} field(s) did not match:\n" + "\n".join(lines)
+    )
+
+
+def wait_for_first(conditions, timeout_s: float):
+    """Poll several boolean conditions in one loop; return the first that holds.
+
+    Every round evaluates the conditions in the given order, so earlier
+    entries win when several become true at the same time. Transient read
+    errors count as "not yet"; permanent ones (see ``is_permanent_error``)
+    are raised immediately.
+
+    Args:
+        conditions: ``(label, widget, predicate)`` triples; *predicate* is a
+            zero-argument callable returning bool.
+        timeout_s: Shared timeout in seconds.
+
+    Returns:
+        The label of the first condition that became true, or ``None`` on timeout.
+    """
+    def probe():
+        for label, widget, predicate in conditions:
+            try:
+                if predicate():
+                    return label
+            except Exception as e:
+                if is_permanent_error(e, widget):
+                    raise
+        return None
+
+    return poll_until(probe, lambda label: label is not None, timeout_s).value
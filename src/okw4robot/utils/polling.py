@@ -0,0 +1,210 @@
+"""Polling strategies for Verify/Wait loops.
+
+A strategy yields the delays between two checks of a polling loop. Which
+strategy is used is configured globally via ``${OKW_POLL_STRATEGY}`` (see
+``SetOKWParameter    PollStrategy``) or per widget with a ``poll:`` entry in
+the locator YAML; the widget entry wins.
+
+Strategies (names are case-insensitive):
+
+- ``FIXED``: constant interval ``${OKW_POLL_VERIFY}`` (default, previous behaviour)
+- ``BACKOFF``: exponential backoff ``initial * factor**n``, capped at ``max``
+- ``JITTER``: constant interval with random +/- ``jitter`` share
+- ``FASTFIRST``: ``count`` quick checks every ``fast`` seconds, then ``interval``
+
+Parameters are given as ``NAME:key=value,...`` or as a YAML map::
+
+    ${OKW_POLL_STRATEGY}    BACKOFF:initial=0.05,factor=2,max=1
+
+    Status:
+      class: ...
+      locator: ...
+      poll: { strategy: fastfirst, fast: 0.02, count: 5 }
+
+Every strategy accepts ``jitter=<share>`` to randomize its delays.
+"""
+from __future__ import annotations
+
+import random
+from functools import lru_cache
+from itertools import repeat
+
+from .robot_vars import get_variable
+
+_DEFAULT_INTERVAL = 0.1
+
+
+class PollStrategy:
+    """Base class: ``delays()`` returns a fresh, endless iterator of delays (seconds)."""
+
+    name = "base"
+
+    def delays(self):
+        raise NotImplementedError
+
+    def __repr__(self):
+        params = ", ".join(f"{k}={v!r}" for k, v in vars(self).items() if not k.startswith("_"))
+        return f"{type(self).__name__}({params})"
+
+    def __eq__(self, other):
+        return type(self) is type(other) and vars(self) == vars(other)
+
+    def __hash__(self):
+        return hash((type(self), tuple(sorted(vars(self).items()))))
+
+
+class FixedPoll(PollStrategy):
+    """Constant interval between checks."""
+
+    name = "fixed"
+
+    def __init__(self, interval: float = _DEFAULT_INTERVAL):
+        self.interval = max(0.0, float(interval))
+
+    def delays(self):
+        return repeat(self.interval)
+
+
+class BackoffPoll(PollStrategy):
+    """Exponential backoff: ``initial``, ``initial*factor``, ... capped at ``max_interval``."""
+
+    name = "backoff"
+
+    def __init__(self, initial: float = 0.05, factor: float = 2.0, max_interval: float = 1.0):
+        self.initial = max(0.0, float(initial))
+        self.factor = max(1.0, float(factor))
+        self.max_interval = max(self.initial, float(max_interval))
+
+    def delays(self):
+        delay = self.initial
+        while delay < self.max_interval:
+            yield delay
+            delay *= self.factor
+            if delay == 0.0:
+                break
+        yield from repeat(self.max_interval)
+
+
+class FastFirstPoll(PollStrategy):
+    """``count`` rapid checks every ``fast`` seconds, then every ``interval`` seconds."""
+
+    name = "fastfirst"
+
+    def __init__(self, fast: float = 0.02, count: int = 5, interval: float = _DEFAULT_INTERVAL):
+        self.fast = max(0.0, float(fast))
+        self.count = max(0, int(count))
+        self.interval = max(0.0, float(interval))
+
+    def delays(self):
+        for _ in range(self.count):
+            yield self.fast
+        yield from repeat(self.interval)
+
+
+class JitterPoll(PollStrategy):
+    """Randomizes the delays of ``inner`` by +/- ``ratio`` (0..1)."""
+
+    name = "jitter"
+
+    def __init__(self, inner: PollStrategy, ratio: float = 0.5, rng=None):
+        self.inner = inner
+        self.ratio = min(1.0, max(0.0, float(ratio)))
+        self._rng = rng or random.Random()
+
+    def delays(self):
+        uniform = self._rng.uniform
+        low, high = 1.0 - self.ratio, 1.0 + self.ratio
+        for delay in self.inner.delays():
+            yield delay * uniform(low, high)
+
+
+# Accepted parameter names per strategy (aliases -> constructor argument)
+_PARAMS = {
+    "fixed": {"interval": "interval"},
+    "backoff": {"initial": "initial", "factor": "factor", "max": "max_interval", "cap": "max_interval"},
+    "fastfirst": {"fast": "fast", "count": "count", "interval": "interval"},
+    "jitter": {"interval": "interval"},
+}
+
+
+def build_strategy(name: str, params: dict | None = None, interval: float = _DEFAULT_INTERVAL) -> PollStrategy:
+    """Create a strategy from its name and parameters.
+
+    *interval* is the base interval (``${OKW_POLL_VERIFY}``) used by
+    ``FIXED``, ``JITTER`` and the slow phase of ``FASTFIRST``.
+
+    Raises:
+    - ``ValueError``: for unknown strategies or parameters.
+    """
+    key = str(name or "fixed").strip().lower().replace("_", "").replace("-", "")
+    if key not in _PARAMS:
+        raise ValueError(
+            f"Unknown poll strategy '{name}' (expected one of: FIXED, BACKOFF, JITTER, FASTFIRST)."
+        )
+    params = {str(k).strip().lower(): v for k, v in (params or {}).items()}
+    jitter = params.pop("jitter", None)
+    kwargs = {}
+    for param, value in params.items():
+        if param not in _PARAMS[key]:
+            raise ValueError(f"Unknown parameter '{param}' for poll strategy '{name}'.")
+        kwargs[_PARAMS[key][param]] = value
+
+    if key == "backoff":
+        strategy = BackoffPoll(**kwargs)
+    elif key == "fastfirst":
+        kwargs.setdefault("interval", interval)
+        strategy = FastFirstPoll(**kwargs)
+    else:
+        strategy = FixedPoll(kwargs.get("interval", interval))
+        if key == "jitter" and jitter is None:
+            jitter = 0.5
+    if jitter is not None and float(jitter) > 0:
+        strategy = JitterPoll(strategy, float(jitter))
+    return strategy
+
+
+def parse_strategy(spec, interval: float = _DEFAULT_INTERVAL) -> PollStrategy:
+    """Parse a strategy from a string (``NAME:k=v,...``), a map or a strategy object."""
+    if isinstance(spec, PollStrategy):
+        return spec
+    if isinstance(spec, dict):
+        params = dict(spec)
+        name = params.pop("strategy", "fixed")
+        return build_strategy(name, params, interval)
+    return _parse_string(str(spec or "fixed"), float(interval))
+
+
+@lru_cache(maxsize=64)
+def _parse_string(spec: str, interval: float) -> PollStrategy:
+    name, _, rest = spec.partition(":")
+    params = {}
+    for item in rest.split(","):
+        if not item.strip():
+            continue
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"Invalid poll strategy parameter '{item.strip()}' (expected key=value).")
+        params[key.strip()] = value.strip()
+    return build_strategy(name, params, interval)
+
+
+def get_poll_strategy(widget=None) -> PollStrategy:
+    """Strategy for a verify loop: widget ``poll:`` option, else ``${OKW_POLL_STRATEGY}``.
+
+    Without any configuration this is ``FixedPoll(${OKW_POLL_VERIFY})``.
+    """
+    from .okw_helpers import get_robot_poll
+
+    interval = get_robot_poll()
+    options = getattr(widget, "options", None) or {}
+    spec = options.get("poll") if hasattr(options, "get") else None
+    if spec is None:
+        spec = get_variable("${OKW_POLL_STRATEGY}")
+    if spec is None:
+        return FixedPoll(interval)
+    return parse_strategy(spec, interval)
+
+
+def poll_delays(widget=None):
+    """Fresh delay iterator for one verify loop (see ``get_poll_strategy``)."""
+    return get_poll_strategy(widget).delays()
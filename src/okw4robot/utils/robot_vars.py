@@ -0,0 +1,130 @@
+"""Snapshot cache for Robot variables read on the hot path.
+
+Keyword helpers (timeouts, poll interval, YES/NO switches, table tokens) read
+the same handful of ``${OKW_*}`` variables on every keyword. ``cached()``
+memoizes these reads -- including the conversion, e.g. ``'10s'`` -> ``10.0`` --
+in a plain dict for the duration of the current test.
+
+The snapshot is only used while ``VariableSnapshotListener`` is registered
+(``OKW4RobotLibrary`` does this). It is cleared
+
+- at suite and test start/end,
+- after keywords that may change variables (BuiltIn ``Set ... Variable``,
+  ``Import Variables``, ``VAR``, assignments to ``${OKW_*}``),
+- when the user keyword holding such a local assignment returns,
+- explicitly via ``invalidate()`` (``SetOKWParameter``).
+
+Without the listener (e.g. single keyword classes imported directly) every
+read goes straight to Robot as before.
+"""
+from __future__ import annotations
+
+_snapshot: dict = {}
+_active = False
+
+
+def cached(key, compute):
+    """Return the snapshot value for *key*, computing it with ``compute()`` on a miss."""
+    if not _active:
+        return compute()
+    try:
+        return _snapshot[key]
+    except KeyError:
+        pass
+    value = compute()
+    _snapshot[key] = value
+    return value
+
+
+def get_variable(name: str, default=None):
+    """``BuiltIn().get_variable_value(name, default)`` through the snapshot.
+
+    Returns *default* if Robot is not running.
+    """
+    missing = _MISSING
+    value = cached(("var", name), lambda: _read_variable(name, missing))
+    return default if value is missing else value
+
+
+def invalidate():
+    """Drop all snapshot values; the next read goes to Robot again."""
+    _snapshot.clear()
+
+
+def activate(active: bool = True):
+    """Enable or disable the snapshot (done by ``VariableSnapshotListener``)."""
+    global _active
+    _active = bool(active)
+    _snapshot.clear()
+
+
+def is_active() -> bool:
+    return _active
+
+
+class _Missing:
+    def __repr__(self):
+        return "<missing>"
+
+
+_MISSING = _Missing()
+
+
+def _read_variable(name: str, missing):
+    try:
+        from robot.libraries.BuiltIn import BuiltIn
+        return BuiltIn().get_variable_value(name, default=missing)
+    except Exception:
+        return missing
+
+
+def _changes_variables(attrs: dict) -> bool:
+    if attrs.get("type") == "VAR":
+        return True
+    if any("OKW_" in str(target) for target in attrs.get("assign") or ()):
+        return True
+    if attrs.get("libname") == "BuiltIn":
+        kwname = attrs.get("kwname", "")
+        return (kwname.startswith("Set ") and kwname.endswith("Variable")) or kwname == "Import Variables"
+    return False
+
+
+class VariableSnapshotListener:
+    """Robot listener (API v2) that keeps the variable snapshot consistent."""
+
+    ROBOT_LISTENER_API_VERSION = 2
+
+    def __init__(self):
+        self._depth = 0
+        # Keyword depth of the innermost local variable change (None = none)
+        self._local_depth = None
+
+    def start_suite(self, name, attrs):
+        activate()
+        self._depth = 0
+        self._local_depth = None
+
+    def end_suite(self, name, attrs):
+        invalidate()
+
+    def start_test(self, name, attrs):
+        activate()
+        self._depth = 0
+        self._local_depth = None
+
+    def end_test(self, name, attrs):
+        invalidate()
+
+    def start_keyword(self, name, attrs):
+        self._depth += 1
+
+    def end_keyword(self, name, attrs):
+        self._depth -= 1
+        if _changes_variables(attrs):
+            invalidate()
+            if self._local_depth is None or self._depth < self._local_depth:
+                self._local_depth = self._depth
+        elif self._local_depth is not None and self._depth < self._local_depth:
+            # The keyword that held a local assignment has returned
+            invalidate()
+            self._local_depth = None
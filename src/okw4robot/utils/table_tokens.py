@@ -15,6 +15,8 @@ from __future__ import annotations
 
 from typing import List, Tuple
 
+from . import robot_vars
+
 
 def _get_var(name: str, default: str) -> str:
     try:
@@ -26,6 +28,10 @@ def _get_var(name: str, default: str) -> str:
 
 
 def get_tokens() -> dict:
+    return dict(robot_vars.cached(("table_tokens",), _read_tokens))
+
+
+def _read_tokens() -> dict:
     return {
         'CELL_SEP': _get_var('${OKW_TABLE_CELL_SEP_TOKEN}', '$TAB'),
         'ROW_SEP': _get_var('${OKW_TABLE_ROW_SEP_TOKEN}', '$LF'),
@@ -105,6 +111,17 @@ def parse_table_pattern(table_pattern: str) -> List[List[str]]:
     return [parse_row_pattern(r) for r in row_strs]
 
 
+def parse_pairs_pattern(pattern: str) -> List[List[str]]:
+    """Split a ``name<CELL_SEP>value<ROW_SEP>...`` pattern into raw rows.
+
+    Unlike ``parse_table_pattern`` cell tokens are kept as written; blank
+    rows are skipped.
+    """
+    t = get_tokens()
+    rows = [_split_escaped(r, t['CELL_SEP']) for r in _split_escaped(str(pattern or ''), t['ROW_SEP'])]
+    return [row for row in rows if row != [""]]
+
+
 def is_empty_cell_token(s: str) -> bool:
     return str(s) == get_tokens()['EMPTY_CELL']
 
@@ -1,14 +1,41 @@
+import hashlib
+import importlib.util
+import json
+import os
+import threading
+from collections.abc import Mapping
+from importlib.metadata import entry_points
 from pathlib import Path
 import yaml
 from importlib.resources import files
 
-# Treiber-Pakete, die als Fallback fuer Host-/App-YAMLs durchsucht werden.
-# Diese werden optional importiert (try/except ImportError).
-_DRIVER_PACKAGES = [
+try:
+    # libyaml-basierter Loader (C), deutlich schneller als der reine Python-Parser
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# Treiber-Pakete registrieren ihr Locator-Paket ueber diesen Entry-Point, z. B.
+#   [project.entry-points."okw4robot.locators"]
+#   web_selenium = "okw_web_selenium.locators"
+_ENTRY_POINT_GROUP = "okw4robot.locators"
+
+# Treiber-Pakete ohne Entry-Point (Altbestand). Sie werden nur eingelesen,
+# wenn das Top-Level-Paket installiert ist (find_spec, kein Import-Versuch).
+_LEGACY_DRIVER_PACKAGES = [
     "okw_web_selenium.locators",
     "okw_java_swing.locators",
 ]
 
+# Zusaetzliche Suchpfade (os.pathsep-getrennt), zwischen Projekt und Treibern
+_SEARCH_PATH_ENV = "OKW_LOCATOR_PATH"
+
+# Persistenter Cache geparster YAML-Modelle (opt-in).
+# Nur aktiv, wenn OKW_YAML_CACHE_DIR=<Pfad> gesetzt ist; NONE/leer schaltet ihn ab.
+_CACHE_ENV = "OKW_YAML_CACHE_DIR"
+_CACHE_VERSION = "2"
+_MISS = object()
+
 
 def load_yaml_with_fallback(name: str) -> dict:
     """
@@ -16,44 +43,380 @@ def load_yaml_with_fallback(name: str) -> dict:
     Treiber-Pakete zurueck.
     ``name`` ist ein relativer Pfad ohne ".yaml" - z. B. "LoginDialog"
 
-    Suchreihenfolge:
+    Suchreihenfolge (erste Fundstelle gewinnt):
     1. Projektverzeichnis: ./locators/<name>.yaml
-    2. Treiber-Pakete: okw_web_selenium.locators, okw_java_swing.locators (falls installiert)
+    2. Suchpfade aus ``OKW_LOCATOR_PATH``
+    3. Treiber-Pakete (Entry-Point ``okw4robot.locators``)
+
+    Geparste Modelle werden im YAML-Cache abgelegt (siehe ``load_yaml_file``).
     """
-    parts = name.split("/")
+    return load_yaml_file(find_yaml(name))
+
 
-    # 1. Projektverzeichnis: ./locators/<name>.yaml
-    local_path = Path("locators") / f"{name}.yaml"
-    if local_path.exists():
-        with open(local_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+def find_yaml(name: str):
+    """Liefert den Pfad von ``<name>.yaml`` aus dem Locator-Index.
 
-    # 2. Treiber-Pakete (optional installiert)
-    for pkg in _DRIVER_PACKAGES:
-        result = _try_load_from_package(pkg, parts)
-        if result is not None:
-            return result
+    Ist *name* nicht im Index, wird dieser einmal neu aufgebaut (neu
+    hinzugekommene Dateien), bevor der Fehler geworfen wird.
 
+    Raises:
+    - ``FileNotFoundError``: wenn die Datei nirgends gefunden wird.
+    """
+    path = _locator_index.lookup(name)
+    if path is not None:
+        return path
+    _locator_index.invalidate()
+    path = _locator_index.lookup(name)
+    if path is not None:
+        return path
     raise FileNotFoundError(
         f"App YAML not found: {name}.yaml "
-        f"(searched: project ./locators/, "
-        f"driver packages: {', '.join(_DRIVER_PACKAGES)})"
+        f"(searched: {', '.join(_locator_index.sources) or '-'})"
     )
 
 
-def _try_load_from_package(base_pkg: str, parts: list[str]) -> dict | None:
-    """Versucht eine YAML-Datei aus einem Paket zu laden. Gibt None zurueck bei Fehler."""
-    try:
-        if len(parts) == 1:
-            res_path = files(base_pkg).joinpath(f"{parts[0]}.yaml")
-        else:
-            subpkg = ".".join([base_pkg] + parts[:-1])
-            res_path = files(subpkg).joinpath(f"{parts[-1]}.yaml")
+def locator_index() -> dict:
+    """Alle bekannten Locator-Dateien: Name (ohne .yaml) -> Pfad."""
+    return dict(_locator_index.entries())
+
+
+def reset_locator_index():
+    """Verwirft den Locator-Index; er wird beim naechsten Zugriff neu aufgebaut."""
+    _locator_index.invalidate()
+
+
+class _LocatorIndex:
+    """Einmal pro Prozess aufgebauter Index aller verfuegbaren ``*.yaml``.
+
+    Der Index wird neu aufgebaut, wenn sich das Arbeitsverzeichnis aendert
+    (``./locators`` ist relativ dazu) oder ``invalidate()`` aufgerufen wird.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = None
+        self._cwd = None
+        self.sources = []
+
+    def invalidate(self):
+        with self._lock:
+            self._entries = None
+
+    def lookup(self, name: str):
+        return self.entries().get(name)
+
+    def entries(self) -> dict:
+        entries = self._entries
+        cwd = os.getcwd()
+        if entries is not None and cwd == self._cwd:
+            return entries
+        with self._lock:
+            if self._entries is None or cwd != self._cwd:
+                self._entries, self.sources = _build_locator_index()
+                self._cwd = cwd
+            return self._entries
+
+
+def _build_locator_index():
+    entries = {}
+    sources = []
+
+    def add_root(label, root):
+        sources.append(label)
+        for name, path in _scan_yaml(root):
+            entries.setdefault(name, path)
 
-        if res_path.exists():
-            with open(res_path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
-    except (ImportError, ModuleNotFoundError, TypeError):
-        # Paket nicht installiert - ueberspringen
+    project = Path("locators")
+    if project.is_dir():
+        add_root("project ./locators/", project.resolve())
+
+    for entry in os.environ.get(_SEARCH_PATH_ENV, "").split(os.pathsep):
+        if entry.strip() and Path(entry).is_dir():
+            add_root(entry, Path(entry).resolve())
+
+    packages = []
+    try:
+        packages.extend(ep.value for ep in entry_points(group=_ENTRY_POINT_GROUP))
+    except Exception:
         pass
-    return None
+    for pkg in _LEGACY_DRIVER_PACKAGES:
+        if pkg not in packages and importlib.util.find_spec(pkg.split(".")[0]) is not None:
+            packages.append(pkg)
+    for pkg in packages:
+        try:
+            root = files(pkg)
+        except (ImportError, TypeError):
+            continue
+        add_root(pkg, root)
+
+    return entries, sources
+
+
+def _scan_yaml(root, prefix: str = ""):
+    """Liefert (Name, Pfad) fuer alle ``*.yaml`` unterhalb von *root* (rekursiv)."""
+    try:
+        children = list(root.iterdir())
+    except OSError:
+        return
+    for child in children:
+        if child.is_dir():
+            if child.name != "__pycache__":
+                yield from _scan_yaml(child, f"{prefix}{child.name}/")
+        elif child.name.endswith(".yaml"):
+            yield f"{prefix}{child.name[:-5]}", child
+
+
+_locator_index = _LocatorIndex()
+
+
+def load_yaml_file(path) -> dict:
+    """Laedt und parst eine YAML-Datei, mit optionalem persistentem Cache.
+
+    Der Cache-Schluessel besteht aus Pfad, mtime und Inhalts-Hash. Bei einem
+    Treffer wird das Modell als JSON geladen (nur Daten, kein Code), ohne die
+    YAML-Datei erneut zu parsen. Jeder Fehler beim Lesen oder Schreiben des
+    Caches fuehrt stillschweigend zum normalen Parsen.
+    """
+    data = path.read_bytes()
+    cache_file = _cache_file_for(path, data)
+    if cache_file is not None:
+        model = _read_cache(cache_file)
+        if model is not _MISS:
+            return model
+
+    model = parse_yaml(data)
+
+    if cache_file is not None:
+        _write_cache(cache_file, model)
+    return model
+
+
+def parse_yaml(data):
+    """Parst YAML-Text (str/bytes) mit dem schnellsten verfuegbaren SafeLoader."""
+    return yaml.load(data, Loader=_SafeLoader)
+
+
+def yaml_cache_dir() -> Path | None:
+    """Verzeichnis des YAML-Caches oder ``None`` (Standard: Cache abgeschaltet).
+
+    Der Cache ist opt-in ueber ``OKW_YAML_CACHE_DIR=<Pfad>``.
+    """
+    configured = os.environ.get(_CACHE_ENV)
+    if configured is None or configured.strip().upper() in ("", "NONE", "NO", "OFF", "0"):
+        return None
+    return Path(configured)
+
+
+def _is_private(path: Path) -> bool:
+    """True, wenn *path* dem aktuellen Benutzer gehoert und nicht gruppen-/weltbeschreibbar ist.
+
+    Ohne POSIX-Benutzer-IDs (Windows) wird nicht geprueft.
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return st.st_uid == os.getuid() and not st.st_mode & 0o022
+
+
+def _read_cache(cache_file: Path):
+    """Modell aus *cache_file* oder ``_MISS`` (fehlt, fremd, beschaedigt)."""
+    if not (_is_private(cache_file.parent) and _is_private(cache_file)):
+        return _MISS
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return _MISS
+
+
+def _cache_file_for(path, data: bytes) -> Path | None:
+    cache_dir = yaml_cache_dir()
+    if cache_dir is None:
+        return None
+    try:
+        real = os.path.realpath(os.fspath(path))
+        mtime = os.stat(real).st_mtime_ns
+    except (TypeError, OSError):
+        # z. B. Ressource in einem Zip-Paket: kein Dateisystempfad
+        return None
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"{_CACHE_VERSION}\0{yaml.__version__}\0{real}\0{mtime}\0".encode("utf-8"))
+    h.update(hashlib.blake2b(data, digest_size=20).digest())
+    return cache_dir / f"{h.hexdigest()}.json"
+
+
+def _write_cache(cache_file: Path, model) -> None:
+    """Schreibt *model* als JSON, falls es dabei unveraendert bleibt.
+
+    Modelle mit Werten ohne JSON-Entsprechung (Datum, Nicht-String-Schluessel,
+    Mengen ...) werden nicht gecacht. In ein Verzeichnis, das nicht privat
+    ist (``_is_private``), wird nicht geschrieben.
+    """
+    try:
+        text = json.dumps(model, ensure_ascii=False)
+        if json.loads(text) != model:
+            return
+    except (TypeError, ValueError):
+        return
+    tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if not _is_private(cache_file.parent):
+            return
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, cache_file)
+    except Exception:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+# ---------------------------------------------------------------------------
+# Lazy Loading: nur einen Root-Schluessel (App) und dessen Fenster bei Bedarf
+# ---------------------------------------------------------------------------
+
+class _NeedsFullParse(Exception):
+    """Abschnitt kann nicht isoliert geladen werden (z. B. Aliase/Merge-Keys)."""
+
+
+def load_yaml_section(name: str, root_key: str):
+    """Laedt nur den Root-Schluessel *root_key* aus ``<name>.yaml``.
+
+    Der YAML-Event-Stream wird bis zum Ende des gesuchten Abschnitts gelesen;
+    andere Root-Schluessel werden uebersprungen, ohne Objekte zu erzeugen.
+    Von den Eintraegen des Abschnitts (Fenster) werden nur die Textpositionen
+    gemerkt; sie werden erst beim ersten Zugriff geparst (``LazyYamlSection``).
+
+    Enthaelt der Abschnitt Aliase (``*anker``, ``<<: *basis``), wird die Datei
+    vollstaendig geladen und der Abschnitt als normales Dict geliefert.
+
+    Raises:
+    - ``FileNotFoundError``: Datei nicht gefunden.
+    - ``KeyError``: *root_key* ist kein Root-Schluessel der Datei.
+    """
+    path = find_yaml(name)
+    text = path.read_text(encoding="utf-8")
+    try:
+        section = _index_section(text, root_key)
+    except _NeedsFullParse:
+        model = load_yaml_file(path) or {}
+        if root_key not in model:
+            raise KeyError(root_key)
+        return model[root_key]
+    if section is None:
+        raise KeyError(root_key)
+    return section
+
+
+class LazyYamlSection(Mapping):
+    """Read-only Map ueber die Eintraege eines YAML-Abschnitts.
+
+    Jeder Eintrag wird beim ersten Zugriff aus seinem Textausschnitt geparst
+    und danach aus dem Speicher geliefert. Sind alle Eintraege geladen, wird
+    der Quelltext freigegeben.
+    """
+
+    def __init__(self, text: str, column: int, spans: dict):
+        self._text = text
+        self._column = column
+        self._spans = spans
+        self._loaded = {}
+
+    def __getitem__(self, key):
+        if key in self._loaded:
+            return self._loaded[key]
+        start, column, end = self._spans[key]
+        try:
+            value = parse_yaml(" " * column + self._text[start:end])
+        except yaml.YAMLError:
+            value = self._full_parse()[key]
+        self._loaded[key] = value
+        if len(self._loaded) == len(self._spans):
+            self._text = None
+        return value
+
+    def _full_parse(self):
+        return parse_yaml(" " * self._column + self._text) or {}
+
+    def __iter__(self):
+        return iter(self._spans)
+
+    def __len__(self):
+        return len(self._spans)
+
+    def __contains__(self, key):
+        return key in self._spans
+
+    def loaded_keys(self):
+        """Namen der bereits geparsten Eintraege (Diagnose)."""
+        return list(self._loaded)
+
+
+def _index_section(text: str, root_key: str):
+    """Liefert eine ``LazyYamlSection`` fuer *root_key* oder ``None``."""
+    events = yaml.parse(text, Loader=_SafeLoader)
+    ev = next(events)                                   # StreamStart
+    ev = next(events)
+    if isinstance(ev, yaml.StreamEndEvent):
+        return None
+    ev = next(events)                                   # Root-Knoten
+    if not isinstance(ev, yaml.MappingStartEvent):
+        raise _NeedsFullParse()
+    while True:
+        ev = next(events)
+        if isinstance(ev, yaml.MappingEndEvent):
+            return None
+        if not isinstance(ev, yaml.ScalarEvent):
+            raise _NeedsFullParse()
+        if ev.value != root_key:
+            _skip_node(events, next(events), allow_alias=True)
+            continue
+        section = next(events)
+        if isinstance(section, yaml.AliasEvent):
+            raise _NeedsFullParse()
+        if not isinstance(section, yaml.MappingStartEvent):
+            if isinstance(section, yaml.ScalarEvent) and section.value == "":
+                return LazyYamlSection("", 0, {})
+            raise _NeedsFullParse()
+        offset = section.start_mark.index
+        spans = {}
+        while True:
+            ev = next(events)
+            if isinstance(ev, yaml.MappingEndEvent):
+                break
+            if not isinstance(ev, yaml.ScalarEvent):
+                raise _NeedsFullParse()
+            first = next(events)
+            last = _skip_node(events, first, allow_alias=False)
+            spans[ev.value] = (
+                first.start_mark.index - offset,
+                first.start_mark.column,
+                last.end_mark.index - offset,
+            )
+        # Nur den Text des Abschnitts behalten, Positionen relativ dazu
+        return LazyYamlSection(text[offset:ev.end_mark.index], section.start_mark.column, spans)
+
+
+def _skip_node(events, first, allow_alias: bool):
+    """Ueberspringt einen vollstaendigen Knoten und liefert sein letztes Event."""
+    if isinstance(first, yaml.AliasEvent) and not allow_alias:
+        raise _NeedsFullParse()
+    if not isinstance(first, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+        return first
+    depth = 1
+    ev = first
+    while depth:
+        ev = next(events)
+        if isinstance(ev, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+            depth += 1
+        elif isinstance(ev, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+            depth -= 1
+        elif isinstance(ev, yaml.AliasEvent) and not allow_alias:
+            raise _NeedsFullParse()
+    return ev
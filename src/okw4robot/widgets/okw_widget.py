@@ -13,9 +13,22 @@ hinzufuegen, ohne die Framework-Klasse aendern zu muessen.
 from okw4robot.utils.logging_mixin import LoggingMixin
 
 
+class OkwPermanentError(RuntimeError):
+    """Fehler, den weiteres Warten nicht behebt (z. B. Sitzung beendet).
+
+    Treiber werfen ihn, damit Verify-Keywords sofort abbrechen, statt bis
+    zum Timeout weiterzupollen.
+    """
+
+
 class OkwWidget(LoggingMixin):
     """Basisklasse / Interface fuer alle OKW-Widgets."""
 
+    #: Bedingungen, auf die ``okw_wait_until`` nativ warten kann
+    #: (z. B. per MutationObserver oder Swing-Listener). Leer = keine,
+    #: die Verify-Keywords pollen dann wie bisher.
+    okw_wait_conditions = frozenset()
+
     def __init__(self, adapter, locator, **options):
         self.adapter = adapter
         self.locator = locator
@@ -33,6 +46,20 @@ class OkwWidget(LoggingMixin):
     def okw_set_value(self, value: str):
         raise NotImplementedError(f"{self.__class__.__name__}.okw_set_value()")
 
+    @classmethod
+    def okw_set_values_batch(cls, items) -> None:
+        """Setzt mehrere Werte in einem Treiber-Aufruf (optional, ``SetValues``).
+
+        *items* ist eine Liste von ``(widget, value)``-Paaren in Formular-
+        Reihenfolge; alle Widgets teilen sich diese Implementierung (z. B. ein
+        einziges ``execute_script`` fuer ein ganzes Formular). Tokens sind
+        bereits aufgeloest (``$EMPTY`` → ``""``, ``$IGNORE`` entfernt).
+
+        Wirft ``NotImplementedError``, wenn der Treiber keinen Batch anbietet --
+        ``SetValues`` ruft dann ``okw_set_value`` pro Widget auf.
+        """
+        raise NotImplementedError(f"{cls.__name__}.okw_set_values_batch()")
+
     def okw_select(self, value: str):
         raise NotImplementedError(f"{self.__class__.__name__}.okw_select()")
 
@@ -94,6 +121,43 @@ class OkwWidget(LoggingMixin):
     def okw_set_focus(self):
         raise NotImplementedError(f"{self.__class__.__name__}.okw_set_focus()")
 
+    # ------------------------------------------------------------------
+    # Warten (optional, nativ im Treiber)
+    # ------------------------------------------------------------------
+    def okw_wait_until(self, condition: str, expected, timeout: float, mode=None, args=()) -> bool:
+        """Wartet treiberseitig, bis *condition* den Sollwert *expected* erreicht.
+
+        Wird nur fuer Bedingungen aus ``okw_wait_conditions`` aufgerufen:
+
+        - ``value``, ``text``, ``tooltip``, ``label``, ``placeholder``,
+          ``attribute`` (``args=(name,)``): *expected* ist der Soll-String,
+          *mode* der ``MatchMode`` (EXACT/WCM/REGX)
+        - ``exists``, ``visible``, ``enabled``, ``editable``, ``focus``,
+          ``focusable``, ``clickable``: *expected* ist ``True``/``False``
+        - ``list_count``, ``selected_count``: *expected* ist ein ``int``
+
+        Returns:
+        - ``True``, sobald die Bedingung erfuellt ist; ``False`` nach *timeout*
+          Sekunden. Das Keyword liest danach einmal nach und meldet den Fehler.
+
+        Wirft ``NotImplementedError``, wenn der Treiber im Einzelfall nicht
+        nativ warten kann -- das Keyword pollt dann.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__}.okw_wait_until()")
+
+    def okw_is_permanent_error(self, error: Exception) -> bool:
+        """Meldet, ob *error* dauerhaft ist (Polling abbrechen) oder voruebergehend.
+
+        Wird von den Verify-Schleifen fuer Fehler aufgerufen, die nicht schon
+        generell als dauerhaft gelten (``NotImplementedError``, ``re.error``,
+        ``ConnectionError``, ``OkwPermanentError``). Standard: fragt den
+        Adapter (``adapter.okw_is_permanent_error(error)``), falls vorhanden,
+        sonst ``False``. Treiber ueberschreiben dies z. B. fuer
+        "Session beendet"-Exceptions ihrer Bibliothek.
+        """
+        hook = getattr(self.adapter, "okw_is_permanent_error", None)
+        return bool(hook(error)) if callable(hook) else False
+
     # ------------------------------------------------------------------
     # Listen
     # ------------------------------------------------------------------
@@ -115,6 +179,23 @@ class OkwWidget(LoggingMixin):
     def get_cell_text(self, row: int, col: int) -> str:
         raise NotImplementedError(f"{self.__class__.__name__}.get_cell_text()")
 
+    def get_cells(self, coords) -> list[str]:
+        """Liest die Zellen *coords* (Liste von ``(row, col)``, 1-basiert) in Reihenfolge.
+
+        Standard: ``get_cell_text()`` je Zelle. Treiber, die mehrere Zellen in
+        einem Aufruf lesen koennen, ueberschreiben dies -- die ``...ByHeaders``-
+        Keywords holen so Schluessel- und Zielzelle mit einem Roundtrip.
+        """
+        return [self.get_cell_text(r, c) for r, c in coords]
+
+    def get_columns(self, col_indices) -> list[list[str]]:
+        """Liest die Spalten *col_indices* (1-basiert), je Spalte eine Liste der Zell-Strings.
+
+        Standard: ``get_column_texts()`` je Spalte. Treiber mit nativer
+        Projektion ueberschreiben dies und uebertragen nur diese Spalten.
+        """
+        return [self.get_column_texts(c) for c in col_indices]
+
     def get_row_count(self) -> int:
         raise NotImplementedError(f"{self.__class__.__name__}.get_row_count()")
 
@@ -127,6 +208,56 @@ class OkwWidget(LoggingMixin):
     def get_row_key_column_index(self) -> int:
         raise NotImplementedError(f"{self.__class__.__name__}.get_row_key_column_index()")
 
+    def get_table_snapshot(self):
+        """Liefert Kopfzeile und alle Datenzellen in einem Treiber-Aufruf (optional).
+
+        Returns:
+        - ``(headers, rows)``: ``headers`` ist die Liste der Spaltenueberschriften,
+          ``rows`` die Liste der Datenzeilen (ohne Kopfzeile, Zeile 1 zuerst),
+          jede Zeile eine Liste von Zell-Strings.
+
+        Die Tabellen-Keywords vergleichen dann gegen diesen Schnappschuss statt
+        ``get_row_count()`` plus ``get_row_texts()`` je Zeile aufzurufen (N+1
+        Roundtrips pro Poll). Ohne Implementierung -- oder wenn der Treiber
+        ``NotImplementedError`` wirft -- bleibt es bei den Einzelaufrufen.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__}.get_table_snapshot()")
+
+    def iter_rows(self, start: int = 1, page_size: int = 100):
+        """Liefert die Datenzeilen ab *start* (1-basiert) lazy als Generator von Zell-Listen.
+
+        Standard: ``get_row_count()`` einmal, dann ``get_row_texts()`` je Zeile.
+        Treiber fuer virtualisierte oder sehr grosse Tabellen ueberschreiben
+        dies und holen je *page_size* Zeilen in einem Aufruf (z. B. scrollen
+        und den sichtbaren Bereich lesen). ``VerifyTableHasRow`` und
+        ``VerifyTableContent`` hoeren beim ersten Treffer bzw. der ersten
+        Abweichung auf zu lesen; im Speicher liegt hoechstens eine Seite.
+        Eine eigene Implementierung hat Vorrang vor ``get_table_snapshot()``.
+        """
+        count = int(self.get_row_count())
+        for r in range(start, count + 1):
+            yield self.get_row_texts(r)
+
+    def get_table_version(self):
+        """Aenderungs-Token der Tabelle (optional), z. B. Revisionszaehler des Modells.
+
+        Das Token muss sich aendern, sobald sich eine Zelle aendert. Solange
+        es gleich bleibt, ueberspringen ``VerifyTableContent`` und
+        ``VerifyTableHasRow`` zwischen zwei Polls das Lesen und Vergleichen.
+        Ohne Implementierung (``NotImplementedError``) wird jedes Mal gelesen.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__}.get_table_version()")
+
+    def get_row_fingerprints(self) -> list:
+        """Fingerabdruck je Datenzeile (optional), Zeile 1 zuerst, in einem Aufruf.
+
+        Ein Fingerabdruck (Hash, Zeilen-Version, ...) muss sich aendern, wenn
+        sich der Inhalt der Zeile aendert. Die Tabellen-Keywords lesen dann
+        zwischen zwei Polls nur Zeilen mit geaendertem Fingerabdruck per
+        ``get_row_texts()`` neu.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__}.get_row_fingerprints()")
+
     # ------------------------------------------------------------------
     # Logging / Memorize -- Defaults mit okw_get_value()
     # ------------------------------------------------------------------
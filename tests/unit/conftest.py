@@ -26,6 +26,9 @@ class FakeBuiltIn:
     def set_test_variable(self, name, value):
         self._variables[name] = value
 
+    def set_suite_variable(self, name, value):
+        self._variables[name] = value
+
     def convert_time(self, value):
         return float(value)
 
@@ -50,6 +53,7 @@ def _patch_robot():
         "${OKW_TIMEOUT_VERIFY_CLICKABLE}": 0.1,
         "${OKW_TIMEOUT_VERIFY_LIST_COUNT}": 0.1,
         "${OKW_TIMEOUT_VERIFY_SELECTED_COUNT}": 0.1,
+        "${OKW_TIMEOUT_VERIFY_TABLE}": 0.1,
         "${OKW_POLL_VERIFY}": 0.01,
         "${OKW_IGNORE_EMPTY}": "NO",
     }
@@ -99,8 +103,14 @@ def _patch_robot():
         saved[mod_name] = sys.modules.get(mod_name)
         sys.modules[mod_name] = mod
 
+    # Variablen-Snapshot aus: Tests setzen _variables direkt
+    from okw4robot.utils import robot_vars
+    robot_vars.activate(False)
+
     yield fake_bi
 
+    robot_vars.activate(False)
+
     # Aufraemen
     for mod_name, orig in saved.items():
         if orig is None:
@@ -143,6 +153,7 @@ def _patch_resolve_widget():
         "okw4robot.keywords.placeholder_keywords",
         "okw4robot.keywords.list_keywords",
         "okw4robot.keywords.table_keywords",
+        "okw4robot.keywords.probe_keywords",
     ]
     patches = []
     for mod_path in modules_to_patch:
@@ -159,3 +170,5 @@ def _patch_resolve_widget():
     for p in patches:
         p.stop()
     clear_widgets()
+    from okw4robot.runtime.context import context
+    context.clear_table_indexes()
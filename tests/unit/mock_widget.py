@@ -45,6 +45,10 @@ class MockWidget(OkwWidget):
         # Tabellen-Daten: Liste von Listen (Zeilen x Spalten)
         self.mock_headers: list[str] = overrides.get("headers", [])
         self.mock_rows: list[list[str]] = overrides.get("rows", [])
+        # get_table_snapshot() nur wenn ausdruecklich gewuenscht
+        self.mock_snapshot: bool = overrides.get("snapshot", False)
+        # get_table_version()/get_row_fingerprints() nur wenn ausdruecklich gewuenscht
+        self.mock_versioned: bool = overrides.get("versioned", False)
 
         # Aufruf-Protokoll: [(method_name, args), ...]
         self.calls: list[tuple] = []
@@ -182,6 +186,21 @@ class MockWidget(OkwWidget):
                 return r[col - 1]
         return ""
 
+    def get_cells(self, coords) -> list[str]:
+        self._record("get_cells", list(coords))
+        return [self._cell(r, c) for r, c in coords]
+
+    def get_columns(self, col_indices) -> list[list[str]]:
+        self._record("get_columns", list(col_indices))
+        return [[self._cell(r, c) for r in range(1, len(self.mock_rows) + 1)] for c in col_indices]
+
+    def _cell(self, row: int, col: int) -> str:
+        if 1 <= row <= len(self.mock_rows):
+            r = self.mock_rows[row - 1]
+            if 1 <= col <= len(r):
+                return r[col - 1]
+        return ""
+
     def get_row_count(self) -> int:
         self._record("get_row_count")
         return len(self.mock_rows)
@@ -196,6 +215,24 @@ class MockWidget(OkwWidget):
         self._record("get_header_names")
         return list(self.mock_headers)
 
+    def get_table_snapshot(self):
+        self._record("get_table_snapshot")
+        if not self.mock_snapshot:
+            raise NotImplementedError("MockWidget.get_table_snapshot()")
+        return list(self.mock_headers), [list(r) for r in self.mock_rows]
+
+    def get_table_version(self):
+        self._record("get_table_version")
+        if not self.mock_versioned:
+            raise NotImplementedError("MockWidget.get_table_version()")
+        return hash(tuple(tuple(r) for r in self.mock_rows))
+
+    def get_row_fingerprints(self) -> list:
+        self._record("get_row_fingerprints")
+        if not self.mock_versioned:
+            raise NotImplementedError("MockWidget.get_row_fingerprints()")
+        return [hash(tuple(r)) for r in self.mock_rows]
+
     def get_row_key_column_index(self) -> int:
         self._record("get_row_key_column_index")
         return 1
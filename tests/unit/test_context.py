@@ -0,0 +1,290 @@
+"""Tests fuer runtime/context.py: Widget-Instanz-Cache, Invalidierung, Register und Isolation."""
+
+import asyncio
+import threading
+
+import pytest
+
+from okw4robot.runtime.context import Context
+from okw4robot.widgets.okw_widget import OkwWidget
+
+
+class FakeAdapter:
+    pass
+
+
+APP_MODEL = {
+    "LoginDialog": {
+        "Username": {
+            "class": "okw4robot.widgets.okw_widget.OkwWidget",
+            "locator": "id=user",
+            "wait": {"read": {"timeout": 5}},
+        },
+        "Password": {
+            "class": "okw4robot.widgets.okw_widget.OkwWidget",
+            "locator": "id=pass",
+        },
+    },
+    "Dashboard": {
+        "Username": {
+            "class": "okw4robot.widgets.okw_widget.OkwWidget",
+            "locator": "id=dash_user",
+        },
+    },
+}
+
+
+@pytest.fixture
+def ctx(monkeypatch):
+    """Frischer Context, der den globalen Singleton ersetzt."""
+    c = Context()
+    monkeypatch.setattr("okw4robot.runtime.context.context", c)
+    c.set_adapter(FakeAdapter())
+    c.set_app("TestApp", APP_MODEL)
+    c.set_window("LoginDialog")
+    return c
+
+
+def _resolve(name):
+    from okw4robot.utils.okw_helpers import resolve_widget
+    return resolve_widget(name)
+
+
+class TestWidgetCache:
+    def test_resolve_builds_widget(self, ctx):
+        w = _resolve("Username")
+        assert isinstance(w, OkwWidget)
+        assert w.locator == "id=user"
+        assert w.options == {"wait": {"read": {"timeout": 5}}}
+
+    def test_second_resolve_hits_cache(self, ctx):
+        w1 = _resolve("Username")
+        w2 = _resolve("Username")
+        assert w1 is w2
+        assert ctx.widget_cache_stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_unknown_widget_not_cached(self, ctx):
+        with pytest.raises(KeyError):
+            _resolve("Unknown")
+        assert ctx.widget_cache_stats()["size"] == 0
+
+    def test_set_window_invalidates(self, ctx):
+        w1 = _resolve("Username")
+        ctx.set_window("Dashboard")
+        w2 = _resolve("Username")
+        assert w1 is not w2
+        assert w2.locator == "id=dash_user"
+
+    def test_select_app_invalidates(self, ctx):
+        _resolve("Username")
+        ctx.select_app("TestApp")
+        assert ctx.widget_cache_stats()["size"] == 0
+
+    def test_set_app_invalidates(self, ctx):
+        _resolve("Username")
+        ctx.set_app("TestApp", APP_MODEL)
+        assert ctx.widget_cache_stats()["size"] == 0
+
+    def test_stop_app_invalidates(self, ctx):
+        _resolve("Username")
+        ctx.stop_app()
+        assert ctx.widget_cache_stats()["size"] == 0
+
+    def test_set_adapter_invalidates(self, ctx):
+        _resolve("Username")
+        ctx.set_adapter(FakeAdapter())
+        assert ctx.widget_cache_stats()["size"] == 0
+
+    def test_describe_reports_cache(self, ctx):
+        _resolve("Password")
+        _resolve("Password")
+        assert ctx.describe()["widget_cache"]["hits"] == 1
+
+
+class OtherAdapter:
+    pass
+
+
+@pytest.fixture
+def multi(monkeypatch):
+    """Zwei Hosts mit je einer App."""
+    c = Context()
+    monkeypatch.setattr("okw4robot.runtime.context.context", c)
+    c.set_adapter(FakeAdapter(), name="Chrome", startup_time=1.5)
+    c.set_app("WebApp", APP_MODEL)
+    c.set_adapter(OtherAdapter(), name="Swing")
+    c.set_app("SwingApp", {"Main": {}})
+    return c
+
+
+class TestRegistry:
+    def test_hosts_and_apps_registered(self, multi):
+        assert multi.adapters() == ["Chrome", "Swing"]
+        assert multi.apps() == [("Chrome", "WebApp"), ("Swing", "SwingApp")]
+
+    def test_select_app_switches_adapter(self, multi):
+        multi.select_app("WebApp")
+        assert isinstance(multi.get_adapter(), FakeAdapter)
+        assert multi.describe()["host"] == "Chrome"
+        multi.set_window("LoginDialog")
+        assert _resolve("Username").locator == "id=user"
+
+    def test_select_app_reuses_model(self, multi):
+        model = multi._apps[("Chrome", "WebApp")]
+        multi.select_app("WebApp")
+        assert multi._app_model is model
+
+    def test_select_unknown_app(self, multi):
+        with pytest.raises(ValueError):
+            multi.select_app("Nope")
+
+    def test_select_adapter_keeps_instance(self, multi):
+        chrome = multi._adapters["Chrome"]
+        assert multi.select_adapter("chrome") == "Chrome"
+        assert multi.get_adapter() is chrome
+        assert multi._app_model is None
+
+    def test_select_adapter_by_class_name(self, multi):
+        assert multi.select_adapter("FakeAdapter") == "Chrome"
+
+    def test_select_unknown_adapter(self, multi):
+        with pytest.raises(KeyError):
+            multi.select_adapter("Firefox")
+
+    def test_startup_time(self, multi):
+        assert multi.adapter_startup_time("Chrome") == 1.5
+        assert multi.adapter_startup_time("Swing") is None
+
+    def test_stop_adapter_drops_its_apps(self, multi):
+        multi.stop_adapter()
+        assert multi.adapters() == ["Chrome"]
+        assert multi.apps() == [("Chrome", "WebApp")]
+        multi.select_app("WebApp")
+        assert isinstance(multi.get_adapter(), FakeAdapter)
+
+    def test_restart_same_name_replaces_host(self, multi):
+        chrome = FakeAdapter()
+        multi.set_adapter(chrome, name="Chrome", startup_time=0.5)
+        assert multi.adapters() == ["Swing", "Chrome"]
+        assert multi.apps() == [("Swing", "SwingApp")]
+        assert multi.adapter_startup_time("Chrome") == 0.5
+        assert multi.select_adapter("Chrome") == "Chrome"
+        assert multi.get_adapter() is chrome
+
+    def test_same_app_on_two_hosts(self, monkeypatch):
+        c = Context()
+        monkeypatch.setattr("okw4robot.runtime.context.context", c)
+        alice, bob = FakeAdapter(), FakeAdapter()
+        c.set_adapter(alice, name="alice")
+        c.set_app("Chat", APP_MODEL)
+        c.set_adapter(bob, name="bob")
+        c.set_app("Chat", APP_MODEL)
+        assert c.apps() == [("alice", "Chat"), ("bob", "Chat")]
+        c.select_adapter("alice")
+        c.select_app("Chat")
+        assert c.describe()["host"] == "alice"
+        assert c.get_adapter() is alice
+        c.select_adapter("bob")
+        c.select_app("Chat")
+        assert c.get_adapter() is bob
+
+    def test_ambiguous_app_needs_host(self, multi):
+        multi.select_adapter("Chrome")
+        multi.set_app("SwingApp", {"Main": {}})
+        multi.set_adapter(OtherAdapter(), name="Firefox")
+        with pytest.raises(ValueError, match="mehreren Hosts"):
+            multi.select_app("SwingApp")
+
+    def test_stop_app_unregisters(self, multi):
+        multi.stop_app()
+        assert ("Swing", "SwingApp") not in multi.apps()
+
+
+class TestIsolation:
+    def test_threads_share_root_by_default(self):
+        c = Context()
+        c.set_adapter(FakeAdapter(), name="Chrome")
+        seen = []
+        t = threading.Thread(target=lambda: seen.append(c.describe()["host"]))
+        t.start()
+        t.join()
+        assert seen == ["Chrome"]
+
+    def test_isolated_block_has_own_state(self):
+        c = Context()
+        c.set_adapter(FakeAdapter(), name="Chrome")
+        with c.isolated():
+            assert c.is_isolated()
+            assert c.adapters() == []
+            c.set_adapter(OtherAdapter(), name="Swing")
+            assert c.describe()["host"] == "Swing"
+        assert not c.is_isolated()
+        assert c.adapters() == ["Chrome"]
+        assert c.describe()["host"] == "Chrome"
+
+    def test_parallel_threads_drive_own_app(self):
+        c = Context()
+        barrier = threading.Barrier(4)
+        results = {}
+
+        def worker(i):
+            with c.isolated():
+                c.set_adapter(FakeAdapter(), name=f"Host{i}")
+                c.set_app(f"App{i}", APP_MODEL)
+                c.set_window("LoginDialog" if i % 2 else "Dashboard")
+                barrier.wait()
+                spec = c.get_current_window_model()["Username"]
+                results[i] = (c.describe()["app"], spec.locator)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == {
+            0: ("App0", "id=dash_user"),
+            1: ("App1", "id=user"),
+            2: ("App2", "id=dash_user"),
+            3: ("App3", "id=user"),
+        }
+        assert c.adapters() == []
+
+    def test_asyncio_tasks_isolated(self):
+        c = Context()
+
+        async def task(name):
+            with c.isolated():
+                c.set_adapter(FakeAdapter(), name=name)
+                await asyncio.sleep(0)
+                return c.describe()["host"]
+
+        async def main():
+            return await asyncio.gather(task("A"), task("B"))
+
+        assert asyncio.run(main()) == ["A", "B"]
+
+
+class TestQualifiedNames:
+    def test_qualified_without_select_window(self, monkeypatch):
+        c = Context()
+        monkeypatch.setattr("okw4robot.runtime.context.context", c)
+        c.set_adapter(FakeAdapter())
+        c.set_app("TestApp", APP_MODEL)
+        assert _resolve("Dashboard.Username").locator == "id=dash_user"
+        assert c.describe()["window"] is None
+
+    def test_unqualified_without_window_fails(self, monkeypatch):
+        c = Context()
+        monkeypatch.setattr("okw4robot.runtime.context.context", c)
+        c.set_adapter(FakeAdapter())
+        c.set_app("TestApp", APP_MODEL)
+        with pytest.raises(RuntimeError, match="No window selected"):
+            _resolve("Username")
+
+    def test_current_window_keeps_working(self, ctx):
+        assert _resolve("Username").locator == "id=user"
+        assert _resolve("Dashboard.Username").locator == "id=dash_user"
+
+    def test_unknown_qualified_name(self, ctx):
+        with pytest.raises(KeyError):
+            _resolve("Dashboard.Nope")
@@ -0,0 +1,62 @@
+"""Tests fuer utils/loader.py: memoisierter Klassen-Loader und Warm-up."""
+
+import importlib
+
+import pytest
+
+from okw4robot.utils import loader
+from okw4robot.widgets.okw_widget import OkwWidget
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    loader.clear_class_cache()
+    yield
+    loader.clear_class_cache()
+
+
+class TestLoadClass:
+    def test_loads_class(self):
+        assert loader.load_class("okw4robot.widgets.okw_widget.OkwWidget") is OkwWidget
+
+    def test_memoized(self, monkeypatch):
+        calls = []
+        real = importlib.import_module
+
+        def counting(name, *a, **kw):
+            calls.append(name)
+            return real(name, *a, **kw)
+
+        monkeypatch.setattr(loader.importlib, "import_module", counting)
+        loader.load_class("okw4robot.widgets.okw_widget.OkwWidget")
+        loader.load_class("okw4robot.widgets.okw_widget.OkwWidget")
+        assert calls == ["okw4robot.widgets.okw_widget"]
+
+
+class TestCollectClassNames:
+    def test_collects_nested(self):
+        model = {
+            "Login": {
+                "__self__": {"class": "a.b.Window"},
+                "User": {"class": "a.b.Text", "locator": "id=u"},
+                "Pass": {"class": "a.b.Text", "locator": "id=p"},
+            },
+            "Other": {"OK": {"class": "c.d.Button"}},
+        }
+        assert loader.collect_class_names(model) == {"a.b.Window", "a.b.Text", "c.d.Button"}
+
+
+class TestWarmUp:
+    def test_reports_timings_and_errors(self):
+        timings, errors = loader.warm_up_classes([
+            "okw4robot.widgets.okw_widget.OkwWidget",
+            "okw4robot.does_not_exist.Foo",
+        ])
+        assert "okw4robot.widgets.okw_widget" in timings
+        assert list(errors) == ["okw4robot.does_not_exist.Foo"]
+        assert "okw4robot.widgets.okw_widget.OkwWidget" in loader._CLASS_CACHE
+
+    def test_skips_already_loaded(self):
+        loader.load_class("okw4robot.widgets.okw_widget.OkwWidget")
+        timings, errors = loader.warm_up_classes(["okw4robot.widgets.okw_widget.OkwWidget"])
+        assert timings == {} and errors == {}
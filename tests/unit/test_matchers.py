@@ -0,0 +1,60 @@
+"""Tests fuer utils/matchers.py: gleiche Semantik wie is_match / compile_wcm_to_regex."""
+
+import re
+
+import pytest
+from okw_contract_utils import MatchMode, is_match
+
+from okw4robot.utils.matchers import compile_matcher, compile_wcm_cell_matcher
+from okw4robot.utils.table_tokens import compile_wcm_to_regex
+
+ACTUALS = [
+    "", "\n", "abc", "abc\n", "abc\n\n", "xabc", "xabc\n", "abcx", "xabcx",
+    "ab", "a\r\nb", "a\nb", "A*B", "a.c", "[x]", "line1\nline2",
+]
+
+WCM_PATTERNS = [
+    "", "*", "**", "abc", "abc*", "*abc", "*abc*", "a?c", "a*c", "a\nb", "a\r\nb",
+    "[x]", "[!x]*", "*.c", "A\\*B", "a*b*c",
+]
+
+REGX_PATTERNS = ["", "abc", "^abc$", "b", "a.c", "line2$", "^line2", "(?i)ABC", "a b", "[", "x+"]
+
+
+@pytest.mark.parametrize("mode,patterns", [
+    (MatchMode.EXACT, WCM_PATTERNS),
+    (MatchMode.WCM, WCM_PATTERNS),
+    (MatchMode.REGX, REGX_PATTERNS),
+])
+def test_same_result_as_is_match(mode, patterns):
+    for expected in patterns:
+        matcher = compile_matcher(expected, mode)
+        for actual in ACTUALS:
+            assert matcher(actual) == is_match(actual, expected, mode).ok, (expected, actual)
+
+
+def test_cell_matcher_same_as_regex():
+    for pattern in WCM_PATTERNS:
+        rx = re.compile(compile_wcm_to_regex(pattern), re.DOTALL)
+        matcher = compile_wcm_cell_matcher(pattern)
+        for actual in ACTUALS + [None]:
+            assert matcher(actual) == bool(rx.match(actual or "")), (pattern, actual)
+
+
+def test_fast_paths_selected():
+    assert compile_matcher("abc*", MatchMode.WCM).kind == "prefix"
+    assert compile_matcher("*abc", MatchMode.WCM).kind == "suffix"
+    assert compile_matcher("*abc*", MatchMode.WCM).kind == "contains"
+    assert compile_matcher("a?c", MatchMode.WCM).kind == "regex"
+    assert compile_matcher("abc", MatchMode.REGX).kind == "contains"
+
+
+def test_invalid_regex_reports_error():
+    matcher = compile_matcher("[", MatchMode.REGX)
+    assert matcher.kind == "invalid" and "Invalid REGX pattern" in matcher.error
+    assert not matcher("[")
+
+
+def test_compiled_once():
+    assert compile_matcher("a*c", MatchMode.WCM) is compile_matcher("a*c", MatchMode.WCM)
+    assert compile_wcm_cell_matcher("a*c") is compile_wcm_cell_matcher("a*c")
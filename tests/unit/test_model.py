@@ -0,0 +1,176 @@
+"""Tests fuer runtime/model.py: kompiliertes Objektmodell."""
+
+import pytest
+
+from okw4robot.runtime.model import AppModel, WidgetSpec, WidgetTemplate
+from okw4robot.widgets.okw_widget import OkwWidget
+
+RAW = {
+    "LoginDialog": {
+        "__self__": {"class": "okw4robot.widgets.okw_widget.OkwWidget", "locator": "id=dlg"},
+        "Username": {
+            "class": "okw4robot.widgets.okw_widget.OkwWidget",
+            "locator": "id=user",
+            "wait": {"read": {"timeout": 5}},
+        },
+        "Broken": {"locator": "id=x"},
+        "comment": "kein Widget",
+    },
+    "Info": "kein Fenster",
+}
+
+
+class TestAppModel:
+    def test_windows_indexed(self):
+        m = AppModel.compile("App", RAW)
+        assert "LoginDialog" in m and "Info" in m
+        assert set(m.window("LoginDialog")) == {"__self__", "Username", "Broken"}
+        assert len(m.window("Info")) == 0
+
+    def test_window_is_read_only(self):
+        m = AppModel.compile("App", RAW)
+        with pytest.raises(TypeError):
+            m.window("LoginDialog")["New"] = None
+
+    def test_empty_model_is_falsy(self):
+        assert not AppModel.compile("App", {})
+
+
+class TestWidgetSpec:
+    def test_fields(self):
+        spec = AppModel.compile("App", RAW).window("LoginDialog")["Username"]
+        assert spec.class_name == "okw4robot.widgets.okw_widget.OkwWidget"
+        assert spec.locator == "id=user"
+        assert dict(spec.options) == {"wait": {"read": {"timeout": 5}}}
+        assert spec["class"] == spec.class_name and spec.get("missing") is None
+
+    def test_reads_like_yaml_entry(self):
+        entry = {"class": "a.B", "locator": "id=x", "extra": 1}
+        spec = WidgetSpec.from_entry("X", entry)
+        assert "locator" in spec and "missing" not in spec
+        assert dict(spec) == entry
+        assert list(spec) == ["class", "locator", "extra"]
+        assert dict(spec.items()) == entry and len(spec) == 3
+
+    def test_missing_locator_is_absent(self):
+        spec = WidgetSpec.from_entry("X", {"class": "a.B"})
+        assert "locator" not in spec and spec.get("locator") is None
+        assert dict(spec) == {"class": "a.B"}
+
+    def test_options_frozen(self):
+        spec = WidgetSpec.from_entry("X", {"class": "a.B", "extra": 1})
+        with pytest.raises(TypeError):
+            spec.options["extra"] = 2
+
+    def test_create(self):
+        spec = AppModel.compile("App", RAW).window("LoginDialog")["Username"]
+        w = spec.create(adapter="ADAPTER")
+        assert isinstance(w, OkwWidget)
+        assert w.adapter == "ADAPTER" and w.locator == "id=user"
+        assert spec.widget_class is OkwWidget
+
+    def test_missing_class(self):
+        spec = AppModel.compile("App", RAW).window("LoginDialog")["Broken"]
+        with pytest.raises(KeyError):
+            spec.create(adapter=None)
+
+
+class TestLazyAppModel:
+    def test_windows_compiled_on_first_access(self):
+        m = AppModel.compile("App", RAW, lazy=True)
+        assert "LoginDialog" in m and len(m) == 2
+        assert m.loaded_windows() == []
+        window = m.window("LoginDialog")
+        assert m.loaded_windows() == ["LoginDialog"]
+        assert m.window("LoginDialog") is window
+
+    def test_unknown_window(self):
+        m = AppModel.compile("App", RAW, lazy=True)
+        assert "Nope" not in m
+        with pytest.raises(KeyError):
+            m.window("Nope")
+
+
+class TestQualifiedIndex:
+    def test_qualified_lookup(self):
+        m = AppModel.compile("App", RAW)
+        assert m.qualified("LoginDialog.Username") is m.window("LoginDialog")["Username"]
+        assert m.qualified("LoginDialog.Nope") is None
+        assert m.qualified("Username") is None
+
+    def test_qualified_lazy_loads_window(self):
+        m = AppModel.compile("App", RAW, lazy=True)
+        spec = m.qualified("LoginDialog.Username")
+        assert spec.locator == "id=user"
+        assert m.loaded_windows() == ["LoginDialog"]
+
+    def test_qualified_lazy_dotted_window_name(self):
+        raw = {"web.Login": {"User": {"class": "a.B", "locator": "id=u"}}}
+        m = AppModel.compile("App", raw, lazy=True)
+        assert m.qualified("web.Login.User").locator == "id=u"
+
+
+GRID = {
+    "Grid": {
+        "DeleteButton[{row}]": {
+            "class": "okw4robot.widgets.okw_widget.OkwWidget",
+            "locator": "css=#row-{row} .delete",
+            "wait": {"read": {"timeout": 2}},
+        },
+        "Cell[{row},{col}]": {
+            "class": "a.B",
+            "locator": {"xpath": "//tr[{row}]/td[{col}]"},
+        },
+        "Padded[{n}]": {"class": "a.B", "locator": "id=item-{n:03d}"},
+        "DeleteButton[1]": {"class": "a.B", "locator": "id=first"},
+    },
+}
+
+
+class TestWidgetTemplate:
+    def test_templates_not_in_window(self):
+        m = AppModel.compile("App", GRID)
+        assert set(m.window("Grid")) == {"DeleteButton[1]"}
+        assert {t.name for t in m.templates("Grid")} == {
+            "DeleteButton[{row}]", "Cell[{row},{col}]", "Padded[{n}]",
+        }
+
+    def test_lookup_renders_locator(self):
+        m = AppModel.compile("App", GRID)
+        spec = m.lookup("Grid", "DeleteButton[17]")
+        assert spec.name == "DeleteButton[17]"
+        assert spec.locator == "css=#row-17 .delete"
+        assert dict(spec.options) == {"wait": {"read": {"timeout": 2}}}
+        assert m.lookup("Grid", "DeleteButton[17]") is spec
+
+    def test_fixed_entry_wins(self):
+        m = AppModel.compile("App", GRID)
+        assert m.lookup("Grid", "DeleteButton[1]").locator == "id=first"
+
+    def test_multiple_fields_and_dict_locator(self):
+        spec = AppModel.compile("App", GRID).lookup("Grid", "Cell[3,4]")
+        assert spec.locator == {"xpath": "//tr[3]/td[4]"}
+
+    def test_format_spec(self):
+        spec = AppModel.compile("App", GRID).lookup("Grid", "Padded[7]")
+        assert spec.locator == "id=item-007"
+
+    def test_no_match(self):
+        m = AppModel.compile("App", GRID)
+        assert m.lookup("Grid", "Unknown[3]") is None
+        assert m.lookup("Grid", "DeleteButton") is None
+
+    def test_qualified_and_lazy(self):
+        m = AppModel.compile("App", GRID, lazy=True)
+        assert m.qualified("Grid.DeleteButton[5]").locator == "css=#row-5 .delete"
+        eager = AppModel.compile("App", GRID)
+        assert eager.qualified("Grid.Cell[1,2]").locator == {"xpath": "//tr[1]/td[2]"}
+
+    def test_create_widget(self):
+        spec = AppModel.compile("App", GRID).lookup("Grid", "DeleteButton[2]")
+        w = spec.create(adapter=None)
+        assert isinstance(w, OkwWidget) and w.locator == "css=#row-2 .delete"
+
+    def test_invalid_field(self):
+        with pytest.raises(ValueError):
+            WidgetTemplate("X[{0}]", "a.B", "id={0}")
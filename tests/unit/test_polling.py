@@ -0,0 +1,158 @@
+"""Tests fuer utils/polling.py: Poll-Strategien und Konfiguration."""
+
+import random
+from itertools import islice
+
+import pytest
+
+from okw4robot.utils.polling import (
+    BackoffPoll,
+    FastFirstPoll,
+    FixedPoll,
+    JitterPoll,
+    get_poll_strategy,
+    parse_strategy,
+)
+from okw4robot.utils.okw_helpers import last_poll_result, poll_until, set_poll_clock, verify_with_timeout
+from okw_contract_utils import MatchMode
+
+from .mock_widget import MockWidget
+
+
+def first(strategy, n):
+    return list(islice(strategy.delays(), n))
+
+
+class TestStrategies:
+    def test_fixed(self):
+        assert first(FixedPoll(0.1), 3) == [0.1, 0.1, 0.1]
+
+    def test_backoff_capped(self):
+        assert first(BackoffPoll(0.05, 2, 0.3), 5) == [0.05, 0.1, 0.2, 0.3, 0.3]
+
+    def test_fastfirst(self):
+        assert first(FastFirstPoll(0.01, 2, 0.5), 4) == [0.01, 0.01, 0.5, 0.5]
+
+    def test_jitter_bounds(self):
+        delays = first(JitterPoll(FixedPoll(1.0), 0.2, rng=random.Random(1)), 50)
+        assert all(0.8 <= d <= 1.2 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_delays_are_fresh(self):
+        s = BackoffPoll(0.1, 2, 1)
+        first(s, 3)
+        assert first(s, 1) == [0.1]
+
+
+class TestParse:
+    def test_default_is_fixed_interval(self):
+        assert parse_strategy(None, 0.25) == FixedPoll(0.25)
+
+    def test_string_with_params(self):
+        assert parse_strategy("BACKOFF:initial=0.02,factor=3,max=0.5") == BackoffPoll(0.02, 3, 0.5)
+
+    def test_fastfirst_uses_base_interval(self):
+        assert parse_strategy("fastfirst", 0.2) == FastFirstPoll(0.02, 5, 0.2)
+
+    def test_jitter_name(self):
+        s = parse_strategy("jitter", 0.2)
+        assert isinstance(s, JitterPoll) and s.inner == FixedPoll(0.2) and s.ratio == 0.5
+
+    def test_jitter_param_wraps_any(self):
+        s = parse_strategy({"strategy": "backoff", "jitter": 0.1})
+        assert isinstance(s, JitterPoll) and isinstance(s.inner, BackoffPoll)
+
+    def test_unknown(self):
+        with pytest.raises(ValueError):
+            parse_strategy("sometimes")
+        with pytest.raises(ValueError):
+            parse_strategy("fixed:speed=1")
+        with pytest.raises(ValueError):
+            parse_strategy("fixed:0.1")
+
+
+class TestConfiguration:
+    def test_global_variable(self, _patch_robot):
+        _patch_robot._variables["${OKW_POLL_STRATEGY}"] = "BACKOFF:max=0.4"
+        assert get_poll_strategy() == BackoffPoll(0.05, 2, 0.4)
+
+    def test_widget_option_wins(self, _patch_robot):
+        _patch_robot._variables["${OKW_POLL_STRATEGY}"] = "BACKOFF"
+        w = MockWidget()
+        w.options = {"poll": {"strategy": "fastfirst", "count": 2}}
+        assert get_poll_strategy(w) == FastFirstPoll(0.02, 2, 0.01)
+
+    def test_default_uses_poll_verify(self):
+        assert get_poll_strategy() == FixedPoll(0.01)
+
+    def test_verify_uses_widget_strategy(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr("time.sleep", sleeps.append)
+        w = MockWidget(value="old")
+        w.options = {"poll": "fastfirst:fast=0.001,count=2,interval=0.002"}
+        values = iter(["a", "b", "c", "done"])
+        w.okw_get_value = lambda: next(values)
+        verify_with_timeout(w.okw_get_value, "done", MatchMode.EXACT, 5.0, "[t]", widget=w)
+        assert sleeps == [0.001, 0.001, 0.002]
+
+
+class FakeClock:
+    """Simulierte Uhr: sleep() laesst die Zeit vergehen, jede Probe kostet ``cost``."""
+
+    def __init__(self, cost=0.0):
+        self.now = 100.0
+        self.cost = cost
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestPollUntil:
+    def test_first_hit_no_sleep(self):
+        clock = FakeClock()
+        result = poll_until(lambda: "x", lambda v: v == "x", 5, clock=clock, sleep=clock.sleep)
+        assert result.ok and result.value == "x"
+        assert result.iterations == 1 and clock.sleeps == []
+
+    def test_deadline_caps_last_sleep(self, _patch_robot):
+        _patch_robot._variables["${OKW_POLL_VERIFY}"] = 0.4
+        clock = FakeClock()
+        result = poll_until(lambda: 0, bool, 1.0, clock=clock, sleep=clock.sleep)
+        assert not result
+        assert clock.sleeps == pytest.approx([0.4, 0.4, 0.2])
+        assert result.iterations == 4
+        assert result.sleep_time == pytest.approx(1.0)
+        assert result.elapsed == pytest.approx(1.0)
+
+    def test_zero_timeout_probes_once(self):
+        clock = FakeClock()
+        result = poll_until(lambda: 1, lambda v: v == 2, 0, clock=clock, sleep=clock.sleep)
+        assert result.iterations == 1 and result.value == 1 and clock.sleeps == []
+
+    def test_adapter_time_and_last_result(self):
+        clock = FakeClock()
+        values = iter([1, 2, 3])
+
+        def probe():
+            clock.now += 0.05
+            return next(values)
+
+        result = poll_until(probe, lambda v: v == 3, 5, clock=clock, sleep=clock.sleep)
+        assert result.ok and result.iterations == 3
+        assert result.adapter_time == pytest.approx(0.15)
+        assert last_poll_result() is result
+
+    def test_set_poll_clock(self):
+        clock = FakeClock()
+        set_poll_clock(clock, clock.sleep)
+        try:
+            values = iter(["a", "b"])
+            verify_with_timeout(lambda: next(values), "b", MatchMode.EXACT, 5.0, "[t]")
+        finally:
+            set_poll_clock()
+        assert clock.sleeps == [0.01]
@@ -0,0 +1,87 @@
+"""Tests fuer probe_keywords.py (IsExisting, IsVisible, IsEnabled, GetValue)."""
+
+import time
+
+import pytest
+from .mock_widget import MockWidget
+from .conftest import register_widget
+
+
+def _raise(error):
+    raise error
+
+
+class TestIsExisting:
+    def test_true_and_false(self):
+        from okw4robot.keywords.probe_keywords import ProbeKeywords
+        register_widget("Here", MockWidget(exists=True))
+        register_widget("Gone", MockWidget(exists=False))
+        assert ProbeKeywords().is_existing("Here") is True
+        assert ProbeKeywords().is_existing("Gone") is False
+
+    def test_absent_widget_does_not_wait(self, _patch_robot):
+        from okw4robot.keywords.probe_keywords import ProbeKeywords
+        from okw4robot.utils.okw_helpers import last_poll_result
+        _patch_robot._variables["${OKW_TIMEOUT_VERIFY_EXIST}"] = 5
+        register_widget("Gone", MockWidget(exists=False))
+        start = time.monotonic()
+        assert ProbeKeywords().is_existing("Gone") is False
+        assert time.monotonic() - start < 0.1
+        assert last_poll_result().iterations == 1
+
+    def test_explicit_timeout_waits_for_true(self):
+        from okw4robot.keywords.probe_keywords import ProbeKeywords
+        w = MockWidget()
+        answers = iter([False, False, True])
+        w.okw_exists = lambda: next(answers)
+        register_widget("Late", w)
+        assert ProbeKeywords().is_existing("Late", timeout="1s") is True
+
+    def test_read_error_is_false(self):
+        from okw4robot.keywords.probe_keywords import ProbeKeywords
+        w = MockWidget()
+        w.okw_exists = lambda: _raise(LookupError("stale"))
+        register_widget("Flaky", w)
+        assert ProbeKeywords().is_existing("Flaky") is False
+
+    def test_permanent_error_is_raised(self):
+        from okw4robot.keywords.probe_keywords import ProbeKeywords
+        w = MockWidget()
+        w.okw_exists = lambda: _raise(NotImplementedError("exists"))
+        register_widget("Odd", w)
+        with pytest.raises(NotImplementedError):
+            ProbeKeywords().is_existing("Odd", timeout=5)
+
+
+class TestIsVisibleEnabled:
+    def test_visible(self):
+        from okw4robot.keywords.probe_keywords import ProbeKeywords
+        register_widget("Spinner", MockWidget(visible=False))
+        assert ProbeKeywords().is_visible("Spinner") is False
+
+    def test_enabled(self):
+        from okw4robot.keywords.probe_keywords import ProbeKeywords
+        register_widget("Save", MockWidget(enabled=True))
+        assert ProbeKeywords().is_enabled("Save", timeout=0.05) is True
+
+
+class TestGetValue:
+    def test_returns_value(self):
+        from okw4robot.keywords.probe_keywords import ProbeKeywords
+        register_widget("Status", MockWidget(value="Saved"))
+        assert ProbeKeywords().get_value("Status") == "Saved"
+
+    def test_read_error_returns_empty(self):
+        from okw4robot.keywords.probe_keywords import ProbeKeywords
+        w = MockWidget()
+        w.okw_get_value = lambda: _raise(LookupError("stale"))
+        register_widget("Status", w)
+        assert ProbeKeywords().get_value("Status") == ""
+
+    def test_timeout_waits_for_non_empty(self):
+        from okw4robot.keywords.probe_keywords import ProbeKeywords
+        w = MockWidget()
+        answers = iter(["", "", "Saved"])
+        w.okw_get_value = lambda: next(answers)
+        register_widget("Status", w)
+        assert ProbeKeywords().get_value("Status", timeout="1s") == "Saved"
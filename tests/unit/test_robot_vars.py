@@ -0,0 +1,113 @@
+"""Tests fuer utils/robot_vars.py: Variablen-Snapshot und Listener."""
+
+import pytest
+
+from okw4robot.utils import robot_vars
+from okw4robot.utils.okw_helpers import get_robot_flag, get_robot_poll, get_robot_timeout, should_ignore
+from okw4robot.utils.robot_vars import VariableSnapshotListener
+from okw4robot.utils.table_tokens import get_tokens
+
+
+class CountingVariables(dict):
+    """Zaehlt Lesezugriffe auf FakeBuiltIn._variables."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.reads = 0
+
+    def get(self, key, default=None):
+        self.reads += 1
+        return super().get(key, default)
+
+
+@pytest.fixture
+def variables(_patch_robot):
+    counting = CountingVariables(_patch_robot._variables)
+    _patch_robot._variables = counting
+    return counting
+
+
+@pytest.fixture
+def listener():
+    lst = VariableSnapshotListener()
+    lst.start_suite("Suite", {})
+    lst.start_test("Test", {})
+    return lst
+
+
+def kw(libname="OKW4RobotLibrary", kwname="VerifyValue", assign=(), type_="KEYWORD"):
+    return {"libname": libname, "kwname": kwname, "assign": list(assign), "type": type_}
+
+
+class TestSnapshot:
+    def test_inactive_reads_every_time(self, variables):
+        get_robot_timeout("${OKW_TIMEOUT_VERIFY_VALUE}", 10)
+        get_robot_timeout("${OKW_TIMEOUT_VERIFY_VALUE}", 10)
+        assert variables.reads == 2
+
+    def test_active_reads_once(self, variables, listener):
+        for _ in range(5):
+            assert get_robot_timeout("${OKW_TIMEOUT_VERIFY_VALUE}", 10) == 0.1
+            assert get_robot_flag("${OKW_IGNORE_EMPTY}") is False
+            should_ignore("")
+        assert variables.reads == 2
+
+    def test_table_tokens_cached_and_copied(self, variables, listener):
+        tokens = get_tokens()
+        tokens["CELL_SEP"] = "X"
+        assert get_tokens()["CELL_SEP"] == "$TAB"
+        assert variables.reads == 5
+
+    def test_get_variable_missing(self, variables, listener):
+        assert robot_vars.get_variable("${NOPE}", "dflt") == "dflt"
+        assert robot_vars.get_variable("${NOPE}") is None
+        assert variables.reads == 1
+
+    def test_set_okw_parameter_invalidates(self, variables, listener):
+        from okw4robot.keywords.params import ParamsKeywords
+
+        assert get_robot_timeout("${OKW_TIMEOUT_VERIFY_VALUE}", 10) == 0.1
+        ParamsKeywords().set_okw_parameter("TimeOutVerifyValue", 3)
+        assert get_robot_timeout("${OKW_TIMEOUT_VERIFY_VALUE}", 10) == 3.0
+
+
+class TestListener:
+    def test_test_boundaries_invalidate(self, variables, listener):
+        assert get_robot_poll() == 0.01
+        variables["${OKW_POLL_VERIFY}"] = 0.5
+        assert get_robot_poll() == 0.01
+        listener.end_test("Test", {})
+        listener.start_test("Next", {})
+        assert get_robot_poll() == 0.5
+
+    def test_own_keywords_keep_snapshot(self, variables, listener):
+        get_robot_timeout("${OKW_POLL_VERIFY}", 0.1)
+        listener.start_keyword("VerifyValue", kw())
+        listener.end_keyword("VerifyValue", kw())
+        get_robot_timeout("${OKW_POLL_VERIFY}", 0.1)
+        assert variables.reads == 1
+
+    @pytest.mark.parametrize("attrs", [
+        kw("BuiltIn", "Set Suite Variable"),
+        kw("BuiltIn", "Set Test Variable"),
+        kw("BuiltIn", "Import Variables"),
+        kw("BuiltIn", "Set Variable", assign=["${OKW_POLL_VERIFY}"]),
+        kw("", "", type_="VAR"),
+    ])
+    def test_variable_changes_invalidate(self, variables, listener, attrs):
+        get_robot_timeout("${OKW_POLL_VERIFY}", 0.1)
+        listener.start_keyword("kw", attrs)
+        variables["${OKW_POLL_VERIFY}"] = 0.5
+        listener.end_keyword("kw", attrs)
+        assert get_robot_timeout("${OKW_POLL_VERIFY}", 0.1) == 0.5
+
+    def test_local_assignment_dropped_when_user_keyword_returns(self, variables, listener):
+        set_local = kw("BuiltIn", "Set Variable", assign=["${OKW_POLL_VERIFY}"])
+        listener.start_keyword("My Keyword", kw("", "My Keyword"))
+        listener.start_keyword("Set Variable", set_local)
+        variables["${OKW_POLL_VERIFY}"] = 0.5
+        listener.end_keyword("Set Variable", set_local)
+        assert get_robot_timeout("${OKW_POLL_VERIFY}", 0.1) == 0.5
+        variables["${OKW_POLL_VERIFY}"] = 0.01  # local scope ends
+        listener.end_keyword("My Keyword", kw("", "My Keyword"))
+        assert get_robot_timeout("${OKW_POLL_VERIFY}", 0.1) == 0.01
@@ -0,0 +1,443 @@
+"""Tests fuer table_keywords.py mit MockWidget."""
+
+import pytest
+from .mock_widget import MockWidget
+from .conftest import register_widget
+
+from okw4robot.keywords.table_keywords import TableKeywords
+from okw4robot.utils.okw_helpers import last_poll_result
+from okw4robot.widgets.okw_widget import OkwWidget
+
+
+HEADERS = ["ID", "Name", "Price"]
+ROWS = [
+    ["1", "Foo", "9.99"],
+    ["2", "Bar", ""],
+    ["3", "Baz", "1.50"],
+]
+
+
+@pytest.fixture
+def kw():
+    register_widget("Items", MockWidget(headers=HEADERS, rows=[list(r) for r in ROWS]))
+    return TableKeywords()
+
+
+class TestVerifyTableContent:
+    def test_row_content(self, kw):
+        kw.verify_table_row_content("Items", 1, "1$TABF*$TAB9.9?")
+
+    def test_row_content_fail_reports_cell(self, kw):
+        with pytest.raises(AssertionError, match="Cell 2 mismatch"):
+            kw.verify_table_row_content("Items", 1, "1$TABBar$TAB9.99")
+
+    def test_column_content(self, kw):
+        kw.verify_table_column_content("Items", 3, "9.99$LF$EMPTY$LF1.5*")
+
+    def test_cell_value(self, kw):
+        kw.verify_table_cell_value("Items", 2, 3, "$EMPTY")
+
+    def test_counts(self, kw):
+        kw.verify_table_row_count("Items", 3)
+        kw.verify_table_column_count("Items", "3")
+        with pytest.raises(AssertionError, match="Expected 4 rows, got 3"):
+            kw.verify_table_row_count("Items", 4)
+
+    def test_has_row(self, kw):
+        kw.verify_table_has_row("Items", "3$TABBa?$TAB*")
+        with pytest.raises(AssertionError):
+            kw.verify_table_has_row("Items", "4$TAB*$TAB*")
+
+    def test_table_content(self, kw):
+        kw.verify_table_content("Items", "1$TABFoo$TAB9.99$LF2$TABBar$TAB$EMPTY$LF3$TABBaz$TAB*")
+        with pytest.raises(AssertionError, match="Row count mismatch"):
+            kw.verify_table_content("Items", "1$TABFoo$TAB9.99")
+
+
+class TestVerifyTableByHeaders:
+    def test_cell_by_headers(self, kw):
+        kw.verify_table_cell_value_by_headers("Items", "2", "Name", "Bar")
+
+    def test_cell_by_headers_no_row(self, kw):
+        with pytest.raises(AssertionError, match="No row matched"):
+            kw.verify_table_cell_value_by_headers("Items", "9", "Name", "Bar")
+
+    def test_cell_by_headers_not_unique(self, kw):
+        with pytest.raises(AssertionError, match="not unique"):
+            kw.verify_table_cell_value_by_headers("Items", "*", "Name", "Bar")
+
+    def test_cell_by_headers_value_mismatch(self, kw):
+        with pytest.raises(AssertionError, match="Expected 'Baz', got 'Bar'"):
+            kw.verify_table_cell_value_by_headers("Items", "2", "Name", "Baz")
+
+    def test_unknown_header(self, kw):
+        with pytest.raises(ValueError):
+            kw.verify_table_cell_value_by_headers("Items", "2", "Nope", "Bar")
+
+    def test_row_by_header(self, kw):
+        kw.verify_table_row_content_by_header("Items", "Name", "Baz", "3$TABBaz$TAB1.50")
+
+    def test_column_by_header(self, kw):
+        kw.verify_table_column_content_by_header("Items", "Name", "Foo$LFBar$LFBaz")
+
+    def test_regx_variants(self, kw):
+        kw.verify_table_cell_value_by_headers_regx("Items", "1", "Price", r"^\d+\.\d{2}$")
+        kw.verify_table_row_content_by_header_regx("Items", "ID", "2", "^2$$TABB.r$TAB$EMPTY")
+        kw.verify_table_column_content_by_header_regx("Items", "Price", r"9\.99$LF$EMPTY$LF^1")
+        with pytest.raises(AssertionError, match="does not match regex"):
+            kw.verify_table_column_content_by_header_regx("Items", "Price", r"^1$LF$EMPTY$LF^1")
+
+
+class TestTablePolling:
+    def test_waits_for_row_count(self, kw):
+        tbl = MockWidget(rows=[])
+        register_widget("Late", tbl)
+        original = tbl.get_row_count
+        calls = []
+
+        def growing():
+            calls.append(1)
+            if len(calls) == 3:
+                tbl.mock_rows = [list(r) for r in ROWS]
+            return original()
+
+        tbl.get_row_count = growing
+        kw.verify_table_row_count("Late", 3)
+        assert last_poll_result().iterations == 3
+
+    def test_zero_timeout_checks_once(self, kw, _patch_robot):
+        _patch_robot._variables["${OKW_TIMEOUT_VERIFY_TABLE}"] = 0
+        with pytest.raises(AssertionError):
+            kw.verify_table_cell_value("Items", 1, 2, "Bar")
+        assert last_poll_result().iterations == 1
+
+
+class SnapshotWidget(MockWidget):
+    """Schnappschuss ohne native Projektion (``get_cells``/``get_columns`` aus ``OkwWidget``)."""
+
+    get_cells = OkwWidget.get_cells
+    get_columns = OkwWidget.get_columns
+
+
+class TestTableSnapshot:
+    @pytest.fixture
+    def snap(self):
+        tbl = SnapshotWidget(headers=HEADERS, rows=[list(r) for r in ROWS], snapshot=True)
+        register_widget("Grid", tbl)
+        return tbl
+
+    def _driver_calls(self, tbl):
+        skip = ("get_header_names", "get_table_version", "get_row_fingerprints")
+        return [c[0] for c in tbl.calls if c[0] not in skip]
+
+    def test_content_uses_one_call_per_poll(self, kw, snap):
+        kw.verify_table_content("Grid", "1$TABFoo$TAB9.99$LF2$TABBar$TAB$EMPTY$LF3$TABBaz$TAB*")
+        assert self._driver_calls(snap) == ["get_table_snapshot"]
+
+    def test_content_mismatch_reported_from_snapshot(self, kw, snap):
+        with pytest.raises(AssertionError, match="Mismatch at r2c2"):
+            kw.verify_table_content("Grid", "1$TABFoo$TAB9.99$LF2$TABBaz$TAB$EMPTY$LF3$TABBaz$TAB*")
+
+    def test_has_row(self, kw, snap):
+        kw.verify_table_has_row("Grid", "3$TABBa?$TAB*")
+        assert self._driver_calls(snap) == ["get_table_snapshot"]
+
+    def test_by_header_variants(self, kw, snap):
+        kw.verify_table_cell_value_by_headers("Grid", "2", "Name", "Bar")
+        kw.verify_table_row_content_by_header("Grid", "Name", "Baz", "3$TABBaz$TAB1.50")
+        kw.verify_table_cell_value_by_headers_regx("Grid", "1", "Price", r"^9")
+        kw.verify_table_row_content_by_header_regx("Grid", "ID", "2", "^2$$TABB.r$TAB$EMPTY")
+        with pytest.raises(AssertionError, match="not unique"):
+            kw.verify_table_cell_value_by_headers("Grid", "*", "Name", "Bar")
+        assert set(self._driver_calls(snap)) <= {"get_table_snapshot", "get_row_key_column_index"}
+
+    def test_keyed_cell_reads_snapshot_once_per_poll(self, kw, snap):
+        kw.verify_table_cell_value_by_headers("Grid", "2", "Name", "Bar")
+        kw.verify_table_cell_value_by_headers_regx("Grid", "3", "Price", r"^1\.5")
+        assert self._driver_calls(snap).count("get_table_snapshot") == 2
+
+    def test_projection_wins_over_snapshot(self, kw):
+        tbl = MockWidget(headers=HEADERS, rows=[list(r) for r in ROWS], snapshot=True)
+        register_widget("Projected", tbl)
+        kw.verify_table_cell_value_by_headers("Projected", "2", "Name", "Bar")
+        kw.verify_table_row_content_by_header("Projected", "ID", "3", "3$TABBaz$TAB1.50")
+        calls = self._driver_calls(tbl)
+        assert "get_table_snapshot" not in calls
+        assert "get_columns" in calls
+
+    def test_large_grid_round_trips(self, kw):
+        rows = [[str(i), f"Item {i}", "ok"] for i in range(1, 501)]
+        tbl = MockWidget(headers=HEADERS, rows=rows, snapshot=True)
+        register_widget("Big", tbl)
+        pattern = "$LF".join(f"{i}$TABItem {i}$TABok" for i in range(1, 501))
+        kw.verify_table_content("Big", pattern)
+        assert self._driver_calls(tbl) == ["get_table_snapshot"]
+
+    def test_fallback_without_snapshot(self, kw):
+        kw.verify_table_content("Items", "1$TABFoo$TAB9.99$LF2$TABBar$TAB$EMPTY$LF3$TABBaz$TAB*")
+        from .conftest import _widget_registry
+        calls = [c[0] for c in _widget_registry["Items"].calls]
+        assert calls.count("get_row_texts") == 3
+
+
+class TestTableIndex:
+    @pytest.fixture
+    def grid(self):
+        rows = [[str(i), f"Item {i}", "ok"] for i in range(1, 201)]
+        tbl = MockWidget(headers=list(HEADERS), rows=rows, versioned=True)
+        register_widget("Grid", tbl)
+        return tbl
+
+    def _count(self, tbl, method):
+        return sum(1 for c in tbl.calls if c[0] == method)
+
+    def test_keyed_lookup_without_cell_scan(self, kw, grid):
+        kw.verify_table_cell_value_by_headers("Grid", "150", "Name", "Item 150")
+        assert self._count(grid, "get_cell_text") == 0
+        assert self._count(grid, "get_columns") == 1
+        assert self._count(grid, "get_row_texts") == 0
+
+    def test_index_reused_across_keywords(self, kw, grid):
+        kw.verify_table_cell_value_by_headers("Grid", "7", "Price", "ok")
+        kw.verify_table_row_content_by_header("Grid", "ID", "8", "8$TABItem 8$TABok")
+        kw.verify_table_cell_value_by_headers_regx("Grid", "9", "Name", "^Item 9$")
+        assert self._count(grid, "get_header_names") == 1
+        assert self._count(grid, "get_columns") == 1
+
+    def test_write_keyword_invalidates(self, kw, grid):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        register_widget("Refresh", MockWidget())
+        kw.verify_table_cell_value_by_headers("Grid", "7", "Price", "ok")
+        WidgetKeywords().click_on("Refresh")
+        kw.verify_table_cell_value_by_headers("Grid", "7", "Price", "ok")
+        assert self._count(grid, "get_header_names") == 2
+        assert self._count(grid, "get_columns") == 2
+
+    def test_set_focus_invalidates(self, kw, grid):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        register_widget("Search", MockWidget())
+        kw.verify_table_cell_value_by_headers("Grid", "7", "Price", "ok")
+        WidgetKeywords().set_focus("Search")
+        kw.verify_table_cell_value_by_headers("Grid", "7", "Price", "ok")
+        assert self._count(grid, "get_header_names") == 2
+
+    def test_row_count_change_rebuilds(self, kw, grid):
+        kw.verify_table_cell_value_by_headers("Grid", "7", "Price", "ok")
+        grid.mock_rows.append(["201", "Item 201", "new"])
+        kw.verify_table_cell_value_by_headers("Grid", "201", "Price", "new")
+        assert self._count(grid, "get_columns") == 2
+
+    def test_stale_keys_are_rechecked(self, kw, grid):
+        kw.verify_table_cell_value_by_headers("Grid", "7", "Price", "ok")
+        grid.mock_rows[6], grid.mock_rows[7] = grid.mock_rows[7], grid.mock_rows[6]
+        grid.mock_rows[6][2] = "moved"
+        kw.verify_table_cell_value_by_headers("Grid", "8", "Price", "moved")
+        kw.verify_table_cell_value_by_headers("Grid", "7", "Price", "ok")
+
+    def test_version_change_rebuilds_keys(self, kw):
+        rows = [[str(i), f"Item {i}", "ok"] for i in range(1, 11)]
+        grid = MockWidget(headers=HEADERS, rows=rows, versioned=True)
+        register_widget("Grid", grid)
+        kw.verify_table_cell_value_by_headers("Grid", "7", "Price", "ok")
+        grid.mock_rows[7][0] = "7"
+        with pytest.raises(AssertionError, match="not unique"):
+            kw.verify_table_cell_value_by_headers("Grid", "7", "Price", "ok")
+
+    def test_key_found_after_in_place_edit(self, kw, grid):
+        kw.verify_table_cell_value_by_headers("Grid", "7", "Price", "ok")
+        grid.mock_rows[4][0] = "X"
+        kw.verify_table_cell_value_by_headers("Grid", "X", "Name", "Item 5")
+
+    def test_reordered_columns_rebuild_headers(self, kw, grid):
+        kw.verify_table_cell_value_by_headers("Grid", "7", "Price", "ok")
+        grid.mock_headers[1], grid.mock_headers[2] = grid.mock_headers[2], grid.mock_headers[1]
+        for r in grid.mock_rows:
+            r[1], r[2] = r[2], r[1]
+        kw.verify_table_cell_value_by_headers("Grid", "7", "Price", "ok")
+
+    def test_without_version_headers_are_reread(self, kw):
+        tbl = MockWidget(headers=list(HEADERS), rows=[list(r) for r in ROWS])
+        register_widget("Plain", tbl)
+        kw.verify_table_cell_value_by_headers("Plain", "1", "Price", "9.99")
+        tbl.mock_headers[1], tbl.mock_headers[2] = tbl.mock_headers[2], tbl.mock_headers[1]
+        for r in tbl.mock_rows:
+            r[1], r[2] = r[2], r[1]
+        kw.verify_table_cell_value_by_headers("Plain", "1", "Price", "9.99")
+        assert self._count(tbl, "get_header_names") == 2
+
+    def test_without_version_duplicate_key_detected(self, kw):
+        tbl = MockWidget(headers=HEADERS, rows=[list(r) for r in ROWS])
+        register_widget("Plain", tbl)
+        kw.verify_table_cell_value_by_headers("Plain", "1", "Name", "Foo")
+        tbl.mock_rows[1][0] = "1"
+        with pytest.raises(AssertionError, match="not unique"):
+            kw.verify_table_cell_value_by_headers("Plain", "1", "Name", "Foo")
+
+    def test_wildcard_key_uses_cached_column(self, kw, grid):
+        kw.verify_table_cell_value_by_headers("Grid", "20?", "Name", "Item 200")
+        with pytest.raises(AssertionError, match="not unique"):
+            kw.verify_table_cell_value_by_headers("Grid", "1*", "Name", "*")
+        assert self._count(grid, "get_cell_text") == 0
+
+
+class TestTableProjection:
+    @pytest.fixture
+    def grid(self):
+        tbl = MockWidget(headers=HEADERS, rows=[list(r) for r in ROWS])
+        register_widget("Grid", tbl)
+        return tbl
+
+    def test_index_build_fetches_key_and_target_column(self, kw, grid):
+        kw.verify_table_cell_value_by_headers("Grid", "3", "Price", "1.50")
+        assert ("get_columns", ([1, 3],)) in grid.calls
+
+    def test_cached_index_reads_two_cells(self, kw):
+        grid = MockWidget(headers=HEADERS, rows=[list(r) for r in ROWS], versioned=True)
+        register_widget("Grid", grid)
+        kw.verify_table_cell_value_by_headers("Grid", "3", "Price", "1.50")
+        grid.calls.clear()
+        kw.verify_table_cell_value_by_headers("Grid", "1", "Name", "Foo")
+        assert [c for c in grid.calls if c[0] not in ("get_row_key_column_index", "get_table_snapshot")] == [
+            ("get_table_version", ()),
+            ("get_row_count", ()),
+            ("get_table_version", ()),
+            ("get_row_count", ()),
+            ("get_cells", ([(1, 1), (1, 2)],)),
+        ]
+
+    def test_without_version_reads_key_and_target_column_per_poll(self, kw, grid):
+        kw.verify_table_cell_value_by_headers("Grid", "3", "Price", "1.50")
+        grid.calls.clear()
+        kw.verify_table_cell_value_by_headers("Grid", "1", "Name", "Foo")
+        assert ("get_columns", ([1, 2],)) in grid.calls
+        assert not any(c[0] == "get_cells" for c in grid.calls)
+
+    def test_base_defaults_use_single_cell_and_column_calls(self, grid):
+        from okw4robot.widgets.okw_widget import OkwWidget
+        assert OkwWidget.get_cells(grid, [(1, 2), (3, 3)]) == ["Foo", "1.50"]
+        assert OkwWidget.get_columns(grid, [2]) == [["Foo", "Bar", "Baz"]]
+        assert [c[0] for c in grid.calls] == ["get_cell_text", "get_cell_text", "get_column_texts"]
+
+
+class TestTableVersioning:
+    @pytest.fixture
+    def grid(self):
+        rows = [[str(i), f"Item {i}", "pending"] for i in range(1, 51)]
+        tbl = MockWidget(headers=HEADERS, rows=rows, versioned=True)
+        register_widget("Grid", tbl)
+        return tbl
+
+    def _pattern(self, status_of):
+        return "$LF".join(f"{i}$TABItem {i}$TAB{status_of(i)}" for i in range(1, 51))
+
+    def test_only_changed_rows_are_refetched(self, kw, grid):
+        original = grid.get_table_version
+        polls = []
+
+        def version():
+            polls.append(1)
+            if len(polls) == 3:
+                grid.mock_rows[9][2] = "done"
+            return original()
+
+        grid.get_table_version = version
+        kw.verify_table_content("Grid", self._pattern(lambda i: "done" if i == 10 else "pending"))
+        fetched = [c[1][0] for c in grid.calls if c[0] == "get_row_texts"]
+        assert fetched[50:] == [10]
+
+    def test_unchanged_token_skips_refetch(self, kw, grid):
+        with pytest.raises(AssertionError, match="Mismatch at r1c3"):
+            kw.verify_table_content("Grid", self._pattern(lambda i: "done"))
+        assert last_poll_result().iterations > 1
+        assert sum(1 for c in grid.calls if c[0] == "get_row_texts") == 50
+        assert sum(1 for c in grid.calls if c[0] == "get_row_fingerprints") == 1
+
+    def test_has_row_sees_new_rows(self, kw, grid):
+        original = grid.get_table_version
+        polls = []
+
+        def version():
+            polls.append(1)
+            if len(polls) == 3:
+                grid.mock_rows.append(["51", "Item 51", "new"])
+            return original()
+
+        grid.get_table_version = version
+        kw.verify_table_has_row("Grid", "51$TAB*$TABnew")
+        fetched = [c[1][0] for c in grid.calls if c[0] == "get_row_texts"]
+        assert fetched[50:] == [51]
+
+
+class PagedWidget(MockWidget):
+    """MockWidget mit eigenem iter_rows(): eine Seite pro Aufruf."""
+
+    def iter_rows(self, start=1, page_size=100):
+        r = start
+        while r <= len(self.mock_rows):
+            self._record("page", r, page_size)
+            page = [list(row) for row in self.mock_rows[r - 1:r - 1 + page_size]]
+            yield from page
+            r += page_size
+
+
+class TestTableStreaming:
+    @pytest.fixture
+    def big(self, _patch_robot):
+        _patch_robot._variables["${OKW_TABLE_PAGE_SIZE}"] = 10
+        rows = [[str(i), f"Item {i}", "ok"] for i in range(1, 1001)]
+        tbl = PagedWidget(headers=HEADERS, rows=rows, snapshot=True)
+        register_widget("Big", tbl)
+        return tbl
+
+    def _pages(self, tbl):
+        return [c[1] for c in tbl.calls if c[0] == "page"]
+
+    def test_has_row_stops_at_first_match(self, kw, big):
+        kw.verify_table_has_row("Big", "15$TAB*$TABok")
+        assert self._pages(big) == [(1, 10), (11, 10)]
+        assert not any(c[0] == "get_table_snapshot" for c in big.calls)
+
+    def test_content_stops_at_first_mismatch(self, kw, big, _patch_robot):
+        _patch_robot._variables["${OKW_TIMEOUT_VERIFY_TABLE}"] = 0
+        pattern = "$LF".join(f"{i}$TABItem {i}$TAB{'bad' if i == 3 else 'ok'}" for i in range(1, 1001))
+        with pytest.raises(AssertionError, match="Mismatch at r3c3: expected 'bad', got 'ok'"):
+            kw.verify_table_content("Big", pattern)
+        assert self._pages(big) == [(1, 10)]
+
+    def test_content_reports_row_count_first(self, kw, big, _patch_robot):
+        _patch_robot._variables["${OKW_TIMEOUT_VERIFY_TABLE}"] = 0
+        with pytest.raises(AssertionError, match="Row count mismatch: expected 2, got 1000"):
+            kw.verify_table_content("Big", "1$TABItem 1$TABok$LF2$TABItem 2$TABok")
+        with pytest.raises(AssertionError, match="Row count mismatch: expected 2, got 1000"):
+            kw.verify_table_content("Big", "1$TABItem 1$TABok$LF9$TABItem 2$TABok")
+
+    def test_default_iter_rows_is_lazy(self, kw):
+        rows = [[str(i), f"Item {i}", "ok"] for i in range(1, 101)]
+        tbl = MockWidget(headers=HEADERS, rows=rows)
+        register_widget("Plain", tbl)
+        kw.verify_table_has_row("Plain", "4$TAB*$TAB*")
+        assert [c[1][0] for c in tbl.calls if c[0] == "get_row_texts"] == [1, 2, 3, 4]
+
+    def test_stream_error_does_not_mark_version_as_seen(self, kw):
+        rows = [[str(i), f"Item {i}", "pending"] for i in range(1, 6)]
+        tbl = PagedWidget(headers=HEADERS, rows=rows)
+        register_widget("Flaky", tbl)
+        polls = []
+
+        def version():
+            polls.append(1)
+            if len(polls) == 2:
+                tbl.mock_rows[4][2] = "done"
+            return 1 if len(polls) == 1 else 2
+
+        def iter_rows(start=1, page_size=100):
+            if len(polls) == 2:
+                yield list(tbl.mock_rows[0])
+                raise LookupError("stale element")
+            yield from PagedWidget.iter_rows(tbl, start, page_size)
+
+        tbl.get_table_version = version
+        tbl.iter_rows = iter_rows
+        pattern = "$LF".join(f"{i}$TABItem {i}$TAB{'done' if i == 5 else 'pending'}" for i in range(1, 6))
+        kw.verify_table_content("Flaky", pattern)
+        assert len(polls) == 3
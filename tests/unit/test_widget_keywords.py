@@ -61,6 +61,75 @@ class TestSetValue:
         assert ("okw_set_value", ("$DELETE",)) == w.calls[0]
 
 
+class BatchWidget(MockWidget):
+    """MockWidget mit Batch-Setter; protokolliert jeden Batch-Aufruf."""
+
+    batches = []
+
+    @classmethod
+    def okw_set_values_batch(cls, items):
+        cls.batches.append([(w.name, v) for w, v in items])
+
+
+class TestSetValues:
+    @pytest.fixture(autouse=True)
+    def _reset_batches(self):
+        BatchWidget.batches = []
+
+    def _register(self, cls, *names):
+        widgets = {}
+        for n in names:
+            w = cls()
+            w.name = n
+            register_widget(n, w)
+            widgets[n] = w
+        return widgets
+
+    def test_sequential_fallback_with_tokens(self, _patch_robot):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        _patch_robot._variables["${OKW_IGNORE_EMPTY}"] = "YES"
+        ws = self._register(MockWidget, "User", "Pass", "Comment", "Extra")
+        WidgetKeywords().set_values("User$TABadmin$LFPass$TAB$IGNORE$LFComment$TAB$EMPTY$LFExtra$TAB")
+        assert ws["User"].calls == [("okw_set_value", ("admin",))]
+        assert ws["Pass"].calls == []
+        assert ws["Comment"].calls == [("okw_set_value", ("",))]
+        assert ws["Extra"].calls == []
+
+    def test_batch_in_one_call(self):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        ws = self._register(BatchWidget, "User", "Pass")
+        WidgetKeywords().set_values({"User": "admin", "Pass": "geheim"})
+        assert BatchWidget.batches == [[("User", "admin"), ("Pass", "geheim")]]
+        assert ws["User"].calls == [] and ws["Pass"].calls == []
+
+    def test_mixed_classes_keep_order(self):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        self._register(BatchWidget, "A", "B", "D")
+        plain = self._register(MockWidget, "C")
+        WidgetKeywords().set_values(["A", "1", "B", "2", "C", "3", "D", "4"])
+        assert BatchWidget.batches == [[("A", "1"), ("B", "2")], [("D", "4")]]
+        assert plain["C"].calls == [("okw_set_value", ("3",))]
+
+    def test_batch_not_implemented_falls_back(self):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+
+        class NoBatch(MockWidget):
+            @classmethod
+            def okw_set_values_batch(cls, items):
+                raise NotImplementedError
+
+        ws = self._register(NoBatch, "User")
+        WidgetKeywords().set_values({"User": "admin"})
+        assert ws["User"].calls == [("okw_set_value", ("admin",))]
+
+    def test_unknown_name_fails_before_writing(self):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        ws = self._register(MockWidget, "User")
+        with pytest.raises(KeyError):
+            WidgetKeywords().set_values({"User": "admin", "Missing": "x"})
+        assert ws["User"].calls == []
+
+
 class TestSelect:
     def test_select_delegates(self):
         w = MockWidget()
@@ -111,6 +180,106 @@ class TestVerifyValue:
         kw.verify_value("Input", "$IGNORE")  # should not raise
 
 
+class TestVerifyValues:
+    @pytest.fixture
+    def form(self):
+        fields = {
+            "User": MockWidget(value="admin"),
+            "Role": MockWidget(value="Editor"),
+            "Zip": MockWidget(value="12345"),
+        }
+        for name, w in fields.items():
+            register_widget(name, w)
+        return fields
+
+    def test_dict(self, form):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        WidgetKeywords().verify_values({"User": "admin", "Role": "Editor", "Zip": "$IGNORE"})
+        assert form["Zip"].calls == []
+
+    def test_token_string_and_list(self, form):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        kw = WidgetKeywords()
+        kw.verify_values("User$TABadmin$LFRole$TABEditor")
+        kw.verify_values(["User", "admin", "Zip", "12345"])
+        kw.verify_values_wcm([("User", "adm*"), ("Role", "Ed?tor")])
+        kw.verify_values_regx("Zip$TAB^[0-9]{5}$")
+
+    def test_empty_token_expects_empty(self, form, _patch_robot):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        _patch_robot._variables["${OKW_IGNORE_EMPTY}"] = "YES"
+        register_widget("Note", MockWidget(value=""))
+        WidgetKeywords().verify_values("User$TABadmin$LFNote$TAB$EMPTY")
+        with pytest.raises(AssertionError):
+            WidgetKeywords().verify_values({"User": "$EMPTY"})
+
+    def test_reports_all_mismatches(self, form):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        with pytest.raises(AssertionError) as exc:
+            WidgetKeywords().verify_values({"User": "root", "Role": "Editor", "Zip": "99999"})
+        msg = str(exc.value)
+        assert "2 of 3" in msg and "'User'" in msg and "'Zip'" in msg and "'Role'" not in msg
+
+    def test_matched_fields_are_not_read_again(self, form):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        from okw4robot.utils.okw_helpers import last_poll_result
+        answers = iter(["", "", "done"])
+        form["Role"].okw_get_value = lambda: next(answers)
+        WidgetKeywords().verify_values({"User": "admin", "Role": "done"})
+        assert last_poll_result().iterations == 3
+        assert len(form["User"].calls) == 1
+
+    def test_shared_deadline(self, form, _patch_robot):
+        import time
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        _patch_robot._variables["${OKW_TIMEOUT_VERIFY_VALUE}"] = 0.2
+        start = time.monotonic()
+        with pytest.raises(AssertionError):
+            WidgetKeywords().verify_values({"User": "x", "Role": "y", "Zip": "z"})
+        assert time.monotonic() - start < 0.5
+
+    def test_shared_widget_strategy_is_used(self, form, monkeypatch):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        sleeps = []
+        monkeypatch.setattr("time.sleep", sleeps.append)
+        answers = iter(["", "", "", "done"])
+        form["Role"].okw_get_value = lambda: next(answers)
+        for w in form.values():
+            w.options = {"poll": "fastfirst:fast=0.001,count=2,interval=0.002"}
+        WidgetKeywords().verify_values({"User": "admin", "Role": "done"})
+        assert sleeps == [0.001, 0.001, 0.002]
+
+    def test_mixed_strategies_use_global(self, form, monkeypatch):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        sleeps = []
+        monkeypatch.setattr("time.sleep", sleeps.append)
+        answers = iter(["", "done"])
+        form["Role"].okw_get_value = lambda: next(answers)
+        form["Role"].options = {"poll": "fastfirst:fast=0.001,count=2"}
+        WidgetKeywords().verify_values_wcm({"User": "adm*", "Role": "done"})
+        assert sleeps == [0.01]
+
+    def test_native_wait_per_field(self, form):
+        from okw_contract_utils import MatchMode
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        native = NativeWaitWidget(value="other")
+        register_widget("Status", native)
+        WidgetKeywords().verify_values({"User": "admin", "Status": "ready"})
+        assert native.waits == [("value", "ready", MatchMode.EXACT)]
+        assert not any(c[0] == "okw_get_value" for c in native.calls)
+
+    def test_invalid_regex_fails_before_reading(self, form):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        with pytest.raises(AssertionError, match="Invalid REGX"):
+            WidgetKeywords().verify_values_regx({"User": "(["})
+        assert form["User"].calls == []
+
+    def test_odd_list_rejected(self, form):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        with pytest.raises(ValueError):
+            WidgetKeywords().verify_values(["User", "admin", "Role"])
+
+
 class TestVerifyExist:
     def test_verify_exist_yes(self):
         w = MockWidget(exists=True)
@@ -135,6 +304,80 @@ class TestVerifyExist:
             kw.verify_exist("Elem", "YES")
 
 
+class TestVerifyAny:
+    @pytest.fixture
+    def screen(self):
+        widgets = {
+            "Banner": MockWidget(exists=False),
+            "ErrorDialog": MockWidget(exists=False, visible=False),
+        }
+        for name, w in widgets.items():
+            register_widget(name, w)
+        return widgets
+
+    def test_returns_condition_that_holds(self, screen):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        screen["ErrorDialog"].mock_visible = True
+        assert WidgetKeywords().verify_any("Banner", "ErrorDialog:visible") == "ErrorDialog:visible"
+
+    def test_argument_order_is_priority(self, screen):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        screen["Banner"].mock_exists = True
+        screen["ErrorDialog"].mock_exists = True
+        assert WidgetKeywords().verify_any("ErrorDialog", "Banner") == "ErrorDialog"
+
+    def test_polls_all_in_one_loop(self, screen):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        from okw4robot.utils.okw_helpers import last_poll_result
+        answers = iter([False, False, True])
+        screen["Banner"].okw_exists = lambda: next(answers)
+        assert WidgetKeywords().verify_any("ErrorDialog", "Banner:EXISTS") == "Banner:EXISTS"
+        assert last_poll_result().iterations == 3
+
+    def test_one_shared_deadline(self, screen):
+        import time
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        start = time.monotonic()
+        with pytest.raises(AssertionError, match="Banner, ErrorDialog:visible"):
+            WidgetKeywords().verify_any("Banner", "ErrorDialog:visible", timeout="0.2s")
+        assert 0.2 <= time.monotonic() - start < 0.35
+
+    def test_wait_for_first_returns_empty_on_timeout(self, screen):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        assert WidgetKeywords().wait_for_first("Banner", "ErrorDialog") == ""
+
+    def test_transient_error_counts_as_false(self, screen):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        screen["Banner"].okw_exists = lambda: _raise(LookupError("stale"))
+        screen["ErrorDialog"].mock_exists = True
+        assert WidgetKeywords().verify_any("Banner", "ErrorDialog") == "ErrorDialog"
+
+    def test_permanent_error_aborts(self, screen):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        screen["Banner"].okw_is_clickable = lambda: _raise(NotImplementedError("clickable"))
+        with pytest.raises(NotImplementedError):
+            WidgetKeywords().wait_for_first("Banner:clickable", "ErrorDialog", timeout=5)
+
+    def test_colon_in_widget_name(self, screen):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        register_widget("Dialog:Title", MockWidget(exists=True))
+        register_widget("Dialog:Close", MockWidget(exists=False, visible=True))
+        kw = WidgetKeywords()
+        assert kw.verify_any("Banner", "Dialog:Title") == "Dialog:Title"
+        assert kw.verify_any("Banner", "Dialog:Close:visible") == "Dialog:Close:visible"
+
+    def test_unknown_state_is_part_of_name(self, screen):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        with pytest.raises(Exception, match="Banner:shiny"):
+            WidgetKeywords().verify_any("Banner:shiny")
+
+    def test_unknown_widget_fails_before_polling(self, screen):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        with pytest.raises(Exception):
+            WidgetKeywords().verify_any("Banner", "Nope")
+        assert screen["Banner"].calls == []
+
+
 class TestSetFocus:
     def test_set_focus_delegates(self):
         w = MockWidget()
@@ -213,3 +456,179 @@ class TestMemorizeValue:
         kw = WidgetKeywords()
         kw.memorize_value("Elem", "myVar")
         assert any(c[0] == "okw_get_value" for c in w.calls)
+
+
+class NativeWaitWidget(MockWidget):
+    """MockWidget, das auf Wert und Existenz nativ wartet."""
+
+    okw_wait_conditions = frozenset({"value", "exists"})
+
+    def __init__(self, reached=True, **overrides):
+        super().__init__(**overrides)
+        self.reached = reached
+        self.waits = []
+
+    def okw_wait_until(self, condition, expected, timeout, mode=None, args=()):
+        self.waits.append((condition, expected, mode))
+        return self.reached
+
+
+class TestNativeWait:
+    def test_verify_value_uses_native_wait(self):
+        w = NativeWaitWidget(value="other")
+        register_widget("Input", w)
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        from okw_contract_utils import MatchMode
+        WidgetKeywords().verify_value("Input", "admin")
+        assert w.waits == [("value", "admin", MatchMode.EXACT)]
+        assert not any(c[0] == "okw_get_value" for c in w.calls)
+
+    def test_native_timeout_reports_last_value(self):
+        w = NativeWaitWidget(reached=False, value="other")
+        register_widget("Input", w)
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        with pytest.raises(AssertionError):
+            WidgetKeywords().verify_value("Input", "admin")
+        assert len(w.waits) == 1
+
+    def test_verify_exist_native(self):
+        w = NativeWaitWidget(exists=False)
+        register_widget("Btn", w)
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        WidgetKeywords().verify_exist("Btn", "YES")
+        assert w.waits == [("exists", True, None)]
+
+    def test_unsupported_condition_polls(self):
+        w = NativeWaitWidget(visible=True)
+        register_widget("Btn", w)
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        WidgetKeywords().verify_visible("Btn", "YES")
+        assert w.waits == []
+
+    def test_not_implemented_falls_back(self):
+        class Partial(NativeWaitWidget):
+            def okw_wait_until(self, *a, **kw):
+                raise NotImplementedError
+        w = Partial(value="admin")
+        register_widget("Input", w)
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        WidgetKeywords().verify_value("Input", "admin")
+
+
+def _raise(error):
+    raise error
+
+
+class TestFailFast:
+    """Dauerhafte Fehler brechen sofort ab, voruebergehende werden weitergepollt."""
+
+    @pytest.fixture(autouse=True)
+    def _long_timeouts(self, _patch_robot):
+        for var in ("${OKW_TIMEOUT_VERIFY_VALUE}", "${OKW_TIMEOUT_VERIFY_CAPTION}",
+                    "${OKW_TIMEOUT_VERIFY_EXIST}", "${OKW_TIMEOUT_VERIFY_LIST}"):
+            _patch_robot._variables[var] = 30
+
+    def test_not_implemented_aborts(self):
+        from okw4robot.keywords.caption_keywords import CaptionKeywords
+        w = MockWidget()
+        reads = []
+        w.okw_get_text = lambda: reads.append(1) or _raise(NotImplementedError("okw_get_text"))
+        register_widget("Title", w)
+        with pytest.raises(NotImplementedError):
+            CaptionKeywords().verify_caption("Title", "Hello")
+        assert reads == [1]
+
+    def test_invalid_regex_aborts(self):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        w = MockWidget(value="abc")
+        register_widget("Input", w)
+        with pytest.raises(AssertionError, match="(?i)regex"):
+            WidgetKeywords().verify_value_regx("Input", "([")
+        assert len([c for c in w.calls if c[0] == "okw_get_value"]) == 1
+
+    def test_connection_error_aborts(self):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        w = MockWidget()
+        calls = []
+
+        def dead():
+            calls.append(1)
+            raise ConnectionRefusedError("session gone")
+
+        w.okw_exists = dead
+        register_widget("Btn", w)
+        with pytest.raises(ConnectionError):
+            WidgetKeywords().verify_exist("Btn", "YES")
+        assert calls == [1]
+
+    def test_adapter_hook_marks_permanent(self):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+
+        class SessionLost(Exception):
+            pass
+
+        class Adapter:
+            def okw_is_permanent_error(self, error):
+                return isinstance(error, SessionLost)
+
+        w = MockWidget()
+        w.adapter = Adapter()
+        w.okw_get_value = lambda: _raise(SessionLost("invalid session id"))
+        register_widget("Input", w)
+        with pytest.raises(SessionLost):
+            WidgetKeywords().verify_value("Input", "x")
+
+    def test_memorize_and_log_stay_tolerant(self, _patch_robot):
+        from okw4robot.keywords.caption_keywords import CaptionKeywords
+        w = MockWidget()
+        w.okw_get_text = lambda: _raise(NotImplementedError("okw_get_text"))
+        register_widget("Title", w)
+        CaptionKeywords().memorize_caption("Title", "cap")
+        CaptionKeywords().log_caption("Title")
+        assert _patch_robot._variables["${cap}"] == ""
+
+    @pytest.mark.parametrize("error", [TypeError("bad arg"), AttributeError("no attr 'txt'")])
+    def test_programming_errors_abort(self, error):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        w = MockWidget()
+        reads = []
+        w.okw_get_value = lambda: reads.append(1) or _raise(error)
+        register_widget("Input", w)
+        with pytest.raises(type(error)):
+            WidgetKeywords().verify_value("Input", "x")
+        assert reads == [1]
+
+    def test_okw_permanent_error_in_list(self):
+        from okw4robot.keywords.list_keywords import ListKeywords
+        from okw4robot.widgets.okw_widget import OkwPermanentError
+        w = MockWidget()
+        w.okw_get_list_count = lambda: _raise(NotImplementedError("list"))
+        register_widget("Items", w)
+        with pytest.raises(OkwPermanentError, match="Not supported"):
+            ListKeywords().verify_list_count("Items", 3)
+
+    def test_transient_error_keeps_polling(self, _patch_robot):
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        from okw4robot.utils.okw_helpers import last_poll_result
+        w = MockWidget()
+        answers = iter([LookupError("not yet"), LookupError("not yet"), "ready"])
+
+        def flaky():
+            a = next(answers)
+            if isinstance(a, Exception):
+                raise a
+            return a
+
+        w.okw_get_value = flaky
+        register_widget("Input", w)
+        WidgetKeywords().verify_value("Input", "ready")
+        assert last_poll_result().errors == 2
+
+    def test_transient_error_at_deadline_is_raised(self, _patch_robot):
+        _patch_robot._variables["${OKW_TIMEOUT_VERIFY_VALUE}"] = 0.05
+        from okw4robot.keywords.widget_keywords import WidgetKeywords
+        w = MockWidget()
+        w.okw_get_value = lambda: _raise(LookupError("element not found"))
+        register_widget("Input", w)
+        with pytest.raises(LookupError):
+            WidgetKeywords().verify_value("Input", "x")
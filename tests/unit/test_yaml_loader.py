@@ -0,0 +1,210 @@
+"""Tests fuer utils/yaml_loader.py: Suche und persistenter YAML-Cache."""
+
+import os
+
+import pytest
+
+from okw4robot.utils import yaml_loader
+
+YAML_TEXT = """\
+LoginApp:
+  LoginDialog:
+    Username:
+      class: a.b.TextField
+      locator: id=user
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Projektverzeichnis mit ./locators und eigenem Cache-Verzeichnis."""
+    (tmp_path / "locators").mkdir()
+    (tmp_path / "locators" / "LoginApp.yaml").write_text(YAML_TEXT, encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OKW_YAML_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("OKW_LOCATOR_PATH", raising=False)
+    yaml_loader.reset_locator_index()
+    yield tmp_path
+    yaml_loader.reset_locator_index()
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    calls = []
+    real = yaml_loader.parse_yaml
+
+    def counting(data):
+        calls.append(data)
+        return real(data)
+
+    monkeypatch.setattr(yaml_loader, "parse_yaml", counting)
+    return calls
+
+
+class TestLoadYaml:
+    def test_loads_from_project(self, project):
+        model = yaml_loader.load_yaml_with_fallback("LoginApp")
+        assert model["LoginApp"]["LoginDialog"]["Username"]["locator"] == "id=user"
+
+    def test_not_found(self, project):
+        with pytest.raises(FileNotFoundError):
+            yaml_loader.load_yaml_with_fallback("Missing")
+
+
+class TestYamlCache:
+    def test_second_load_uses_cache(self, project, parse_calls):
+        first = yaml_loader.load_yaml_with_fallback("LoginApp")
+        second = yaml_loader.load_yaml_with_fallback("LoginApp")
+        assert first == second
+        assert len(parse_calls) == 1
+        assert len(list((project / "cache").glob("*.json"))) == 1
+
+    def test_changed_file_is_reparsed(self, project, parse_calls):
+        yaml_loader.load_yaml_with_fallback("LoginApp")
+        path = project / "locators" / "LoginApp.yaml"
+        path.write_text(YAML_TEXT.replace("id=user", "id=login"), encoding="utf-8")
+        model = yaml_loader.load_yaml_with_fallback("LoginApp")
+        assert model["LoginApp"]["LoginDialog"]["Username"]["locator"] == "id=login"
+        assert len(parse_calls) == 2
+
+    def test_corrupt_cache_falls_back(self, project, parse_calls):
+        yaml_loader.load_yaml_with_fallback("LoginApp")
+        for f in (project / "cache").glob("*.json"):
+            f.write_bytes(b"garbage")
+        model = yaml_loader.load_yaml_with_fallback("LoginApp")
+        assert "LoginApp" in model
+        assert len(parse_calls) == 2
+
+    def test_cache_is_opt_in(self, project, parse_calls, monkeypatch):
+        monkeypatch.delenv("OKW_YAML_CACHE_DIR")
+        assert yaml_loader.yaml_cache_dir() is None
+        yaml_loader.load_yaml_with_fallback("LoginApp")
+        yaml_loader.load_yaml_with_fallback("LoginApp")
+        assert len(parse_calls) == 2
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+    def test_shared_cache_dir_is_ignored(self, project, parse_calls):
+        yaml_loader.load_yaml_with_fallback("LoginApp")
+        os.chmod(project / "cache", 0o777)
+        yaml_loader.load_yaml_with_fallback("LoginApp")
+        assert len(parse_calls) == 2
+
+    def test_non_json_model_is_not_cached(self, project, parse_calls):
+        (project / "locators" / "Dated.yaml").write_text("Dated:\n  1: 2024-01-01\n", encoding="utf-8")
+        first = yaml_loader.load_yaml_with_fallback("Dated")
+        second = yaml_loader.load_yaml_with_fallback("Dated")
+        assert first == second
+        assert len(parse_calls) == 2
+        assert not list((project / "cache").glob("*.json"))
+
+    def test_cache_disabled(self, project, parse_calls, monkeypatch):
+        monkeypatch.setenv("OKW_YAML_CACHE_DIR", "NONE")
+        yaml_loader.load_yaml_with_fallback("LoginApp")
+        yaml_loader.load_yaml_with_fallback("LoginApp")
+        assert len(parse_calls) == 2
+        assert not (project / "cache").exists()
+
+
+MULTI_APP = """\
+OtherApp:
+  Main:
+    Button: {class: a.b.Button, locator: id=other}
+LoginApp:
+  LoginDialog:
+    Username:
+      class: a.b.TextField
+      locator: id=über
+    Password:
+      class: a.b.TextField
+      locator: id=pass
+  Dashboard:
+    - not a map
+  Empty:
+ThirdApp:
+  Broken: [unterminated
+"""
+
+
+@pytest.fixture
+def multi(project):
+    (project / "locators" / "Multi.yaml").write_text(MULTI_APP, encoding="utf-8")
+    return project
+
+
+class TestLazySection:
+    def test_only_requested_app(self, multi):
+        section = yaml_loader.load_yaml_section("Multi", "LoginApp")
+        assert list(section) == ["LoginDialog", "Dashboard", "Empty"]
+        assert section.loaded_keys() == []
+
+    def test_window_parsed_on_access(self, multi):
+        section = yaml_loader.load_yaml_section("Multi", "LoginApp")
+        login = section["LoginDialog"]
+        assert login["Username"]["locator"] == "id=über"
+        assert section.loaded_keys() == ["LoginDialog"]
+        assert section["LoginDialog"] is login
+        assert section["Dashboard"] == ["not a map"]
+        assert section["Empty"] is None
+
+    def test_matches_full_parse(self, multi):
+        section = yaml_loader.load_yaml_section("Multi", "OtherApp")
+        full = yaml_loader.parse_yaml(MULTI_APP.split("ThirdApp")[0])["OtherApp"]
+        assert {k: section[k] for k in section} == full
+
+    def test_missing_root_key(self, project):
+        with pytest.raises(KeyError):
+            yaml_loader.load_yaml_section("LoginApp", "Unknown")
+
+    def test_aliases_fall_back_to_full_parse(self, project):
+        (project / "locators" / "Alias.yaml").write_text(
+            "base: &txt {class: a.b.TextField}\n"
+            "AliasApp:\n"
+            "  Win:\n"
+            "    Name:\n"
+            "      <<: *txt\n"
+            "      locator: id=name\n",
+            encoding="utf-8",
+        )
+        section = yaml_loader.load_yaml_section("Alias", "AliasApp")
+        assert section == {"Win": {"Name": {"class": "a.b.TextField", "locator": "id=name"}}}
+
+
+class TestLocatorIndex:
+    def test_index_contains_nested_names(self, project):
+        (project / "locators" / "web").mkdir()
+        (project / "locators" / "web" / "Shop.yaml").write_text("Shop: {}\n", encoding="utf-8")
+        index = yaml_loader.locator_index()
+        assert "LoginApp" in index
+        assert "web/Shop" in index
+
+    def test_index_built_once(self, project, monkeypatch):
+        builds = []
+        real = yaml_loader._build_locator_index
+
+        def counting():
+            builds.append(1)
+            return real()
+
+        monkeypatch.setattr(yaml_loader, "_build_locator_index", counting)
+        yaml_loader.find_yaml("LoginApp")
+        yaml_loader.find_yaml("LoginApp")
+        assert len(builds) == 1
+
+    def test_new_file_found_after_rebuild_on_miss(self, project):
+        yaml_loader.find_yaml("LoginApp")
+        (project / "locators" / "Later.yaml").write_text("Later: {}\n", encoding="utf-8")
+        assert yaml_loader.find_yaml("Later").name == "Later.yaml"
+
+    def test_search_path_env(self, project, tmp_path_factory, monkeypatch):
+        extra = tmp_path_factory.mktemp("extra")
+        (extra / "Extra.yaml").write_text("Extra: {}\n", encoding="utf-8")
+        (extra / "LoginApp.yaml").write_text("Other: {}\n", encoding="utf-8")
+        monkeypatch.setenv("OKW_LOCATOR_PATH", str(extra))
+        yaml_loader.reset_locator_index()
+        assert yaml_loader.load_yaml_with_fallback("Extra") == {"Extra": {}}
+        # Projektverzeichnis hat Vorrang
+        assert "LoginApp" in yaml_loader.load_yaml_with_fallback("LoginApp")
+
+    def test_missing_lists_sources(self, project):
+        with pytest.raises(FileNotFoundError, match="project ./locators/"):
+            yaml_loader.find_yaml("Nope")
@@ -0,0 +1,108 @@
+"""Benchmark: Ladezeit einer grossen Objekt-Map mit kaltem und warmem YAML-Cache.
+
+Erzeugt eine synthetische Objekt-Map (Standard: 10.000 Widgets) in einem
+temporaeren Verzeichnis und misst:
+
+- reines ``yaml.safe_load`` (Python-Parser, bisheriges Verhalten)
+- ``parse_yaml`` (C-Loader, falls libyaml verfuegbar)
+- ``load_yaml_with_fallback`` mit kaltem Cache (parsen + Cache schreiben)
+- ``load_yaml_with_fallback`` mit warmem Cache
+- ``load_yaml_section`` (Lazy-Modus): Index der App plus ein Fenster
+
+Aufruf:
+    python tools/bench_yaml_cache.py [--widgets 10000] [--windows 100] [--repeat 5]
+"""
+from pathlib import Path
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from okw4robot.utils import yaml_loader  # noqa: E402
+
+
+def build_object_map(app: str, widgets: int, windows: int) -> str:
+    per_window = max(1, widgets // windows)
+    lines = [f"{app}:"]
+    for w in range(windows):
+        lines.append(f"  Window{w}:")
+        lines.append("    __self__:")
+        lines.append("      class: okw_web_selenium.widgets.webse_window.WebSe_Window")
+        lines.append(f"      locator: {{ css: '[data-testid=\"window-{w}\"]' }}")
+        for i in range(per_window):
+            lines.append(f"    Field{i}:")
+            lines.append("      class: okw_web_selenium.widgets.webse_textfield.WebSe_TextField")
+            lines.append(f"      locator: {{ css: '#w{w}-field-{i}' }}")
+            if i % 10 == 0:
+                lines.append("      wait:")
+                lines.append("        read:")
+                lines.append("          timeout: 30")
+    return "\n".join(lines) + "\n"
+
+
+def timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--widgets", type=int, default=10000)
+    parser.add_argument("--windows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    work = Path(tempfile.mkdtemp(prefix="okw_bench_"))
+    cwd = os.getcwd()
+    try:
+        (work / "locators").mkdir()
+        src = work / "locators" / "BenchApp.yaml"
+        src.write_text(build_object_map("BenchApp", args.widgets, args.windows), encoding="utf-8")
+        cache_dir = work / "cache"
+        os.environ["OKW_YAML_CACHE_DIR"] = str(cache_dir)
+        os.chdir(work)
+
+        def cold():
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            yaml_loader.load_yaml_with_fallback("BenchApp")
+
+        def warm():
+            yaml_loader.load_yaml_with_fallback("BenchApp")
+
+        text = src.read_text(encoding="utf-8")
+        results = [
+            ("yaml.safe_load (Python)", timed(lambda: yaml.safe_load(text), args.repeat)),
+            (f"parse_yaml ({yaml_loader._SafeLoader.__name__})", timed(lambda: yaml_loader.parse_yaml(text), args.repeat)),
+            ("cache cold (parse + write)", timed(cold, args.repeat)),
+        ]
+        warm()
+        results.append(("cache warm", timed(warm, args.repeat)))
+
+        def lazy_one_window():
+            section = yaml_loader.load_yaml_section("BenchApp", "BenchApp")
+            section["Window0"]
+
+        results.append(("lazy: index + 1 window", timed(lazy_one_window, args.repeat)))
+
+        size_kb = src.stat().st_size / 1024
+        print(f"Object map: {args.widgets} widgets, {args.windows} windows, {size_kb:.0f} KiB")
+        for label, seconds in results:
+            print(f"  {label:<32} {seconds * 1000:9.1f} ms")
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()